@@ -6,11 +6,20 @@ Tests: Editable properties, drag & drop, delete confirmation, save as
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import tempfile
 
 from src.core.models.arxml_document import ARXMLDocument
 from src.core.models.autosar_elements import ApplicationSwComponentType, PortPrototype, PortType
 
+# Child collections whose contents are deleted along with their owner
+_CHILD_ATTRS = ('ports', 'component_types', 'data_elements')
+
+# Category root keys that accept dropped elements
+_CATEGORIES = frozenset({"sw_component_types", "compositions", "port_interfaces", "service_interfaces"})
+
+# Ending of the delete warning for a component with ports
+_DELETE_MSG_SUFFIX = "port(s) that will also be deleted."
+
 def test_editable_properties():
     """Test that properties can be edited"""
     print("🧪 Testing Editable Properties...")
@@ -53,11 +62,13 @@ def test_drag_drop_logic():
     doc.add_sw_component_type(comp2)
     
     # Test move logic (simulate what would happen in drag & drop)
+    COMP_T = ApplicationSwComponentType
+    
     def can_move_element(element, target_data):
         """Simulate the can_move_element logic"""
-        if target_data in ["sw_component_types", "compositions", "port_interfaces", "service_interfaces"]:
+        if isinstance(target_data, str) and target_data in _CATEGORIES:
             return True
-        if isinstance(element, type(comp1)) and isinstance(target_data, type(comp1)):
+        if isinstance(element, COMP_T) and isinstance(target_data, COMP_T):
             return True
         return False
     
@@ -88,13 +99,7 @@ def test_delete_confirmation_logic():
     # Test children detection logic
     def has_children(element):
         """Simulate the has_children logic"""
-        if hasattr(element, 'ports') and element.ports:
-            return True
-        if hasattr(element, 'component_types') and element.component_types:
-            return True
-        if hasattr(element, 'data_elements') and element.data_elements:
-            return True
-        return False
+        return any(getattr(element, attr, None) for attr in _CHILD_ATTRS)
     
     # Test children detection
     assert has_children(component) == True
@@ -102,7 +107,7 @@ def test_delete_confirmation_logic():
     # Test children info generation
     children_count = len(component.ports)
     children_info = f"\n\n⚠️  This component has {children_count} port(s) that will also be deleted."
-    assert "port(s) that will also be deleted" in children_info
+    assert children_info.endswith(_DELETE_MSG_SUFFIX)
     
     print("✅ Delete confirmation logic test passed")
     return True
@@ -122,9 +127,10 @@ def test_save_as_functionality():
     original_path = "test_original.arxml"
     doc._file_path = original_path
     
-    # Test save as (simulate)
-    new_path = "test_save_as.arxml"
-    success = doc.save_document(new_path)
+    # Test save as into a scratch directory, so no file is left in the working directory
+    with tempfile.TemporaryDirectory() as tmp:
+        new_path = os.path.join(tmp, "test_save_as.arxml")
+        success = doc.save_document(new_path)
     
     # Check that file path was updated
     assert doc._file_path == new_path
@@ -17,10 +17,20 @@ Tests cover:
 
 import sys
 import os
+import re
+import mmap
+from collections import Counter
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.core.application import ARXMLEditorApp
 
+_SHORT_NAME_RE = re.compile(rb'<(?:\w+:)?SHORT-NAME>([^<]*)</(?:\w+:)?SHORT-NAME>')
+
+def _saved_short_names(path):
+    """Count the SHORT-NAME values in a saved file, scanned through a read-only mmap"""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return Counter(m.group(1).decode('utf-8') for m in _SHORT_NAME_RE.finditer(mm))
+
 def test_main_ecuc_short_name_editing():
     """Test editing the main ECUC element SHORT-NAME"""
     print("🧪 Testing Main ECUC SHORT-NAME Editing...")
@@ -72,27 +82,26 @@ def test_main_ecuc_short_name_editing():
     
     # Verify the change was saved
     if os.path.exists(output_file):
-        with open(output_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        names = _saved_short_names(output_file)
+        
+        if new_short_name in names:
+            print(f"✅ Modified SHORT-NAME '{new_short_name}' found in saved file")
             
-            if new_short_name in content:
-                print(f"✅ Modified SHORT-NAME '{new_short_name}' found in saved file")
-                
-                # Count occurrences
-                count = content.count(new_short_name)
-                print(f"📊 Found {count} occurrence(s)")
-                
-                # Verify original is not present
-                if original_short_name in content and original_short_name != new_short_name:
-                    print(f"⚠️  Original SHORT-NAME '{original_short_name}' still present")
-                    return False
-                else:
-                    print(f"✅ Original SHORT-NAME '{original_short_name}' properly replaced")
-                
-                return True
-            else:
-                print(f"❌ Modified SHORT-NAME '{new_short_name}' NOT found in saved file")
+            # Count occurrences
+            count = names[new_short_name]
+            print(f"📊 Found {count} occurrence(s)")
+            
+            # Verify original is not present
+            if original_short_name in names and original_short_name != new_short_name:
+                print(f"⚠️  Original SHORT-NAME '{original_short_name}' still present")
                 return False
+            else:
+                print(f"✅ Original SHORT-NAME '{original_short_name}' properly replaced")
+            
+            return True
+        else:
+            print(f"❌ Modified SHORT-NAME '{new_short_name}' NOT found in saved file")
+            return False
     else:
         print("❌ Output file was not created")
         return False
@@ -150,23 +159,22 @@ def test_container_short_name_editing():
     
     # Verify the changes were saved
     if os.path.exists(output_file):
-        with open(output_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-            all_found = True
-            for original_name, new_name in edited_containers:
-                if new_name in content:
-                    print(f"✅ Container SHORT-NAME '{new_name}' found in saved file")
-                else:
-                    print(f"❌ Container SHORT-NAME '{new_name}' NOT found in saved file")
-                    all_found = False
-                
-                # Verify original is not present
-                if original_name in content and original_name != new_name:
-                    print(f"⚠️  Original container name '{original_name}' still present")
-                    all_found = False
+        names = _saved_short_names(output_file)
+        
+        all_found = True
+        for original_name, new_name in edited_containers:
+            if new_name in names:
+                print(f"✅ Container SHORT-NAME '{new_name}' found in saved file")
+            else:
+                print(f"❌ Container SHORT-NAME '{new_name}' NOT found in saved file")
+                all_found = False
             
-            return all_found
+            # Verify original is not present
+            if original_name in names and original_name != new_name:
+                print(f"⚠️  Original container name '{original_name}' still present")
+                all_found = False
+        
+        return all_found
     else:
         print("❌ Output file was not created")
         return False
@@ -229,18 +237,17 @@ def test_parameter_short_name_editing():
     
     # Verify the changes were saved
     if os.path.exists(output_file):
-        with open(output_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-            all_found = True
-            for original_name, new_name in edited_parameters:
-                if new_name in content:
-                    print(f"✅ Parameter SHORT-NAME '{new_name}' found in saved file")
-                else:
-                    print(f"❌ Parameter SHORT-NAME '{new_name}' NOT found in saved file")
-                    all_found = False
-            
-            return all_found
+        names = _saved_short_names(output_file)
+        
+        all_found = True
+        for original_name, new_name in edited_parameters:
+            if new_name in names:
+                print(f"✅ Parameter SHORT-NAME '{new_name}' found in saved file")
+            else:
+                print(f"❌ Parameter SHORT-NAME '{new_name}' NOT found in saved file")
+                all_found = False
+        
+        return all_found
     else:
         print("❌ Output file was not created")
         return False
@@ -14,178 +14,257 @@ in the real-world scenario described by the user.
 
 import sys
 import os
+import io
+import re
+import mmap
+import tempfile
+import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.core.application import ARXMLEditorApp
+from tests._doc_cache import load_cached
+
+log = logging.getLogger(__name__)
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+# Suffix the scenario appends to the edited SHORT-NAME
+SUFFIX = "-Haytham"
+
+# Saved scenario file, unique per process so parallel test runs do not collide
+OUTPUT_FILE = os.path.join(tempfile.gettempdir(), f"user_scenario_validation_{os.getpid()}.arxml")
+
+# Fallback when lxml is unavailable; [^<]* keeps the match inside a single element
+_SN_RE = re.compile(rb'<(?:\w+:)?SHORT-NAME>([^<]*Haytham[^<]*)</(?:\w+:)?SHORT-NAME>')
+
+def _read_output(output_file):
+    """Read the saved scenario file once so the verification steps can share it"""
+    with open(output_file, 'rb') as f:
+        return f.read()
+
+def _haytham_short_names(path, data=None):
+    """Yield the text of every SHORT-NAME element that contains the test suffix"""
+    if etree is None:
+        if data is not None:
+            for match in _SN_RE.finditer(data):
+                yield match.group(1).decode('utf-8')
+            return
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for match in _SN_RE.finditer(mm):
+                yield match.group(1).decode('utf-8')
+        return
+    
+    short_name_tags = ('SHORT-NAME', '{http://autosar.org/schema/r4.0}SHORT-NAME')
+    source = io.BytesIO(data) if data is not None else path
+    for _, elem in etree.iterparse(source, events=('end',), tag=short_name_tags):
+        text = elem.text
+        if text and 'Haytham' in text:
+            yield text
+        elem.clear(keep_tail=True)
+        # Drop already processed siblings so memory stays bounded by the depth
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+def _count_newlines(buf, start, end, chunk=1 << 20):
+    """Count newlines in buf[start:end]; mmap has no count(), so slice in bounded chunks"""
+    return sum(buf[i:min(i + chunk, end)].count(b'\n') for i in range(start, end, chunk))
+
+def _line_context(buf, offset, line_num, before=2, after=1):
+    """Return (line number, text) pairs around the line holding offset"""
+    start = buf.rfind(b'\n', 0, offset) + 1
+    first = line_num
+    while first > line_num - before and start > 0:
+        start = buf.rfind(b'\n', 0, start - 1) + 1
+        first -= 1
+    end = buf.find(b'\n', offset)
+    for _ in range(after):
+        if end < 0:
+            break
+        end = buf.find(b'\n', end + 1)
+    if end < 0:
+        end = len(buf)
+    lines = buf[start:end].decode('utf-8').split('\n')
+    return list(enumerate(lines, first))
 
 def test_user_scenario_exact():
     """Test the exact user scenario: edit SHORT-NAME, save, search"""
-    print("🧪 Testing Exact User Scenario: Edit SHORT-NAME, Save, Search")
-    print("=" * 70)
+    log.debug("🧪 Testing Exact User Scenario: Edit SHORT-NAME, Save, Search")
+    log.debug("=" * 70)
     
     # Step 1: Load ECUC file
-    print("📁 Step 1: Loading ECUC file...")
+    log.debug("📁 Step 1: Loading ECUC file...")
     app = ARXMLEditorApp()
     ecuc_file = "../Backup/ECUC/FCA_mPAD_Safety_EcuC_EcuC_ecuc.arxml"
     
     if not os.path.exists(ecuc_file):
-        print(f"❌ ECUC file not found: {ecuc_file}")
+        log.error("❌ ECUC file not found: %s", ecuc_file)
         return False
     
-    success = app.load_document(ecuc_file)
+    success = load_cached(app, ecuc_file)
     if not success:
-        print("❌ Failed to load ECUC file")
+        log.error("❌ Failed to load ECUC file")
         return False
     
-    print("✅ ECUC file loaded successfully")
+    log.debug("✅ ECUC file loaded successfully")
     
     # Step 2: Edit a SHORT-NAME element (exactly as user described)
-    print("\n✏️  Step 2: Editing SHORT-NAME element...")
+    log.debug("\n✏️  Step 2: Editing SHORT-NAME element...")
     doc = app.current_document
     
     if len(doc.ecuc_elements) == 0:
-        print("❌ No ECUC elements found")
+        log.error("❌ No ECUC elements found")
         return False
     
-    # Get the first ECUC element
-    ecuc_element = doc.ecuc_elements[0]
-    original_short_name = ecuc_element.get('short_name', '')
-    print(f"   Original SHORT-NAME: '{original_short_name}'")
+    # Edit through the flat name table; index 0 is the first ECUC element
+    names, owners = doc.short_name_slots()
+    original_short_name = names[0]
+    log.debug("   Original SHORT-NAME: '%s'", original_short_name)
     
     # Add "-Haytham" to the short name (exactly as user described)
-    new_short_name = original_short_name + "-Haytham"
-    ecuc_element['short_name'] = new_short_name
-    print(f"   Modified SHORT-NAME: '{new_short_name}'")
+    new_short_name = f"{original_short_name}{SUFFIX}"
+    names[0] = new_short_name
+    doc.write_short_names(names, owners)
+    log.debug("   Modified SHORT-NAME: '%s'", new_short_name)
     
     # Mark document as modified
     doc.set_modified(True)
-    print(f"   Document marked as modified: {doc.modified}")
+    log.debug("   Document marked as modified: %s", doc.modified)
     
     # Step 3: Save the file
-    print("\n💾 Step 3: Saving the file...")
-    output_file = "user_scenario_validation.arxml"
+    log.debug("\n💾 Step 3: Saving the file...")
+    output_file = OUTPUT_FILE
     success = doc.save_document(output_file)
     
     if not success:
-        print("❌ Failed to save file")
+        log.error("❌ Failed to save file")
         return False
     
-    print(f"✅ File saved successfully to: {output_file}")
+    log.debug("✅ File saved successfully to: %s", output_file)
     
     # Step 4: Search for the change (exactly as user described)
-    print("\n🔍 Step 4: Searching for the change...")
+    log.debug("\n🔍 Step 4: Searching for the change...")
     if not os.path.exists(output_file):
-        print("❌ Output file not found")
+        log.error("❌ Output file not found")
         return False
     
-    with open(output_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # Locate matches by byte offset in a read-only mapping of the file; line numbers
+    # come from counting newlines between consecutive matches
+    needle = new_short_name.encode('utf-8')
+    count = 0
+    matching_lines = []
+    context = []
+    with open(output_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        line_num = 1
+        last = 0
+        pos = buf.find(needle)
+        while pos >= 0:
+            count += 1
+            line_num += _count_newlines(buf, last, pos)
+            last = pos
+            if not matching_lines:
+                context = _line_context(buf, pos, line_num)
+            if not matching_lines or matching_lines[-1] != line_num:
+                matching_lines.append(line_num)
+            pos = buf.find(needle, pos + len(needle))
+        original_found = not matching_lines and buf.find(original_short_name.encode('utf-8')) >= 0
     
     # Search for the modified short name
-    if new_short_name in content:
-        print(f"✅ Found modified SHORT-NAME '{new_short_name}' in saved file")
-        
-        # Count occurrences
-        count = content.count(new_short_name)
-        print(f"   Found {count} occurrence(s)")
-        
-        # Show line numbers
-        lines = content.split('\n')
-        matching_lines = [i+1 for i, line in enumerate(lines) if new_short_name in line]
-        print(f"   Found on lines: {matching_lines}")
+    if matching_lines:
+        log.debug("✅ Found modified SHORT-NAME '%s' in saved file", new_short_name)
+        log.debug("   Found %s occurrence(s)", count)
+        log.debug("   Found on lines: %s", matching_lines)
         
         # Show context around the first match
-        if matching_lines:
-            line_num = matching_lines[0]
-            print(f"\n   Context around line {line_num}:")
-            start = max(0, line_num - 3)
-            end = min(len(lines), line_num + 2)
-            for i in range(start, end):
-                marker = ">>> " if i == line_num - 1 else "    "
-                print(f"   {marker}{i+1:4d}: {lines[i]}")
+        line_num = matching_lines[0]
+        log.debug("\n   Context around line %s:", line_num)
+        for i, text in context:
+            marker = ">>> " if i == line_num else "    "
+            log.debug("   %s%4d: %s", marker, i, text)
         
         return True
     else:
-        print(f"❌ Modified SHORT-NAME '{new_short_name}' NOT found in saved file")
+        log.error("❌ Modified SHORT-NAME '%s' NOT found in saved file", new_short_name)
         
         # Check if original name is still there
-        if original_short_name in content:
-            print(f"   ⚠️  Original SHORT-NAME '{original_short_name}' is still present")
+        if original_found:
+            log.warning("   ⚠️  Original SHORT-NAME '%s' is still present", original_short_name)
         else:
-            print(f"   ⚠️  Neither original nor modified SHORT-NAME found")
+            log.warning("   ⚠️  Neither original nor modified SHORT-NAME found")
         
         return False
 
-def test_search_variations():
+def test_search_variations(data=None):
     """Test different search patterns that user might use"""
-    print("\n🔍 Testing Different Search Patterns...")
+    log.debug("\n🔍 Testing Different Search Patterns...")
     
-    output_file = "user_scenario_validation.arxml"
-    if not os.path.exists(output_file):
-        print("❌ Output file not found")
+    output_file = OUTPUT_FILE
+    if data is None and not os.path.exists(output_file):
+        log.error("❌ Output file not found")
         return False
     
-    with open(output_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
     search_patterns = [
-        ("-Haytham", "Exact suffix search"),
-        ("EcuC-Haytham", "Full modified name search"),
+        (SUFFIX, "Exact suffix search"),
+        (f"EcuC{SUFFIX}", "Full modified name search"),
         ("Haytham", "Partial name search"),
+    ]
+    element_patterns = [
         ("SHORT-NAME.*Haytham", "Regex pattern search"),
         ("<SHORT-NAME>.*Haytham.*</SHORT-NAME>", "XML element pattern search")
     ]
     
+    # Stream the SHORT-NAME elements once instead of searching the whole file per pattern
+    counts = dict.fromkeys((pattern for pattern, _ in search_patterns), 0)
+    element_count = 0
+    for text in _haytham_short_names(output_file, data):
+        element_count += 1
+        for pattern in counts:
+            counts[pattern] += text.count(pattern)
+    counts.update((pattern, element_count) for pattern, _ in element_patterns)
+    
     all_found = True
-    for pattern, description in search_patterns:
-        if pattern.startswith("<SHORT-NAME>") and pattern.endswith("</SHORT-NAME>"):
-            import re
-            matches = re.findall(pattern, content)
-            count = len(matches)
-        elif ".*" in pattern:
-            import re
-            matches = re.findall(pattern, content)
-            count = len(matches)
-        else:
-            count = content.count(pattern)
-        
+    for pattern, description in search_patterns + element_patterns:
+        count = counts[pattern]
         status = "✅" if count > 0 else "❌"
-        print(f"   {status} {description}: '{pattern}' - {count} matches")
+        log.debug("   %s %s: '%s' - %s matches", status, description, pattern, count)
         
         if count == 0:
             all_found = False
     
     return all_found
 
-def test_file_integrity():
+def test_file_integrity(data=None):
     """Test that the saved file is valid and complete"""
-    print("\n🔍 Testing File Integrity...")
+    log.debug("\n🔍 Testing File Integrity...")
     
-    output_file = "user_scenario_validation.arxml"
-    if not os.path.exists(output_file):
-        print("❌ Output file not found")
-        return False
+    output_file = OUTPUT_FILE
+    if data is None:
+        if not os.path.exists(output_file):
+            log.error("❌ Output file not found")
+            return False
+        data = _read_output(output_file)
     
     # Check file size
-    file_size = os.path.getsize(output_file)
-    print(f"📏 Saved file size: {file_size:,} bytes")
+    file_size = len(data)
+    log.debug("📏 Saved file size: %s bytes", format(file_size, ','))
     
     if file_size < 1000:
-        print("⚠️  File size seems too small")
+        log.warning("⚠️  File size seems too small")
         return False
     else:
-        print("✅ File size is reasonable")
+        log.debug("✅ File size is reasonable")
     
     # Check XML validity
     try:
         from lxml import etree
-        tree = etree.parse(output_file)
-        root = tree.getroot()
+        root = etree.fromstring(data)
         
         if root.tag == "{http://autosar.org/schema/r4.0}AUTOSAR" or root.tag == "AUTOSAR":
-            print("✅ XML structure is valid")
+            log.debug("✅ XML structure is valid")
         else:
-            print(f"❌ Invalid XML root element: {root.tag}")
+            log.error("❌ Invalid XML root element: %s", root.tag)
             return False
         
         # Check for required elements
@@ -196,55 +275,58 @@ def test_file_integrity():
             "SHORT-NAME"
         ]
         
+        # Serialize once rather than once per required element
+        xml_text = etree.tostring(root, encoding='unicode')
         for element in required_elements:
-            if element in etree.tostring(root, encoding='unicode'):
-                print(f"✅ Required element '{element}' found")
+            if element in xml_text:
+                log.debug("✅ Required element '%s' found", element)
             else:
-                print(f"❌ Required element '{element}' not found")
+                log.error("❌ Required element '%s' not found", element)
                 return False
         
         return True
         
     except Exception as e:
-        print(f"❌ XML validation error: {e}")
+        log.error("❌ XML validation error: %s", e)
         return False
 
-def test_no_duplication():
+def test_no_duplication(data=None):
     """Test that there's no content duplication in the saved file"""
-    print("\n🔍 Testing No Content Duplication...")
-    
-    output_file = "user_scenario_validation.arxml"
-    if not os.path.exists(output_file):
-        print("❌ Output file not found")
-        return False
+    log.debug("\n🔍 Testing No Content Duplication...")
     
-    with open(output_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+    output_file = OUTPUT_FILE
+    if data is None:
+        if not os.path.exists(output_file):
+            log.error("❌ Output file not found")
+            return False
+        data = _read_output(output_file)
     
     # Check for duplicate ECUC elements
-    ecuc_count = content.count('ECUC-MODULE-CONFIGURATION-VALUES')
-    print(f"📊 ECUC-MODULE-CONFIGURATION-VALUES count: {ecuc_count}")
+    ecuc_count = data.count(b'ECUC-MODULE-CONFIGURATION-VALUES')
+    log.debug("📊 ECUC-MODULE-CONFIGURATION-VALUES count: %s", ecuc_count)
     
     if ecuc_count >= 1:
-        print("✅ ECUC elements present")
+        log.debug("✅ ECUC elements present")
     else:
-        print(f"❌ No ECUC elements found")
+        log.error("❌ No ECUC elements found")
         return False
     
     # Check for duplicate short names
-    short_name_count = content.count('SHORT-NAME')
-    print(f"📊 SHORT-NAME elements count: {short_name_count}")
+    short_name_count = data.count(b'SHORT-NAME')
+    log.debug("📊 SHORT-NAME elements count: %s", short_name_count)
     
     if short_name_count > 0:
-        print("✅ SHORT-NAME elements present")
+        log.debug("✅ SHORT-NAME elements present")
     else:
-        print("❌ No SHORT-NAME elements found")
+        log.error("❌ No SHORT-NAME elements found")
         return False
     
     return True
 
 def main():
     """Run the user scenario validation test"""
+    logging.basicConfig(format="%(message)s")
+    log.setLevel(logging.DEBUG)
     print("🚀 Testing User Scenario Validation")
     print("=" * 70)
     print("This test validates the exact scenario reported by the user:")
@@ -254,15 +336,18 @@ def main():
     print("4. Search for the change")
     print("=" * 70)
     
-    # Run the main test
+    # Run the main test, then hand the saved output to the checks that follow
+    # so the file is read from disk once
     success1 = test_user_scenario_exact()
-    success2 = test_search_variations()
-    success3 = test_file_integrity()
-    success4 = test_no_duplication()
+    output_file = OUTPUT_FILE
+    saved = _read_output(output_file) if os.path.exists(output_file) else None
+    success2 = test_search_variations(saved)
+    success3 = test_file_integrity(saved)
+    success4 = test_no_duplication(saved)
     
     # Clean up
-    if os.path.exists("user_scenario_validation.arxml"):
-        os.remove("user_scenario_validation.arxml")
+    if os.path.exists(OUTPUT_FILE):
+        os.remove(OUTPUT_FILE)
         print("\n🧹 Cleaned up test file")
     
     print("\n" + "=" * 70)
@@ -0,0 +1,15 @@
+"""
+Pytest configuration: make the project root importable so tests can use `src.` imports,
+and run Qt headless
+"""
+
+import os
+import sys
+
+_root = os.path.dirname(os.path.abspath(__file__))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+# Tests never run the Qt event loop for a visible window, so skip the windowing
+# system handshake; an explicit QT_QPA_PLATFORM still wins
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
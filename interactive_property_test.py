@@ -125,7 +125,9 @@ Instructions:
         """Launch the ARXML editor"""
         try:
             main_script = os.path.join(os.getcwd(), "main.py")
-            subprocess.Popen([sys.executable, main_script])
+            # PropertyEditor only writes the monitor log when asked to
+            env = dict(os.environ, ARXML_PE_MONITOR="1")
+            subprocess.Popen([sys.executable, main_script], env=env)
             self.log("ARXML Editor launched")
             self.log("Now perform your property editing test in the editor")
         except Exception as e:
@@ -5,7 +5,7 @@ Manages the overall application state and coordinates between components
 
 from typing import Optional, Dict, Any
 import os
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal
 from .models.arxml_document import ARXMLDocument
 from .services.validation_service import ValidationService
 from .services.command_service import CommandService
@@ -26,11 +26,16 @@ class ARXMLEditorApp(QObject):
     document_changed = pyqtSignal()
     validation_changed = pyqtSignal()
     command_stack_changed = pyqtSignal()
+    # (file path, success) of load_document_async
+    document_loaded = pyqtSignal(str, bool)
+    # Parsed root handed from the loader thread to the UI thread
+    _parsed = pyqtSignal(str, object)
     
     def __init__(self, container: Optional[DIContainer] = None):
         super().__init__()
         self._current_document: Optional[ARXMLDocument] = None
         self._container = container
+        self._loading = False
         
         # Initialize services - either from DI container or legacy way
         if container:
@@ -58,6 +63,7 @@ class ARXMLEditorApp(QObject):
             self._document_service = None
         
         # Connect signals
+        self._parsed.connect(self._on_parsed)
         if hasattr(self._validation_service, 'validation_changed'):
             self._validation_service.validation_changed.connect(self.validation_changed)
         if hasattr(self._command_service, 'command_stack_changed'):
@@ -133,38 +139,16 @@ class ARXMLEditorApp(QObject):
             
             if self._document_service:
                 # Use application service for document loading
-                result = self._document_service.load_document(file_path)
-                if result.success:
-                    self._current_document = result.data
-                    self.document_changed.emit()
-                    print("Document loaded successfully")
-                    return True
-                else:
-                    print(f"Error loading document: {result.message}")
-                    return False
-            else:
-                # Legacy mode
-                # Check if file exists
-                if not os.path.exists(file_path):
-                    print(f"Error: File not found: {file_path}")
-                    return False
-                
-                # Parse the ARXML file with automatic schema detection
-                root = self._arxml_parser.parse_arxml_file(file_path)
-                if root is None:
-                    print("Error: Failed to parse ARXML file")
-                    return False
-                
-                # Create document from parsed content
-                self._current_document = ARXMLDocument()
-                self._current_document.load_from_element(root, self._arxml_parser)
-                
-                # Validate the document with the detected schema
-                self._validation_service.validate_document(self._current_document)
-                
-                self.document_changed.emit()
-                print("Document loaded successfully")
-                return True
+                return self._adopt_loaded(self._document_service.load_document(file_path))
+            
+            # Legacy mode
+            # Check if file exists
+            if not os.path.exists(file_path):
+                print(f"Error: File not found: {file_path}")
+                return False
+            
+            # Parse the ARXML file with automatic schema detection
+            return self._load_parsed(file_path, self._arxml_parser.parse_arxml_file(file_path))
         except FileNotFoundError:
             print(f"Error: File not found: {file_path}")
             return False
@@ -177,6 +161,89 @@ class ARXMLEditorApp(QObject):
             traceback.print_exc()
             return False
     
+    def load_document_async(self, file_path: str) -> bool:
+        """Parse file_path on a worker thread and load it once parsed.
+
+        document_loaded(file_path, success) is emitted on the UI thread when done.
+        Returns False without starting anything while another load is running.
+        """
+        if self._loading:
+            return False
+        self._loading = True
+        print(f"Loading document: {file_path}")
+        QThreadPool.globalInstance().start(lambda: self._parse_in_background(file_path))
+        return True
+    
+    def _parse_in_background(self, file_path: str):
+        """Worker thread: only the parse runs here. Documents and repositories are
+        QObjects and are built on the UI thread once the parsed root arrives."""
+        root = None
+        try:
+            if os.path.exists(file_path):
+                # A parser of the worker's own, created and freed on this thread and
+                # without a schema service: it only reads and checks the file, so the
+                # shared parser, its namespace caches and the schema service stay untouched
+                root = ARXMLParser().parse_arxml_file(file_path)
+            else:
+                print(f"Error: File not found: {file_path}")
+        except Exception as e:
+            print(f"Error loading document: {e}")
+        try:
+            # Queued to the UI thread, where this object lives
+            self._parsed.emit(file_path, root)
+        except RuntimeError:
+            # The application was destroyed while the file was being parsed
+            pass
+    
+    def _on_parsed(self, file_path: str, root):
+        """Finish an asynchronous load with the parsed root"""
+        try:
+            if root is not None:
+                # Schema detection updates shared state, so it runs here on the UI thread
+                self._arxml_parser.detect_schema(file_path)
+            success = self._load_parsed(file_path, root)
+        except Exception as e:
+            print(f"Error loading document: {e}")
+            import traceback
+            traceback.print_exc()
+            success = False
+        self._loading = False
+        self.document_loaded.emit(file_path, success)
+    
+    def _load_parsed(self, file_path: str, root) -> bool:
+        """Make the parsed root element of file_path the current document"""
+        if self._document_service:
+            return self._adopt_loaded(self._document_service.load_parsed_document(file_path, root))
+        
+        if root is None:
+            print("Error: Failed to parse ARXML file")
+            return False
+        
+        # Create document from parsed content
+        self._current_document = ARXMLDocument()
+        self._current_document.load_from_element(root, self._arxml_parser)
+        
+        # Validate the document with the detected schema
+        self._validation_service.validate_document(self._current_document)
+        
+        self.document_changed.emit()
+        print("Document loaded successfully")
+        return True
+    
+    def _adopt_loaded(self, result) -> bool:
+        """Take over the document of a document service load result"""
+        if not result.success:
+            print(f"Error loading document: {result.message}")
+            return False
+        self._current_document = result.data
+        self.document_changed.emit()
+        print("Document loaded successfully")
+        return True
+    
+    def read_short_name(self, file_path: str, tag: str = 'ECUC-MODULE-CONFIGURATION-VALUES') -> Optional[str]:
+        """Read the SHORT-NAME of the first tag element from a file without loading it as a document"""
+        return self._arxml_parser.read_short_name(file_path, tag)
+    
     def save_document(self, file_path: str = None) -> bool:
         """Save current document to file"""
         if not self._current_document:
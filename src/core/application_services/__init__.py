@@ -153,6 +153,11 @@ class IDocumentApplicationService(ABC):
         """Load ARXML document from file"""
         pass
     
+    @abstractmethod
+    def load_parsed_document(self, file_path: str, root) -> ApplicationServiceResult:
+        """Load ARXML document from the already parsed root element of file_path"""
+        pass
+    
     @abstractmethod
     def save_document(self, file_path: str = None) -> ApplicationServiceResult:
         """Save ARXML document to file"""
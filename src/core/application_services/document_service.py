@@ -56,6 +56,14 @@ class DocumentApplicationService(IDocumentApplicationService):
             
             # Parse the ARXML file
             root = self._arxml_parser.parse_arxml_file(file_path)
+            return self.load_parsed_document(file_path, root)
+        
+        except Exception as e:
+            return ApplicationServiceResult(False, f"Error loading document: {str(e)}")
+    
+    def load_parsed_document(self, file_path: str, root) -> ApplicationServiceResult:
+        """Load ARXML document from the already parsed root element of file_path"""
+        try:
             if root is None:
                 return ApplicationServiceResult(False, "Failed to parse ARXML file")
             
@@ -160,9 +168,9 @@ class DocumentApplicationService(IDocumentApplicationService):
                 'file_path': self._current_document.file_path,
                 'schema_version': self._current_document.schema_version,
                 'modified': self._current_document.modified,
-                'sw_component_types': len(sw_component_repo.find_all()),
-                'port_interfaces': len(port_interface_repo.find_all()),
-                'compositions': len(composition_repo.find_all()),
+                'sw_component_types': sw_component_repo.count(),
+                'port_interfaces': port_interface_repo.count(),
+                'compositions': composition_repo.count(),
                 'total_elements': 0
             }
             
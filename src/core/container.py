@@ -3,7 +3,8 @@ Dependency Injection Container
 Manages service registration and resolution with constructor injection
 """
 
-from typing import Dict, Type, TypeVar, Callable, Any, get_type_hints
+from typing import Dict, Type, TypeVar, Callable, Any, Tuple, get_type_hints
+from functools import lru_cache
 import inspect
 from .interfaces import *
 from .repositories import IRepositoryFactory
@@ -25,6 +26,37 @@ from .domain_events.handlers import (
 
 T = TypeVar('T')
 
+def _constructor_parameters(implementation: Callable) -> Tuple[Tuple[str, inspect.Parameter, Any], ...]:
+    """(name, parameter, resolved type) for each constructor argument.
+    
+    Only classes are cached: factory functions are per-container closures, and a
+    process-wide cache would keep every container and its singletons alive.
+    """
+    if isinstance(implementation, type):
+        return _class_constructor_parameters(implementation)
+    return _read_constructor_parameters(implementation)
+
+@lru_cache(maxsize=None)
+def _class_constructor_parameters(implementation: type) -> Tuple[Tuple[str, inspect.Parameter, Any], ...]:
+    """_read_constructor_parameters, computed once per class"""
+    return _read_constructor_parameters(implementation)
+
+def _read_constructor_parameters(implementation: Callable) -> Tuple[Tuple[str, inspect.Parameter, Any], ...]:
+    """Inspect the constructor signature and type hints of implementation"""
+    sig = inspect.signature(implementation.__init__)
+    
+    # Try to get type hints for better parameter resolution
+    try:
+        type_hints = get_type_hints(implementation.__init__)
+    except (NameError, AttributeError):
+        type_hints = {}
+    
+    return tuple(
+        (param_name, param, type_hints.get(param_name, param.annotation))
+        for param_name, param in sig.parameters.items()
+        if param_name != 'self'
+    )
+
 class DIContainer:
     """Dependency injection container with constructor injection support"""
     
@@ -80,24 +112,11 @@ class DIContainer:
     def _create_instance(self, implementation: Type[T]) -> T:
         """Create instance with constructor injection"""
         try:
-            # Get constructor signature
-            sig = inspect.signature(implementation.__init__)
+            # Signature and type hints are cached per implementation
             params = {}
             
-            # Try to get type hints for better parameter resolution
-            try:
-                type_hints = get_type_hints(implementation.__init__)
-            except (NameError, AttributeError):
-                type_hints = {}
-            
             # Resolve dependencies
-            for param_name, param in sig.parameters.items():
-                if param_name == 'self':
-                    continue
-                
-                # Try type hint first
-                param_type = type_hints.get(param_name, param.annotation)
-                
+            for param_name, param, param_type in _constructor_parameters(implementation):
                 if param_type != inspect.Parameter.empty and param_type != Any:
                     # Try to resolve dependency
                     try:
@@ -4,7 +4,7 @@ Handles event publishing, subscription, and routing
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Callable, Type, Any, Optional
+from typing import Dict, List, Callable, Type, Any, Optional, Tuple, Iterable
 from collections import defaultdict
 import threading
 import logging
@@ -35,17 +35,35 @@ class IEventBus(ABC):
         """Publish an event asynchronously"""
         pass
     
+    def publish_many(self, events: Iterable[Any]) -> None:
+        """Publish several events in order"""
+        for event in events:
+            self.publish(event)
+    
+    def subscribe_batch(self, event_type: Type[Any], handler: Callable[[List[Any]], None]) -> str:
+        """Subscribe a handler that takes a list of events of event_type.
+        Buses without batch delivery call it with one event at a time."""
+        return self.subscribe(event_type, lambda event: handler([event]))
+    
     @abstractmethod
     def get_subscribers(self, event_type: Type[Any]) -> List[Callable]:
         """Get all subscribers for an event type"""
         pass
+    
+    @abstractmethod
+    def clear_subscriptions(self) -> None:
+        """Remove every subscription so the bus can be reused"""
+        pass
 
 class EventBus(IEventBus):
     """Synchronous event bus implementation"""
     
     def __init__(self):
         self._subscribers: Dict[Type[DomainEvent], List[Callable[[DomainEvent], None]]] = defaultdict(list)
-        self._subscription_ids: Dict[str, Callable[[DomainEvent], None]] = {}
+        self._subscription_ids: Dict[str, Tuple[Type[Any], Callable[[DomainEvent], None]]] = {}
+        # Handlers called once per publish_many with that call's events of their type
+        self._batch_subscribers: Dict[Type[Any], List[Callable[[List[Any]], None]]] = defaultdict(list)
+        self._batch_subscription_ids = set()
         self._lock = threading.RLock()
         self._next_subscription_id = 1
     
@@ -56,9 +74,22 @@ class EventBus(IEventBus):
             self._next_subscription_id += 1
             
             self._subscribers[event_type].append(handler)
-            self._subscription_ids[subscription_id] = handler
+            self._subscription_ids[subscription_id] = (event_type, handler)
             
-            logger.debug(f"Subscribed {subscription_id} to {event_type.__name__}")
+            logger.debug("Subscribed %s to %s", subscription_id, event_type.__name__)
+            return subscription_id
+    
+    def subscribe_batch(self, event_type: Type[Any], handler: Callable[[List[Any]], None]) -> str:
+        """Subscribe a handler that receives the events of event_type as one list per publish"""
+        with self._lock:
+            subscription_id = f"sub_{self._next_subscription_id}"
+            self._next_subscription_id += 1
+            
+            self._batch_subscribers[event_type].append(handler)
+            self._subscription_ids[subscription_id] = (event_type, handler)
+            self._batch_subscription_ids.add(subscription_id)
+            
+            logger.debug("Batch subscribed %s to %s", subscription_id, event_type.__name__)
             return subscription_id
     
     def unsubscribe(self, subscription_id: str) -> bool:
@@ -67,30 +98,65 @@ class EventBus(IEventBus):
             if subscription_id not in self._subscription_ids:
                 return False
             
-            handler = self._subscription_ids[subscription_id]
+            event_type, handler = self._subscription_ids.pop(subscription_id)
+            if subscription_id in self._batch_subscription_ids:
+                self._batch_subscription_ids.discard(subscription_id)
+                subscribers = self._batch_subscribers
+            else:
+                subscribers = self._subscribers
             
-            # Remove from all event types
-            for event_type, handlers in self._subscribers.items():
-                if handler in handlers:
-                    handlers.remove(handler)
+            # Only the event type this subscription was made for holds the handler
+            handlers = subscribers.get(event_type)
+            if handlers and handler in handlers:
+                handlers.remove(handler)
             
-            del self._subscription_ids[subscription_id]
-            logger.debug(f"Unsubscribed {subscription_id}")
+            logger.debug("Unsubscribed %s", subscription_id)
             return True
     
     def publish(self, event: Any) -> None:
         """Publish an event synchronously"""
         with self._lock:
-            event_type = type(event)
-            handlers = self._subscribers.get(event_type, [])
-            
-            logger.debug(f"Publishing {event_type.__name__} to {len(handlers)} subscribers")
-            
-            for handler in handlers:
-                try:
-                    handler(event)
-                except Exception as e:
-                    logger.error(f"Error in event handler for {event_type.__name__}: {e}")
+            self._deliver(event)
+            if self._batch_subscribers:
+                self._deliver_batch(type(event), [event])
+    
+    def _deliver(self, event: Any) -> None:
+        """Call the per-event handlers of event's type"""
+        event_type = type(event)
+        handlers = self._subscribers.get(event_type)
+        if not handlers:
+            return
+        
+        logger.debug("Publishing %s to %d subscribers", event_type.__name__, len(handlers))
+        
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception as e:
+                logger.error(f"Error in event handler for {event_type.__name__}: {e}")
+    
+    def _deliver_batch(self, event_type: Type[Any], events: List[Any]) -> None:
+        """Call the batch handlers of event_type once with all of events"""
+        for handler in self._batch_subscribers.get(event_type, ()):
+            try:
+                handler(events)
+            except Exception as e:
+                logger.error(f"Error in batch event handler for {event_type.__name__}: {e}")
+    
+    def publish_many(self, events: Iterable[Any]) -> None:
+        """Publish several events in order while holding the lock once.
+        Per-event handlers see them one by one; batch handlers get one list per type."""
+        with self._lock:
+            if not self._batch_subscribers:
+                for event in events:
+                    self._deliver(event)
+                return
+            by_type: Dict[Type[Any], List[Any]] = defaultdict(list)
+            for event in events:
+                self._deliver(event)
+                by_type[type(event)].append(event)
+            for event_type, batch in by_type.items():
+                self._deliver_batch(event_type, batch)
     
     def publish_async(self, event: Any) -> None:
         """Publish an event asynchronously (same as sync for now)"""
@@ -100,13 +166,21 @@ class EventBus(IEventBus):
         """Get all subscribers for an event type"""
         with self._lock:
             return self._subscribers.get(event_type, []).copy()
+    
+    def clear_subscriptions(self) -> None:
+        """Remove every subscription so the bus can be reused"""
+        with self._lock:
+            self._subscribers.clear()
+            self._batch_subscribers.clear()
+            self._subscription_ids.clear()
+            self._batch_subscription_ids.clear()
 
 class AsyncEventBus(IEventBus):
     """Asynchronous event bus implementation"""
     
     def __init__(self):
         self._subscribers: Dict[Type[DomainEvent], List[Callable[[DomainEvent], None]]] = defaultdict(list)
-        self._subscription_ids: Dict[str, Callable[[DomainEvent], None]] = {}
+        self._subscription_ids: Dict[str, Tuple[Type[Any], Callable[[DomainEvent], None]]] = {}
         self._lock = threading.RLock()
         self._next_subscription_id = 1
         self._event_queue: List[DomainEvent] = []
@@ -140,9 +214,11 @@ class AsyncEventBus(IEventBus):
         """Process a single event"""
         with self._lock:
             event_type = type(event)
-            handlers = self._subscribers.get(event_type, [])
+            handlers = self._subscribers.get(event_type)
+            if not handlers:
+                return
             
-            logger.debug(f"Processing {event_type.__name__} with {len(handlers)} subscribers")
+            logger.debug("Processing %s with %d subscribers", event_type.__name__, len(handlers))
             
             for handler in handlers:
                 try:
@@ -157,9 +233,9 @@ class AsyncEventBus(IEventBus):
             self._next_subscription_id += 1
             
             self._subscribers[event_type].append(handler)
-            self._subscription_ids[subscription_id] = handler
+            self._subscription_ids[subscription_id] = (event_type, handler)
             
-            logger.debug(f"Async subscribed {subscription_id} to {event_type.__name__}")
+            logger.debug("Async subscribed %s to %s", subscription_id, event_type.__name__)
             return subscription_id
     
     def unsubscribe(self, subscription_id: str) -> bool:
@@ -168,22 +244,26 @@ class AsyncEventBus(IEventBus):
             if subscription_id not in self._subscription_ids:
                 return False
             
-            handler = self._subscription_ids[subscription_id]
+            event_type, handler = self._subscription_ids.pop(subscription_id)
             
-            # Remove from all event types
-            for event_type, handlers in self._subscribers.items():
-                if handler in handlers:
-                    handlers.remove(handler)
+            # Only the event type this subscription was made for holds the handler
+            handlers = self._subscribers.get(event_type)
+            if handlers and handler in handlers:
+                handlers.remove(handler)
             
-            del self._subscription_ids[subscription_id]
-            logger.debug(f"Async unsubscribed {subscription_id}")
+            logger.debug("Async unsubscribed %s", subscription_id)
             return True
     
     def publish(self, event: Any) -> None:
         """Publish an event (adds to queue for async processing)"""
         with self._queue_lock:
             self._event_queue.append(event)
-            logger.debug(f"Queued {type(event).__name__} for async processing")
+            logger.debug("Queued %s for async processing", type(event).__name__)
+    
+    def publish_many(self, events: Iterable[Any]) -> None:
+        """Queue several events for async processing under one lock"""
+        with self._queue_lock:
+            self._event_queue.extend(events)
     
     def publish_async(self, event: Any) -> None:
         """Publish an event asynchronously"""
@@ -194,6 +274,12 @@ class AsyncEventBus(IEventBus):
         with self._lock:
             return self._subscribers.get(event_type, []).copy()
     
+    def clear_subscriptions(self) -> None:
+        """Remove every subscription so the bus can be reused"""
+        with self._lock:
+            self._subscribers.clear()
+            self._subscription_ids.clear()
+    
     def shutdown(self):
         """Shutdown the async event bus"""
         self._stop_event.set()
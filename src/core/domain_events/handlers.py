@@ -30,7 +30,11 @@ class IEventHandler(ABC):
     
     @abstractmethod
     def can_handle(self, event: DomainEvent) -> bool:
-        """Check if this handler can handle the event"""
+        """Check if this handler can handle the event
+        
+        The answer must depend only on the event's type; EventHandlerRegistry
+        caches it per type.
+        """
         pass
 
 class BaseEventHandler(IEventHandler):
@@ -287,23 +291,32 @@ class EventHandlerRegistry:
     
     def __init__(self):
         self.handlers: List[IEventHandler] = []
+        # Event type -> handlers accepting it, filled on first lookup per type
+        self._handlers_by_type: Dict[type, List[IEventHandler]] = {}
     
     def register_handler(self, handler: IEventHandler) -> None:
         """Register an event handler"""
         self.handlers.append(handler)
+        self._handlers_by_type.clear()
         logger.info(f"Registered event handler: {handler.name}")
     
     def unregister_handler(self, handler: IEventHandler) -> bool:
         """Unregister an event handler"""
         if handler in self.handlers:
             self.handlers.remove(handler)
+            self._handlers_by_type.clear()
             logger.info(f"Unregistered event handler: {handler.name}")
             return True
         return False
     
     def get_handlers_for_event(self, event: DomainEvent) -> List[IEventHandler]:
         """Get handlers that can handle a specific event"""
-        return [handler for handler in self.handlers if handler.can_handle(event)]
+        event_type = type(event)
+        handlers = self._handlers_by_type.get(event_type)
+        if handlers is None:
+            handlers = [handler for handler in self.handlers if handler.can_handle(event)]
+            self._handlers_by_type[event_type] = handlers
+        return handlers.copy()
     
     def get_all_handlers(self) -> List[IEventHandler]:
         """Get all registered handlers"""
@@ -89,6 +89,14 @@ class IARXMLParser(Protocol):
         """Parse ARXML file and return root element"""
         ...
     
+    def read_short_name(self, file_path: str, tag: str = 'ECUC-MODULE-CONFIGURATION-VALUES') -> Optional[str]:
+        """Return the SHORT-NAME of the first tag element in an ARXML file"""
+        ...
+    
+    def detect_schema(self, file_path: str) -> None:
+        """Detect the schema version of an ARXML file and use its namespace from now on"""
+        ...
+    
     def parse_sw_component_types(self, root: Any) -> List[Any]:
         """Parse software component types from XML"""
         ...
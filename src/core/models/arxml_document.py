@@ -4,18 +4,34 @@ Represents the complete ARXML document with all AUTOSAR elements
 """
 
 import os
-from typing import List, Optional, Dict, Any
+import pickle
+from contextlib import contextmanager
+from typing import List, Optional, Dict, Any, Tuple
 import xml.etree.ElementTree as std_etree
 from src.core.services.xml_compat import etree
 from PyQt6.QtCore import QObject, pyqtSignal
 from .autosar_elements import (
     SwComponentType, PortPrototype, Composition, 
     ApplicationSwComponentType, AtomicSwComponentType,
-    PortInterface, DataElement, ServiceInterface
+    PortInterface, DataElement, ServiceInterface,
+    SwComponentTypeCategory, PortType
 )
 from ..services.arxml_parser import ARXMLParser
 from ..repositories import IRepositoryFactory
 
+# Fixed wrapper written around the saved elements
+_SAVE_PROLOG = (
+    b'<?xml version="1.0" encoding="utf-8"?>\n'
+    b'<AUTOSAR xmlns="http://autosar.org/schema/r4.0" '
+    b'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+    b'xsi:schemaLocation="http://autosar.org/schema/r4.0 AUTOSAR_4-7-0.xsd">'
+    b'<AR-PACKAGES><AR-PACKAGE><SHORT-NAME>AUTOSAR_Package</SHORT-NAME><ELEMENTS>'
+)
+_SAVE_EPILOG = b'</ELEMENTS></AR-PACKAGE></AR-PACKAGES></AUTOSAR>'
+# Serialization hands the file many small chunks; collect them into large writes
+_SAVE_BUFFER_SIZE = 1 << 20
+
+
 class ARXMLDocument(QObject):
     """Main ARXML document model with repository support"""
     
@@ -31,6 +47,8 @@ class ARXMLDocument(QObject):
         self._root_element: Optional[etree.Element] = None
         self._parser = ARXMLParser()
         self._modified: bool = False
+        # Signals queued while inside batch_modifications(), None otherwise
+        self._pending_signals: Optional[List[Tuple[str, Any]]] = None
         
         # Repository factory for data access
         self._repository_factory = repository_factory
@@ -68,7 +86,46 @@ class ARXMLDocument(QObject):
     
     def set_modified(self, modified: bool):
         """Set modified status"""
-        self._modified = modified
+        if self._modified != modified:
+            self._modified = modified
+    
+    @contextmanager
+    def batch_modifications(self):
+        """Defer dirty-marking and element signals until the block exits.
+        
+        Queued signals are emitted in order on exit; repeated element_modified
+        signals for the same element are emitted once. Nested blocks join the
+        outermost one.
+        """
+        if self._pending_signals is not None:
+            yield
+            return
+        self._pending_signals = []
+        try:
+            yield
+        finally:
+            pending, self._pending_signals = self._pending_signals, None
+            if pending:
+                self.set_modified(True)
+            modified_seen = set()
+            for signal_name, element in pending:
+                if signal_name == 'element_modified':
+                    if id(element) in modified_seen:
+                        continue
+                    modified_seen.add(id(element))
+                getattr(self, signal_name).emit(element)
+    
+    def _mark_changed(self, signal_name: str, element: Any):
+        """Mark the document modified and emit signal_name for element, or queue both in a batch"""
+        if self._pending_signals is not None:
+            self._pending_signals.append((signal_name, element))
+            return
+        self._modified = True
+        getattr(self, signal_name).emit(element)
+    
+    def notify_element_modified(self, element: Any):
+        """Report an in-place change to element (see batch_modifications)"""
+        self._mark_changed('element_modified', element)
     
     @property
     def sw_component_types(self) -> List[SwComponentType]:
@@ -146,7 +203,7 @@ class ARXMLDocument(QObject):
     def get_component_type_count(self) -> int:
         """Get total number of component types"""
         if self._repositories and 'sw_component_types' in self._repositories:
-            return len(self._repositories['sw_component_types'].find_all())
+            return self._repositories['sw_component_types'].count()
         return len(self._sw_component_types)
     
     def get_interface_count(self) -> int:
@@ -156,9 +213,9 @@ class ARXMLDocument(QObject):
         
         if self._repositories:
             if 'port_interfaces' in self._repositories:
-                port_count = len(self._repositories['port_interfaces'].find_all())
+                port_count = self._repositories['port_interfaces'].count()
             if 'service_interfaces' in self._repositories:
-                service_count = len(self._repositories['service_interfaces'].find_all())
+                service_count = self._repositories['service_interfaces'].count()
         else:
             port_count = len(self._port_interfaces)
             service_count = len(self._service_interfaces)
@@ -168,7 +225,7 @@ class ARXMLDocument(QObject):
     def get_composition_count(self) -> int:
         """Get total number of compositions"""
         if self._repositories and 'compositions' in self._repositories:
-            return len(self._repositories['compositions'].find_all())
+            return self._repositories['compositions'].count()
         return len(self._compositions)
     
     def has_component_type(self, name: str) -> bool:
@@ -187,7 +244,12 @@ class ARXMLDocument(QObject):
         """Get component types by category"""
         if self._repositories and 'sw_component_types' in self._repositories:
             return self._repositories['sw_component_types'].find_by_category(category)
-        return [comp for comp in self._sw_component_types if comp.category.value == category]
+        # Resolve the member once, then compare members by identity
+        try:
+            member = SwComponentTypeCategory(category)
+        except ValueError:
+            return []
+        return [comp for comp in self._sw_component_types if comp.category is member]
     
     def get_service_interfaces(self) -> List[PortInterface]:
         """Get all service interfaces"""
@@ -224,10 +286,14 @@ class ARXMLDocument(QObject):
                 violations.append(f"Duplicate name '{comp.short_name}' found in compositions")
             all_names.add(comp.short_name)
         
-        # Check for orphaned references
+        # Check for orphaned references against a name set built once, not a scan per port
+        if self._repositories and 'port_interfaces' in self._repositories:
+            interface_names = {iface.short_name for iface in self._repositories['port_interfaces'].find_all()}
+        else:
+            interface_names = {iface.short_name for iface in self._port_interfaces}
         for comp in self._sw_component_types:
             for port in comp.ports:
-                if port.interface_ref and not self.has_port_interface(port.interface_ref):
+                if port.interface_ref and port.interface_ref not in interface_names:
                     violations.append(f"Component '{comp.short_name}' references non-existent interface '{port.interface_ref}'")
         
         # Check for empty compositions
@@ -266,6 +332,45 @@ class ARXMLDocument(QObject):
         """Get all ECUC elements"""
         return self._ecuc_elements
     
+    def snapshot(self) -> List[dict]:
+        """Get an independent deep copy of the ECUC elements, for comparing before and after edits"""
+        # The ECUC dicts hold only strings, lists and dicts; a pickle round trip
+        # copies them about twice as fast as copy.deepcopy
+        return pickle.loads(pickle.dumps(self._ecuc_elements, protocol=pickle.HIGHEST_PROTOCOL))
+    
+    def short_name_slots(self) -> Tuple[List[str], List[dict]]:
+        """Get every ECUC short name as a flat list with the dict that owns each entry
+        
+        Names are in document order (modules, then their containers and parameters).
+        Edit the names list and pass both lists to write_short_names().
+        """
+        names: List[str] = []
+        owners: List[dict] = []
+        stack = list(reversed(self._ecuc_elements))
+        while stack:
+            element = stack.pop()
+            if 'short_name' in element:
+                names.append(element['short_name'])
+                owners.append(element)
+            # Push parameters first so containers come out first, matching the saved order
+            stack.extend(reversed(element.get('parameters') or ()))
+            stack.extend(reversed(element.get('containers') or ()))
+        return names, owners
+    
+    def write_short_names(self, names: List[str], owners: List[dict]) -> int:
+        """Write edited names from short_name_slots() back to their ECUC dicts
+        
+        Returns the number of names that changed.
+        """
+        changed = 0
+        with self.batch_modifications():
+            for name, owner in zip(names, owners):
+                if owner['short_name'] != name:
+                    owner['short_name'] = name
+                    self.notify_element_modified(owner)
+                    changed += 1
+        return changed
+    
     def _initialize_repositories(self):
         """Initialize repositories for data access"""
         if not self._repository_factory:
@@ -402,19 +507,28 @@ class ARXMLDocument(QObject):
         self._file_path = file_path
         
         try:
-            # Serialize to ARXML using parser
-            arxml_content = self._parser.serialize_to_arxml(self)
-            if not arxml_content:
+            # Build the ARXML tree using parser
+            root = self._parser.build_arxml_root(self)
+            if root is None:
                 raise Exception("Failed to serialize document")
             
-            # Write to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(arxml_content)
+            # Write the encoded bytes straight to file, no intermediate string
+            with open(file_path, 'wb') as f:
+                etree.write(root, f, encoding='UTF-8', xml_declaration=True)
         
         except Exception as e:
             raise Exception(f"Failed to save ARXML file: {e}")
     
     
+    @staticmethod
+    def _remove_from(collection: list, element) -> bool:
+        """Remove element from collection in a single scan; False if it was not there"""
+        try:
+            collection.remove(element)
+        except ValueError:
+            return False
+        return True
+    
     def add_sw_component_type(self, component_type: SwComponentType):
         """Add a software component type"""
         # Add to repository if available
@@ -423,8 +537,7 @@ class ARXMLDocument(QObject):
         
         # Add to legacy collection for backward compatibility
         self._sw_component_types.append(component_type)
-        self._modified = True
-        self.element_added.emit(component_type)
+        self._mark_changed('element_added', component_type)
     
     def remove_sw_component_type(self, component_type: SwComponentType):
         """Remove a software component type"""
@@ -433,10 +546,8 @@ class ARXMLDocument(QObject):
             self._repositories['sw_component_types'].delete(component_type)
         
         # Remove from legacy collection
-        if component_type in self._sw_component_types:
-            self._sw_component_types.remove(component_type)
-            self._modified = True
-            self.element_removed.emit(component_type)
+        if self._remove_from(self._sw_component_types, component_type):
+            self._mark_changed('element_removed', component_type)
     
     def add_composition(self, composition: Composition):
         """Add a composition"""
@@ -446,8 +557,7 @@ class ARXMLDocument(QObject):
         
         # Add to legacy collection
         self._compositions.append(composition)
-        self._modified = True
-        self.element_added.emit(composition)
+        self._mark_changed('element_added', composition)
     
     def remove_composition(self, composition: Composition):
         """Remove a composition"""
@@ -456,10 +566,8 @@ class ARXMLDocument(QObject):
             self._repositories['compositions'].delete(composition)
         
         # Remove from legacy collection
-        if composition in self._compositions:
-            self._compositions.remove(composition)
-            self._modified = True
-            self.element_removed.emit(composition)
+        if self._remove_from(self._compositions, composition):
+            self._mark_changed('element_removed', composition)
     
     def add_port_interface(self, port_interface: PortInterface):
         """Add a port interface"""
@@ -469,8 +577,7 @@ class ARXMLDocument(QObject):
         
         # Add to legacy collection
         self._port_interfaces.append(port_interface)
-        self._modified = True
-        self.element_added.emit(port_interface)
+        self._mark_changed('element_added', port_interface)
     
     def remove_port_interface(self, port_interface: PortInterface):
         """Remove a port interface"""
@@ -479,10 +586,8 @@ class ARXMLDocument(QObject):
             self._repositories['port_interfaces'].delete(port_interface)
         
         # Remove from legacy collection
-        if port_interface in self._port_interfaces:
-            self._port_interfaces.remove(port_interface)
-            self._modified = True
-            self.element_removed.emit(port_interface)
+        if self._remove_from(self._port_interfaces, port_interface):
+            self._mark_changed('element_removed', port_interface)
     
     def add_service_interface(self, service_interface: ServiceInterface):
         """Add a service interface"""
@@ -492,8 +597,7 @@ class ARXMLDocument(QObject):
         
         # Add to legacy collection
         self._service_interfaces.append(service_interface)
-        self._modified = True
-        self.element_added.emit(service_interface)
+        self._mark_changed('element_added', service_interface)
     
     def remove_service_interface(self, service_interface: ServiceInterface):
         """Remove a service interface"""
@@ -502,36 +606,33 @@ class ARXMLDocument(QObject):
             self._repositories['service_interfaces'].delete(service_interface)
         
         # Remove from legacy collection
-        if service_interface in self._service_interfaces:
-            self._service_interfaces.remove(service_interface)
-            self._modified = True
-            self.element_removed.emit(service_interface)
+        if self._remove_from(self._service_interfaces, service_interface):
+            self._mark_changed('element_removed', service_interface)
     
     def add_sw_component_type(self, component_type: SwComponentType):
         """Add a software component type"""
         self._sw_component_types.append(component_type)
-        self._modified = True
-        self.element_added.emit(component_type)
+        self._mark_changed('element_added', component_type)
     
     def remove_sw_component_type(self, component_type: SwComponentType):
         """Remove a software component type"""
-        if component_type in self._sw_component_types:
-            self._sw_component_types.remove(component_type)
-            self._modified = True
-            self.element_removed.emit(component_type)
+        if self._remove_from(self._sw_component_types, component_type):
+            self._mark_changed('element_removed', component_type)
     
     def add_composition(self, composition: Composition):
         """Add a composition"""
         self._compositions.append(composition)
-        self._modified = True
-        self.element_added.emit(composition)
+        self._mark_changed('element_added', composition)
     
     def remove_composition(self, composition: Composition):
         """Remove a composition"""
-        if composition in self._compositions:
-            self._compositions.remove(composition)
-            self._modified = True
-            self.element_removed.emit(composition)
+        if self._remove_from(self._compositions, composition):
+            self._mark_changed('element_removed', composition)
+    
+    def append_ecuc_element(self, ecuc_element: dict):
+        """Append a top-level ECUC element; the flat list needs no position lookup"""
+        self._ecuc_elements.append(ecuc_element)
+        self._mark_changed('element_added', ecuc_element)
     
     def save_document(self, file_path: Optional[str] = None) -> bool:
         """Save the document to file"""
@@ -548,26 +649,12 @@ class ARXMLDocument(QObject):
             print(f"Document has {len(self._port_interfaces)} port interfaces")
             print(f"Document has {len(self._compositions)} compositions")
 
-            # Debug: print ECUC elements identities and short names to verify model state
-            try:
-                print("ECUC elements in model:")
-                for e in self._ecuc_elements:
-                    try:
-                        print(f"  id={id(e)} short_name='{e.get('short_name')}' type='{e.get('type')}' containers={len(e.get('containers', []))}")
-                    except Exception:
-                        print(f"  id={id(e)} (unreadable content)")
-            except Exception:
-                pass
-            
-            # Generate XML from current elements
-            root = self._generate_xml()
-            print(f"Generated XML root: {root.tag}")
+            print(f"Document has {len(self._ecuc_elements)} ECUC elements")
             
-            # Write to file
-            with open(self._file_path, 'wb') as f:
-                xml_content = etree.tostring(root, pretty_print=True, encoding='utf-8', xml_declaration=True)
-                f.write(xml_content)
-                print(f"Wrote {len(xml_content)} bytes to file")
+            # Stream XML for the current elements straight to the file
+            with open(self._file_path, 'wb', buffering=_SAVE_BUFFER_SIZE) as f:
+                self._write_xml(f)
+                print(f"Wrote {f.tell()} bytes to file")
             
             self._modified = False
             print("Document saved successfully")
@@ -579,44 +666,32 @@ class ARXMLDocument(QObject):
             traceback.print_exc()
             return False
     
-    def _generate_xml(self) -> etree.Element:
-        """Generate XML from current elements"""
-        # Create root element
-        root = etree.Element("AUTOSAR", 
-                           attrib={"xmlns": "http://autosar.org/schema/r4.0"})
-        root.set("{http://www.w3.org/2001/XMLSchema-instance}schemaLocation", 
-                "http://autosar.org/schema/r4.0 AUTOSAR_4-7-0.xsd")
-        
-        # Add AR-PACKAGE
-        ar_package = etree.SubElement(root, "AR-PACKAGES")
-        ar_package_item = etree.SubElement(ar_package, "AR-PACKAGE")
-        
-        # Add short name
-        short_name = etree.SubElement(ar_package_item, "SHORT-NAME")
-        short_name.text = "AUTOSAR_Package"
-        
-        # Add elements
-        elements = etree.SubElement(ar_package_item, "ELEMENTS")
-        
+    def _write_xml(self, file) -> None:
+        """Write the document XML to a binary file, one top-level element at a time"""
+        # The AUTOSAR/AR-PACKAGE wrapper is fixed, so only the ELEMENTS children
+        # are built as trees, each dropped again once it has been written
+        file.write(_SAVE_PROLOG)
+        for elem in self._iter_xml_elements():
+            std_etree.ElementTree(elem).write(file, encoding='utf-8')
+        file.write(_SAVE_EPILOG)
+    
+    def _iter_xml_elements(self):
+        """Yield the XML element for each top-level document element, in save order"""
         # Add software component types
         for component_type in self._sw_component_types:
-            comp_elem = self._component_type_to_xml(component_type)
-            elements.append(comp_elem)
+            yield self._component_type_to_xml(component_type)
         
         # Add port interfaces
         for port_interface in self._port_interfaces:
-            port_elem = self._port_interface_to_xml(port_interface)
-            elements.append(port_elem)
+            yield self._port_interface_to_xml(port_interface)
         
         # Add compositions
         for composition in self._compositions:
-            comp_elem = self._composition_to_xml(composition)
-            elements.append(comp_elem)
+            yield self._composition_to_xml(composition)
         
         # Add ECUC elements (these are the editable ones)
         for ecuc_element in self._ecuc_elements:
-            ecuc_elem = self._ecuc_element_to_xml(ecuc_element)
-            elements.append(ecuc_elem)
+            yield self._ecuc_element_to_xml(ecuc_element)
         
         # Add original XML elements only for elements that are NOT already parsed
         # This ensures we don't duplicate content and preserve unparsed elements
@@ -627,16 +702,21 @@ class ARXMLDocument(QObject):
                 # Skip this element as it's already been processed as a parsed ECUC element
                 continue
             
-            # Create a copy of the element to avoid modifying the original
-            import copy
-            elem_copy = copy.deepcopy(xml_elem)
-            elements.append(elem_copy)
-        
-        return root
+            # Originals are only serialized, never edited, so they are written as they are
+            yield self._as_std_element(xml_elem)
+    
+    @staticmethod
+    def _as_std_element(xml_elem) -> std_etree.Element:
+        """Return xml_elem as a stdlib element, re-parsing lxml elements kept from loading"""
+        if isinstance(xml_elem, std_etree.Element):
+            return xml_elem
+        import importlib
+        lxml_etree = importlib.import_module('lxml.etree')
+        return std_etree.fromstring(lxml_etree.tostring(xml_elem))
     
     def _component_type_to_xml(self, component_type: SwComponentType) -> etree.Element:
         """Convert component type to XML element"""
-        if component_type.category.value == "APPLICATION":
+        if component_type.category is SwComponentTypeCategory.APPLICATION:
             elem = etree.Element("APPLICATION-SW-COMPONENT-TYPE")
         else:
             elem = etree.Element("ATOMIC-SW-COMPONENT-TYPE")
@@ -662,9 +742,9 @@ class ARXMLDocument(QObject):
     
     def _port_prototype_to_xml(self, port: PortPrototype) -> etree.Element:
         """Convert port prototype to XML element"""
-        if port.port_type.value == "PROVIDER":
+        if port.port_type is PortType.PROVIDER:
             elem = etree.Element("P-PORT-PROTOTYPE")
-        elif port.port_type.value == "REQUIRER":
+        elif port.port_type is PortType.REQUIRER:
             elem = etree.Element("R-PORT-PROTOTYPE")
         else:
             elem = etree.Element("PR-PORT-PROTOTYPE")
@@ -14,6 +14,12 @@ except Exception:
 if TYPE_CHECKING:
     from ..domain_events import DomainEvent, IEventBus
 
+
+def _is_autosar_name(name: str, max_length: int) -> bool:
+    """Check name against ^[a-zA-Z][a-zA-Z0-9_]*$ using str methods instead of a regex"""
+    return (0 < len(name) <= max_length and name.isascii() and name[0].isalpha()
+            and (name.isalnum() or name.replace('_', '').isalnum()))
+
 class PortType(Enum):
     """Port type enumeration"""
     PROVIDER = "P-PORT"
@@ -69,23 +75,18 @@ class BaseElement:
     
     def publish_domain_events(self) -> None:
         """Publish all pending domain events"""
+        if not self._domain_events:
+            return
         if self._event_bus:
-            for event in self._domain_events:
-                self._event_bus.publish(event)
+            self._event_bus.publish_many(self._domain_events)
         self.clear_domain_events()
     
     def _notify_changed(self) -> None:
         """Notify that the element has changed"""
-        # Publish to UI event bus for decoupled UI notifications
+        # Publish to UI event bus for decoupled UI notifications; the bus
+        # already isolates listener exceptions, so no guard is needed here
         if self._ui_event_bus:
-            self._ui_event_bus.publish("element_changed", self)
-
-        # Publish a UI-level event (decoupled) if bus available
-        if self._ui_event_bus and UIEventBus is not None:
-            try:
-                self._ui_event_bus.publish('element_changed', self)
-            except Exception:
-                pass
+            self._ui_event_bus.publish('element_changed', self)
 
         # Publish domain events via domain event bus
         self.publish_domain_events()
@@ -99,31 +100,35 @@ class BaseElement:
         violations = []
         
         # Common validation rules for all elements
-        if not self.short_name or not self.short_name.strip():
+        name = self.short_name.strip() if self.short_name else ''
+        if not name:
             violations.append("Element name cannot be empty")
-        
-        if not self._is_valid_element_name(self.short_name):
+            violations.append("Element name must follow AUTOSAR naming conventions")
+        elif not self._is_valid_element_name(name):
             violations.append("Element name must follow AUTOSAR naming conventions")
         
         return violations
     
     def _is_valid_element_name(self, name: str) -> bool:
         """Validate element name follows AUTOSAR conventions"""
-        if not name or not name.strip():
+        if not name:
             return False
         
-        import re
         # AUTOSAR names should be alphanumeric with underscores, no spaces
-        pattern = r'^[a-zA-Z][a-zA-Z0-9_]*$'
-        return bool(re.match(pattern, name.strip())) and len(name.strip()) <= 128
+        return _is_autosar_name(name.strip(), 128)
     
     def is_valid(self) -> bool:
         """Check if element is valid according to business rules"""
-        return len(self.validate_invariants()) == 0
+        return not self.validate_invariants()
     
     def get_validation_errors(self) -> List[str]:
         """Get list of validation errors"""
-        return [error for error in self.validate_invariants() if 'error' in error.lower() or 'cannot' in error.lower() or 'must' in error.lower()]
+        errors = []
+        for error in self.validate_invariants():
+            lowered = error.lower()
+            if 'error' in lowered or 'cannot' in lowered or 'must' in lowered:
+                errors.append(error)
+        return errors
     
     def get_validation_warnings(self) -> List[str]:
         """Get list of validation warnings"""
@@ -361,15 +366,11 @@ class PortInterface(BaseElement):
     
     def _is_valid_interface_name(self, name: str) -> bool:
         """Validate interface name follows AUTOSAR conventions"""
-        import re
-        pattern = r'^[a-zA-Z][a-zA-Z0-9_]*$'
-        return bool(re.match(pattern, name)) and len(name) <= 64
+        return _is_autosar_name(name, 64)
     
     def _is_valid_data_element_name(self, name: str) -> bool:
         """Validate data element name follows AUTOSAR conventions"""
-        import re
-        pattern = r'^[a-zA-Z][a-zA-Z0-9_]*$'
-        return bool(re.match(pattern, name)) and len(name) <= 64
+        return _is_autosar_name(name, 64)
     
     def can_add_data_element(self, element: 'DataElement') -> bool:
         """Check if data element can be added to this interface"""
@@ -432,14 +433,16 @@ class PortInterface(BaseElement):
         if len(self.data_elements) != len(other.data_elements):
             return False
         
+        # Index the other side once; the first element with a name wins, as before
+        other_types = {}
+        for e in other.data_elements:
+            other_types.setdefault(e.short_name, e.data_type)
+        
         # Check if all data elements match
+        missing = object()
         for elem in self.data_elements:
-            matching = [e for e in other.data_elements if e.short_name == elem.short_name]
-            if not matching:
-                return False
-            
-            match = matching[0]
-            if elem.data_type != match.data_type:
+            data_type = other_types.get(elem.short_name, missing)
+            if data_type is missing or elem.data_type != data_type:
                 return False
         
         return True
@@ -449,14 +452,16 @@ class PortInterface(BaseElement):
         if len(self.service_elements) != len(other.service_elements):
             return False
         
+        # Index the other side once; the first element with a name wins, as before
+        other_kinds = {}
+        for e in other.service_elements:
+            other_kinds.setdefault(e.short_name, e.service_kind)
+        
         # Check if all service elements match
+        missing = object()
         for elem in self.service_elements:
-            matching = [e for e in other.service_elements if e.short_name == elem.short_name]
-            if not matching:
-                return False
-            
-            match = matching[0]
-            if elem.service_kind != match.service_kind:
+            service_kind = other_kinds.get(elem.short_name, missing)
+            if service_kind is missing or elem.service_kind != service_kind:
                 return False
         
         return True
@@ -688,10 +693,8 @@ class SwComponentType(BaseElement):
     
     def _is_valid_component_name(self, name: str) -> bool:
         """Validate component name follows AUTOSAR conventions"""
-        import re
         # AUTOSAR names should be alphanumeric with underscores, no spaces
-        pattern = r'^[a-zA-Z][a-zA-Z0-9_]*$'
-        return bool(re.match(pattern, name)) and len(name) <= 128
+        return _is_autosar_name(name, 128)
     
     def can_add_port(self, port: 'PortPrototype') -> bool:
         """Check if port can be added to this component"""
@@ -710,9 +713,7 @@ class SwComponentType(BaseElement):
     
     def _is_valid_port_name(self, name: str) -> bool:
         """Validate port name follows AUTOSAR conventions"""
-        import re
-        pattern = r'^[a-zA-Z][a-zA-Z0-9_]*$'
-        return bool(re.match(pattern, name)) and len(name) <= 64
+        return _is_autosar_name(name, 64)
     
     def get_ports_by_interface_type(self, is_service: bool) -> List['PortPrototype']:
         """Get ports by interface type (service vs sender-receiver)"""
@@ -745,11 +746,7 @@ class SwComponentType(BaseElement):
     
     def get_dependencies(self) -> List[str]:
         """Get list of interface dependencies"""
-        dependencies = []
-        for port in self.ports:
-            if port.interface_ref:
-                dependencies.append(port.interface_ref)
-        return list(set(dependencies))  # Remove duplicates
+        return list({port.interface_ref for port in self.ports if port.interface_ref})
     
     def get_ports_by_type(self, port_type: PortType) -> List[PortPrototype]:
         """Get ports by type"""
@@ -861,25 +858,26 @@ class Composition(BaseElement):
                 return component
         return None
     
+    def _port_owners(self) -> Dict[int, SwComponentType]:
+        """Map id(port) to its owning component in one pass; the first owner wins"""
+        owners: Dict[int, SwComponentType] = {}
+        for component in self.component_types:
+            for port in component.ports:
+                owners.setdefault(id(port), component)
+        return owners
+    
     def _remove_connections_for_component(self, component: SwComponentType):
         """Remove all connections involving the given component"""
-        connections_to_remove = []
-        for connection in self.connections:
-            source_component = self._find_component_for_port(connection.source_port)
-            target_component = self._find_component_for_port(connection.target_port)
-            
-            if source_component == component or target_component == component:
-                connections_to_remove.append(connection)
-        
-        for connection in connections_to_remove:
-            self.connections.remove(connection)
+        involved = {id(connection) for connection in self.get_connections_for_component(component)}
+        self.connections[:] = [connection for connection in self.connections if id(connection) not in involved]
     
     def get_connections_for_component(self, component: SwComponentType) -> List['PortConnection']:
         """Get all connections involving the given component"""
+        owners = self._port_owners()
         connections = []
         for connection in self.connections:
-            source_component = self._find_component_for_port(connection.source_port)
-            target_component = self._find_component_for_port(connection.target_port)
+            source_component = owners.get(id(connection.source_port))
+            target_component = owners.get(id(connection.target_port))
             
             if source_component == component or target_component == component:
                 connections.append(connection)
@@ -918,9 +916,10 @@ class Composition(BaseElement):
             violations.append("Component names must be unique within a composition")
         
         # Check for orphaned connections
+        owners = self._port_owners()
         for connection in self.connections:
-            source_component = self._find_component_for_port(connection.source_port)
-            target_component = self._find_component_for_port(connection.target_port)
+            source_component = owners.get(id(connection.source_port))
+            target_component = owners.get(id(connection.target_port))
             
             if not source_component:
                 violations.append(f"Connection source port '{connection.source_port.short_name}' not found in composition")
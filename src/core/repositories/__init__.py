@@ -39,6 +39,11 @@ class IRepository(ABC, Generic[T]):
     def exists(self, id: str) -> bool:
         """Check if entity exists by ID"""
         pass
+    
+    @abstractmethod
+    def count(self) -> int:
+        """Number of stored entities"""
+        pass
 
 class ISwComponentTypeRepository(IRepository[SwComponentType]):
     """Software component type repository interface"""
@@ -89,6 +89,10 @@ class InMemoryRepository(IRepository[T], Generic[T]):
         """Check if entity exists by ID"""
         return id in self._entities
     
+    def count(self) -> int:
+        """Number of stored entities, without copying them into a list"""
+        return len(self._entities)
+    
     def find_by_name_pattern(self, pattern: str) -> List[T]:
         """Find entities by name pattern using regex"""
         try:
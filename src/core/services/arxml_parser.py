@@ -4,9 +4,15 @@ Handles parsing and serialization of ARXML files
 """
 
 import os
+import xml.etree.ElementTree as std_etree
 from typing import List, Optional, Dict, Any
 from src.core.services.xml_compat import etree
 from PyQt6.QtCore import QObject, pyqtSignal
+try:
+    # The extractors query the tree with XPath, which only lxml elements provide
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
 try:
     from ..interfaces import IARXMLParser, ISchemaService
 except ImportError:
@@ -36,14 +42,21 @@ class ARXMLParser(QObject):
             'xsi': 'http://www.w3.org/2001/XMLSchema-instance'
         }
         self._schema_service = schema_service
+        # './/ar:NAME' XPath -> './/{namespace}NAME' find() path, built once per namespace
+        self._find_paths: Dict[str, Optional[str]] = {}
+        # 'ar:' XPath -> compiled lxml XPath, built once per namespace; see _select()
+        self._xpaths: Dict[str, Any] = {}
+        # Equal ECUC texts share one string while a document is extracted; see _shared()
+        self._text_pool: Dict[str, str] = {}
     
     def parse_arxml_file(self, file_path: str) -> Optional[etree.Element]:
         """Parse ARXML file and return root element"""
         try:
             print(f"Parsing ARXML file: {file_path}")
             
-            # Parse XML file
-            tree = etree.parse(file_path)
+            # Parse XML file straight into the tree type the extractors need, so
+            # the document does not have to serialize and re-parse it
+            tree = (lxml_etree or etree).parse(file_path)
             root = tree.getroot()
             
             print(f"Root element: {root.tag}")
@@ -53,10 +66,7 @@ class ARXMLParser(QObject):
                 print("Root namespaces: Not available (using standard library)")
             
             # Auto-detect and set schema version if schema service is available
-            if self._schema_service:
-                self._schema_service.auto_detect_and_set_version(file_path=file_path)
-                # Update namespaces based on detected version
-                self._update_namespaces_from_detected_version()
+            self.detect_schema(file_path)
             
             # Validate namespace
             if not self._is_valid_arxml(root):
@@ -79,7 +89,7 @@ class ARXMLParser(QObject):
         """Parse ARXML content string and return root element"""
         try:
             # Parse XML content
-            root = etree.fromstring(content.encode('utf-8'))
+            root = (lxml_etree or etree).fromstring(content.encode('utf-8'))
             
             # Auto-detect and set schema version if schema service is available
             if self._schema_service:
@@ -97,6 +107,32 @@ class ARXMLParser(QObject):
             self.parse_completed.emit(False, f"Parse error: {str(e)}")
             return None
     
+    def read_short_name(self, file_path: str, tag: str = 'ECUC-MODULE-CONFIGURATION-VALUES') -> Optional[str]:
+        """Return the SHORT-NAME of the first tag element in the file, or None if there is none"""
+        try:
+            # Stream the file and stop at the wanted SHORT-NAME instead of building the tree
+            inside = False
+            with open(file_path, 'rb') as f:
+                for event, elem in (lxml_etree or std_etree).iterparse(f, events=('start', 'end')):
+                    local_name = elem.tag.rpartition('}')[2]
+                    if event == 'start':
+                        inside = inside or local_name == tag
+                    elif inside and local_name == 'SHORT-NAME':
+                        return elem.text
+            return None
+        
+        except Exception as e:
+            print(f"Error reading {tag} from {file_path}: {e}")
+            return None
+    
+    def detect_schema(self, file_path: str) -> None:
+        """Detect the schema version of file_path and switch the extractors to its namespace.
+        Without a schema service the parser keeps its current namespaces."""
+        if self._schema_service:
+            self._schema_service.auto_detect_and_set_version(file_path=file_path)
+            # Update namespaces based on detected version
+            self._update_namespaces_from_detected_version()
+    
     def _update_namespaces_from_detected_version(self):
         """Update namespaces based on detected schema version"""
         if not self._schema_service or not self._schema_service.detected_version:
@@ -106,6 +142,8 @@ class ARXMLParser(QObject):
         version_info = self._schema_service.get_version_info(self._schema_service.detected_version)
         if version_info:
             self._namespaces['ar'] = version_info.namespace
+            self._find_paths.clear()
+            self._xpaths.clear()
     
     def _is_valid_arxml(self, root: etree.Element) -> bool:
         """Check if root element is valid ARXML"""
@@ -211,7 +249,15 @@ class ARXMLParser(QObject):
     def extract_ecuc_elements(self, root: etree.Element) -> List[dict]:
         """Extract ECUC elements from ARXML"""
         ecuc_elements = []
-        
+        try:
+            self._extract_ecuc_elements_into(root, ecuc_elements)
+        finally:
+            # The pool only has to live as long as one extraction
+            self._text_pool.clear()
+        return ecuc_elements
+    
+    def _extract_ecuc_elements_into(self, root: etree.Element, ecuc_elements: List[dict]):
+        """Append the parsed ECUC elements found under root"""
         # Find all ECUC-MODULE-CONFIGURATION-VALUES elements
         ecuc_elements_xml = root.xpath('.//ar:ECUC-MODULE-CONFIGURATION-VALUES', namespaces=self._namespaces)
         for ecuc_elem in ecuc_elements_xml:
@@ -225,8 +271,11 @@ class ARXMLParser(QObject):
             ecuc_data = self._parse_generic_ecuc_element(ecuc_elem)
             if ecuc_data:
                 ecuc_elements.append(ecuc_data)
-        
-        return ecuc_elements
+    
+    def _shared(self, text: Optional[str]) -> Optional[str]:
+        """Return the pooled copy of text; definition paths, and the short names of parameters
+        and sub-containers, repeat across the containers of one module"""
+        return self._text_pool.setdefault(text, text) if text else text
     
     def _mark_element_and_descendants(self, elem, processed_set):
         """Mark element and all its descendants as processed"""
@@ -261,7 +310,7 @@ class ARXMLParser(QObject):
             # typically wrapped under a <CONTAINERS> element in many ARXML files.
             # Use the explicit path to CONTAINERS to avoid picking up deeper
             # descendant containers as separate top-level entries.
-            containers = elem.xpath('./ar:CONTAINERS/ar:ECUC-CONTAINER-VALUE', namespaces=self._namespaces)
+            containers = self._select(elem, './ar:CONTAINERS/ar:ECUC-CONTAINER-VALUE')
             for container in containers:
                 container_data = self._parse_ecuc_container_value(container)
                 if container_data:
@@ -284,8 +333,8 @@ class ARXMLParser(QObject):
             
             container_data = {
                 'type': 'ECUC-CONTAINER-VALUE',
-                'short_name': short_name,
-                'definition_ref': definition_ref,
+                'short_name': self._shared(short_name),
+                'definition_ref': self._shared(definition_ref),
                 'parameters': [],
                 'containers': [],
                 'admin_data': None
@@ -297,7 +346,7 @@ class ARXMLParser(QObject):
                 container_data['admin_data'] = self._parse_admin_data(admin_data_elem)
             
             # Extract nested ECUC-CONTAINER-VALUE elements
-            nested_containers = elem.xpath('.//ar:ECUC-CONTAINER-VALUE', namespaces=self._namespaces)
+            nested_containers = self._select(elem, './/ar:ECUC-CONTAINER-VALUE')
             for container in nested_containers:
                 # Skip self to avoid infinite recursion
                 if container != elem:
@@ -306,7 +355,7 @@ class ARXMLParser(QObject):
                         container_data['containers'].append(container_data_nested)
             
             # Extract ECUC-PARAMETER-VALUE elements
-            parameters = elem.xpath('.//ar:ECUC-PARAMETER-VALUE', namespaces=self._namespaces)
+            parameters = self._select(elem, './/ar:ECUC-PARAMETER-VALUE')
             for param in parameters:
                 param_data = self._parse_ecuc_parameter_value(param)
                 if param_data:
@@ -330,8 +379,8 @@ class ARXMLParser(QObject):
             
             param_data = {
                 'type': 'ECUC-PARAMETER-VALUE',
-                'short_name': short_name,
-                'definition_ref': definition_ref,
+                'short_name': self._shared(short_name),
+                'definition_ref': self._shared(definition_ref),
                 'value': value,
                 'admin_data': None
             }
@@ -510,21 +559,21 @@ class ARXMLParser(QObject):
         ports = []
         
         # Find P-PORT-PROTOTYPE elements
-        p_ports = elem.xpath('.//ar:P-PORT-PROTOTYPE', namespaces=self._namespaces)
+        p_ports = self._select(elem, './/ar:P-PORT-PROTOTYPE')
         for port_elem in p_ports:
             port = self._parse_port_prototype(port_elem, PortType.PROVIDER)
             if port:
                 ports.append(port)
         
         # Find R-PORT-PROTOTYPE elements
-        r_ports = elem.xpath('.//ar:R-PORT-PROTOTYPE', namespaces=self._namespaces)
+        r_ports = self._select(elem, './/ar:R-PORT-PROTOTYPE')
         for port_elem in r_ports:
             port = self._parse_port_prototype(port_elem, PortType.REQUIRER)
             if port:
                 ports.append(port)
         
         # Find PR-PORT-PROTOTYPE elements
-        pr_ports = elem.xpath('.//ar:PR-PORT-PROTOTYPE', namespaces=self._namespaces)
+        pr_ports = self._select(elem, './/ar:PR-PORT-PROTOTYPE')
         for port_elem in pr_ports:
             port = self._parse_port_prototype(port_elem, PortType.PROVIDER_REQUIRER)
             if port:
@@ -558,7 +607,7 @@ class ARXMLParser(QObject):
         data_elements = []
         
         # Find DATA-ELEMENT-PROTOTYPE elements
-        data_elem_elements = elem.xpath('.//ar:DATA-ELEMENT-PROTOTYPE', namespaces=self._namespaces)
+        data_elem_elements = self._select(elem, './/ar:DATA-ELEMENT-PROTOTYPE')
         
         for data_elem in data_elem_elements:
             data_element = self._parse_data_element(data_elem)
@@ -602,7 +651,7 @@ class ARXMLParser(QObject):
         service_elements = []
         
         # Find OPERATION elements
-        operation_elements = elem.xpath('.//ar:OPERATION', namespaces=self._namespaces)
+        operation_elements = self._select(elem, './/ar:OPERATION')
         
         for op_elem in operation_elements:
             service_element = self._parse_service_element(op_elem)
@@ -630,9 +679,36 @@ class ARXMLParser(QObject):
             print(f"Error parsing service element: {e}")
             return None
     
+    def _find_path(self, xpath: str) -> Optional[str]:
+        """Get the cached find() path for a simple './/ar:NAME' XPath, None for anything else"""
+        try:
+            return self._find_paths[xpath]
+        except KeyError:
+            pass
+        local_name = xpath[len('.//ar:'):]
+        if xpath.startswith('.//ar:') and local_name.replace('-', '').isalnum():
+            path = f".//{{{self._namespaces['ar']}}}{local_name}"
+        else:
+            path = None
+        self._find_paths[xpath] = path
+        return path
+    
+    def _select(self, elem: etree.Element, xpath: str) -> list:
+        """Evaluate a per-element 'ar:' XPath; elem.xpath() would compile the expression on every call"""
+        try:
+            compiled = self._xpaths[xpath]
+        except KeyError:
+            compiled = self._xpaths[xpath] = lxml_etree.XPath(xpath, namespaces=self._namespaces)
+        return compiled(elem)
+    
     def _get_text_content(self, elem: etree.Element, xpath: str) -> Optional[str]:
         """Get text content from element using XPath"""
         try:
+            path = self._find_path(xpath)
+            if path is not None:
+                # First descendant in document order, same as the XPath's first result
+                found = elem.find(path)
+                return found.text if found is not None else None
             result = elem.xpath(xpath, namespaces=self._namespaces)
             if result and len(result) > 0:
                 return result[0].text
@@ -642,6 +718,18 @@ class ARXMLParser(QObject):
     
     def serialize_to_arxml(self, document) -> str:
         """Serialize document to ARXML string"""
+        root = self.build_arxml_root(document)
+        if root is None:
+            return ""
+        
+        # Convert to string
+        return etree.tostring(root, 
+                            pretty_print=True, 
+                            xml_declaration=True, 
+                            encoding='UTF-8').decode('utf-8')
+    
+    def build_arxml_root(self, document) -> Optional[etree.Element]:
+        """Build the ARXML element tree for document, or None if serialization fails"""
         try:
             # Create root element with proper namespace handling
             root = etree.Element("AUTOSAR", 
@@ -681,15 +769,11 @@ class ARXMLParser(QObject):
                 if interface_elem:
                     elements.append(interface_elem)
             
-            # Convert to string
-            return etree.tostring(root, 
-                                pretty_print=True, 
-                                xml_declaration=True, 
-                                encoding='UTF-8').decode('utf-8')
+            return root
         
         except Exception as e:
             print(f"Error serializing to ARXML: {e}")
-            return ""
+            return None
     
     def _serialize_sw_component_type(self, component_type: SwComponentType) -> Optional[etree.Element]:
         """Serialize software component type to XML element"""
@@ -9,7 +9,12 @@ from typing import List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass
 from PyQt6.QtCore import QObject, pyqtSignal
 import xmlschema
+import xml.etree.ElementTree as std_etree
 from src.core.services.xml_compat import etree
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
 try:
     from ..interfaces import ISchemaService
 except ImportError:
@@ -288,9 +293,12 @@ class SchemaService(QObject):
                 print(f"Error: File not found: {file_path}")
                 return None
             
-            # Parse the XML file
-            tree = etree.parse(file_path)
-            root = tree.getroot()
+            # The version comes from the root element, so stop at its start tag
+            # instead of parsing the whole file a second time
+            with open(file_path, 'rb') as f:
+                root = next((elem for _, elem in (lxml_etree or std_etree).iterparse(f, events=('start',))), None)
+            if root is None:
+                return None
             
             return self._detect_schema_version_from_element(root)
         
@@ -330,8 +338,11 @@ class SchemaService(QObject):
     def _detect_schema_version_from_element(self, root: etree.Element) -> Optional[str]:
         """Detect schema version from XML root element"""
         try:
-            # Method 1: Check namespace URI
-            namespace_uri = root.nsmap.get(None)
+            # Method 1: Check namespace URI (stdlib elements only carry it in the tag)
+            if hasattr(root, 'nsmap'):
+                namespace_uri = root.nsmap.get(None)
+            else:
+                namespace_uri = root.tag[1:].split('}')[0] if root.tag.startswith('{') else None
             if namespace_uri in self._namespace_version_map:
                 detected_version = self._namespace_version_map[namespace_uri]
                 self._detected_version = detected_version
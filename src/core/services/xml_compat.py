@@ -80,6 +80,14 @@ class ElementTree:
             xml_str = f'<?xml version="1.0" encoding="{encoding}"?>\n'.encode(encoding) + xml_str
         return xml_str
     
+    @staticmethod
+    def write(element: ET.Element, file: Any, encoding: str = 'utf-8', xml_declaration: bool = False) -> None:
+        """Serialize element straight into a binary file object, compatible with lxml ElementTree.write"""
+        # Same output as tostring(), without building the whole document in memory first
+        if xml_declaration:
+            file.write(f'<?xml version="1.0" encoding="{encoding}"?>\n'.encode(encoding))
+        ET.ElementTree(element).write(file, encoding=encoding)
+    
     class XMLSyntaxError(Exception):
         """Compatibility exception for XML syntax errors"""
         pass
@@ -113,6 +121,11 @@ class MockETree:
         """Convert element to string, compatible with lxml.etree.tostring"""
         return ElementTree.tostring(element, pretty_print, encoding, xml_declaration)
     
+    @staticmethod
+    def write(element: ET.Element, file: Any, encoding: str = 'utf-8', xml_declaration: bool = False) -> None:
+        """Serialize element straight into a binary file object"""
+        ElementTree.write(element, file, encoding, xml_declaration)
+    
     XMLSyntaxError = ElementTree.XMLSyntaxError
 
 # Create the etree object that can be imported
@@ -17,6 +17,9 @@ from .views.diagram_view import DiagramView
 from ..core.application import ARXMLEditorApp
 from ..core.container import setup_container
 
+# Element properties shown in the tree navigator's columns
+_TREE_PROPERTIES = frozenset({'short_name', 'category', 'port_type', 'data_type'})
+
 class MainWindow(QMainWindow):
     """Main application window"""
     
@@ -251,6 +254,7 @@ class MainWindow(QMainWindow):
         self.app.document_changed.connect(self._on_document_changed)
         self.app.validation_changed.connect(self._on_validation_changed)
         self.app.command_stack_changed.connect(self._on_command_stack_changed)
+        self.app.document_loaded.connect(self._on_document_loaded)
         
         # Connect tree navigator to property editor with improved sync
         self.tree_navigator.element_selected.connect(self._on_element_selected)
@@ -329,15 +333,24 @@ class MainWindow(QMainWindow):
         )
         if file_path:
             print(f"Attempting to open: {file_path}")
-            if self.app.load_document(file_path):
-                self.status_bar.showMessage(f"Opened: {file_path}")
-                print(f"Successfully opened: {file_path}")
+            # The file is parsed off the UI thread; _on_document_loaded reports the outcome
+            if self.app.load_document_async(file_path):
+                self.status_bar.showMessage(f"Opening: {file_path}")
             else:
-                print(f"Failed to open: {file_path}")
-                QMessageBox.critical(self, "Error", f"Failed to open document:\n{file_path}\n\nCheck the console for detailed error messages.")
+                self.status_bar.showMessage("Another document is still being opened")
+    
+    def _on_document_loaded(self, file_path, success):
+        """Report the outcome of an asynchronous open"""
+        if success:
+            self.status_bar.showMessage(f"Opened: {file_path}")
+            print(f"Successfully opened: {file_path}")
+        else:
+            print(f"Failed to open: {file_path}")
+            QMessageBox.critical(self, "Error", f"Failed to open document:\n{file_path}\n\nCheck the console for detailed error messages.")
     
     def _save_document(self):
         """Save document"""
+        self.property_editor.flush_pending_changes()
         if self.app.current_document:
             if self.app.current_document.file_path:
                 print(f"Attempting to save document to: {self.app.current_document.file_path}")
@@ -358,6 +371,7 @@ class MainWindow(QMainWindow):
     
     def _save_as_document(self):
         """Save document as"""
+        self.property_editor.flush_pending_changes()
         if self.app.current_document:
             file_path, _ = QFileDialog.getSaveFileName(
                 self, "Save ARXML Document", "", "ARXML Files (*.arxml);;All Files (*)"
@@ -424,8 +438,7 @@ class MainWindow(QMainWindow):
         # Remember current selection before refresh
         current_element = self.property_editor._current_element if hasattr(self.property_editor, '_current_element') else None
         
-        # Update UI components
-        self.tree_navigator.refresh()
+        # Update UI components; the tree navigator rebuilds itself for a new document
         self.property_editor.clear()
         
         # Trigger validation for the new document
@@ -491,8 +504,11 @@ class MainWindow(QMainWindow):
     
     def _on_property_changed(self, element, property_name, new_value):
         """Handle property changes with enhanced synchronization"""
-        # Refresh tree to show updated names/properties
-        self.tree_navigator.refresh()
+        # The tree shows names and the category, port or data type; update the
+        # element's item instead of rebuilding. Items not built yet are created
+        # from the element when their parent is expanded, so they need nothing.
+        if property_name in _TREE_PROPERTIES:
+            self.tree_navigator.update_element_item(element)
         
         # Mark document as modified (ensure compatibility with current app API)
         if hasattr(self.app, 'current_document') and self.app.current_document:
@@ -531,6 +547,7 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Handle close event with save confirmation"""
+        self.property_editor.flush_pending_changes()
         if self.app.current_document and self.app.current_document.modified:
             # Document has unsaved changes, ask user what to do
             reply = QMessageBox.question(
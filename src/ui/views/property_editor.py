@@ -6,17 +6,34 @@ Property editor for selected AUTOSAR elements
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
     QTextEdit, QComboBox, QCheckBox, QSpinBox, QDoubleSpinBox,
-    QGroupBox, QFormLayout, QScrollArea, QPushButton, QMessageBox
+    QGroupBox, QFormLayout, QScrollArea, QPushButton, QMessageBox, QToolButton,
+    QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSignalBlocker
 from PyQt6.QtGui import QFont
 from ...core.models.autosar_elements import (
     SwComponentType, Composition, PortInterface, PortPrototype,
     SwComponentTypeCategory, PortType, DataType, DataElement
 )
 import os
+import logging
+from collections import defaultdict
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+# Verbose diagnostics (document identity checks); enable with ARXML_PE_DEBUG=1
+_DEBUG = os.environ.get("ARXML_PE_DEBUG") == "1"
+
+# Append property change traces to /tmp/arxml_property_monitor.log (read by live_property_monitor.py)
+_MONITOR = os.environ.get("ARXML_PE_MONITOR") == "1"
+
+# Quiet period after the last edit before property_changed listeners are notified
+_FLUSH_DELAY_MS = 150
+
+# Typing pause after which a container/parameter field is written to its ECUC dict
+_EDIT_DELAY_MS = 150
+
 class PropertyEditor(QWidget):
     """Property editor for AUTOSAR elements"""
     
@@ -29,18 +46,52 @@ class PropertyEditor(QWidget):
         self._current_element = None
         self._original_element = None  # Store reference to original element in document
         self._property_widgets = {}
+        # id(dict) -> dict for every dict reachable from the document's ECUC elements
+        self._doc_dict_index = {}
+        self._doc_index_key = None
+        self._doc_index_dirty = True
+        # (short_name, type) -> [dict, ...] in document order, for matching transient copies
+        self._doc_by_name = defaultdict(list)
+        # id(dict) -> [(parent dict/list, key or index), ...] for every reference to it
+        self._parent_of = defaultdict(list)
+        # Recycled ECUC widgets: id(dict) -> (dict, group, snapshot, ...layouts/edits).
+        # The dict is held so its id() cannot be reused while the entry exists.
+        self._container_widget_cache = {}
+        self._param_widget_cache = {}
+        # ECUC "Basic Properties" groups, refilled for each selected dict:
+        # has uuid -> (group, type label, short name edit, uuid edit or None)
+        self._ecuc_basic_pool = {}
+        # id() of pooled groups already placed in the form being built
+        self._pooled_in_use = set()
+        # id(edit widget) -> the ECUC dict it edits; entries go when the widget is destroyed
+        self._widget_to_element = {}
+        # Change notifications waiting for the next flush:
+        # (id(element), property_name) -> (element, property_name, value)
+        self._pending_changes = {}
+        self._pending_document = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self.flush_pending_changes)
+        # Line edits typed into but not yet written: id(widget) -> (widget, handler, property_name)
+        self._pending_edits = {}
+        self._edit_timer = QTimer(self)
+        self._edit_timer.setSingleShot(True)
+        self._edit_timer.setInterval(_EDIT_DELAY_MS)
+        self._edit_timer.timeout.connect(self._apply_pending_edits)
         self._setup_ui()
         self._connect_signals()
         
-        # Enable monitoring
-        self._monitoring_enabled = True
+        # Monitoring is off unless ARXML_PE_MONITOR=1
+        self._monitoring_enabled = _MONITOR
         self._monitor_log("PropertyEditor initialized")
     
-    def _monitor_log(self, message):
-        """Log property changes for live debugging"""
+    def _monitor_log(self, fmt, *args):
+        """Log property changes for live debugging; fmt % args is only built when monitoring"""
         if not self._monitoring_enabled:
             return
         try:
+            message = fmt % args if args else fmt
             timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
             log_file = "/tmp/arxml_property_monitor.log"
             with open(log_file, "a") as f:
@@ -77,8 +128,139 @@ class PropertyEditor(QWidget):
     
     def _connect_signals(self):
         """Connect signals"""
-        pass
+        if hasattr(self.app, 'document_changed'):
+            self.app.document_changed.connect(self._on_document_changed)
+    
+    def _on_document_changed(self):
+        """Drop lookups and recycled widgets that belong to the previous document"""
+        self._invalidate_doc_index()
+        self._container_widget_cache.clear()
+        self._param_widget_cache.clear()
+        self._ecuc_basic_pool.clear()
+    
+    def _invalidate_doc_index(self):
+        """Mark document lookups stale (document loaded or top-level list changed)"""
+        self._doc_index_dirty = True
+    
+    def _rebuild_doc_index_if_needed(self):
+        """Rebuild the document index if it was invalidated or the top-level list changed"""
+        doc = self.app.current_document
+        elements = doc.ecuc_elements
+        key = (id(doc), id(elements), len(elements))
+        if self._doc_index_dirty or key != self._doc_index_key:
+            self._rebuild_doc_index(elements)
+            self._doc_index_key = key
+            self._doc_index_dirty = False
+    
+    def _rebuild_doc_index(self, elements):
+        """Index every nested dict of the ECUC elements by id(), by (short_name, type)
+        and by the containers that reference it.
+
+        Uses an explicit stack that visits dicts in document (pre-)order.
+        """
+        index = {}
+        by_name = defaultdict(list)
+        parent_of = defaultdict(list)
+        stack = [(elements, i, node) for i, node in reversed(list(enumerate(elements)))]
+        while stack:
+            parent, key, node = stack.pop()
+            if isinstance(node, dict):
+                parent_of[id(node)].append((parent, key))
+                if id(node) in index:
+                    continue
+                index[id(node)] = node
+                by_name[(node.get('short_name'), node.get('type'))].append(node)
+                stack.extend((node, k, v) for k, v in reversed(list(node.items()))
+                             if isinstance(v, (dict, list)))
+            elif isinstance(node, list):
+                stack.extend((node, i, item) for i, item in reversed(list(enumerate(node))))
+        self._doc_dict_index = index
+        self._doc_by_name = by_name
+        self._parent_of = parent_of
+    
+    def _find_by_name(self, target: dict):
+        """Return document dicts sharing target's (short_name, type), in document order"""
+        tname = target.get('short_name')
+        if not tname:
+            return []
+        return self._doc_by_name.get((tname, target.get('type')), [])
+    
+    def _reindex_short_name(self, element: dict, old_name):
+        """Move element to its new (short_name, type) bucket after a rename"""
+        if id(element) not in self._doc_dict_index:
+            return
+        ttype = element.get('type')
+        bucket = self._doc_by_name.get((old_name, ttype))
+        if bucket:
+            bucket[:] = [d for d in bucket if d is not element]
+        self._doc_by_name[(element.get('short_name'), ttype)].append(element)
+    
+    def _set_dict_property(self, element: dict, property_name: str, value):
+        """Write a property on an ECUC dict, keeping the name index in sync"""
+        old_value = element.get(property_name)
+        element[property_name] = value
+        if property_name == 'short_name' and old_value != value:
+            self._reindex_short_name(element, old_value)
     
+    def _queue_change(self, element, property_name: str, new_value):
+        """Record an applied change; listeners hear about it on the next flush"""
+        self._pending_changes[(id(element), property_name)] = (element, property_name, new_value)
+        self._pending_document = getattr(self.app, 'current_document', None)
+        self._flush_timer.start()
+
+    def _defer_edit(self, widget: QLineEdit, handler, property_name: str):
+        """Write widget's text through handler once typing pauses or editing finishes"""
+        self._pending_edits[id(widget)] = (widget, handler, property_name)
+        self._edit_timer.start()
+
+    def _apply_pending_edits(self):
+        """Write every deferred line edit to the ECUC dict it is bound to"""
+        self._edit_timer.stop()
+        if not self._pending_edits:
+            return
+        pending = list(self._pending_edits.values())
+        self._pending_edits.clear()
+        for widget, handler, property_name in pending:
+            # The binding is dropped when the widget is destroyed
+            element = self._widget_to_element.get(id(widget))
+            if element is not None:
+                handler(element, property_name, widget.text())
+
+    def _commit_root_short_name(self):
+        """Apply the ECUC short name field if it was edited without finishing"""
+        edit = self._property_widgets.get("short_name")
+        if isinstance(self._current_element, dict) and isinstance(edit, QLineEdit):
+            self._on_ecuc_property_changed(self._current_element, "short_name", edit.text())
+
+    def flush_pending_changes(self):
+        """Mark the document modified once and emit property_changed once per
+        changed (element, property) with its final value."""
+        self._apply_pending_edits()
+        self._commit_root_short_name()
+        self._flush_timer.stop()
+        if not self._pending_changes:
+            return
+        pending = list(self._pending_changes.values())
+        doc = self._pending_document
+        self._pending_changes.clear()
+        self._pending_document = None
+
+        if doc:
+            doc.set_modified(True)
+        for element, property_name, new_value in pending:
+            self.property_changed.emit(element, property_name, new_value)
+
+    def _bind_widget(self, widget: QWidget, element: dict):
+        """Remember which ECUC dict an edit widget belongs to.
+
+        dicts cannot be weakly referenced, so the entry is dropped when the widget
+        is destroyed instead; the cleanup slot holds the map, not the editor.
+        """
+        key = id(widget)
+        mapping = self._widget_to_element
+        mapping[key] = element
+        widget.destroyed.connect(lambda _=None, k=key, m=mapping: m.pop(k, None))
+
     def _show_empty_state(self):
         """Show empty state when no element is selected"""
         self._clear_properties()
@@ -88,8 +270,43 @@ class PropertyEditor(QWidget):
         empty_label.setStyleSheet("color: gray; font-style: italic;")
         self.properties_layout.addWidget(empty_label)
     
+    def _pooled_line_edits(self):
+        """Line edits that outlive a form: they are refilled for the next selection"""
+        for _, _, short_name_edit, _ in self._ecuc_basic_pool.values():
+            yield short_name_edit
+        for entry in self._container_widget_cache.values():
+            yield entry[5]
+        for entry in self._param_widget_cache.values():
+            yield entry[3]
+            if entry[4] is not None:
+                yield entry[4]
+
+    def _focused_pooled_edit(self):
+        """The pooled line edit holding keyboard focus, if any"""
+        focused = QApplication.focusWidget()
+        if not isinstance(focused, QLineEdit) or not self.properties_widget.isAncestorOf(focused):
+            return None
+        return next((edit for edit in self._pooled_line_edits() if edit is focused), None)
+
     def _clear_properties(self):
         """Clear all property widgets"""
+        # A focused field reports editingFinished when its form is detached. Its
+        # value has been saved already, so keep it from re-entering the switch.
+        focused = self._focused_pooled_edit()
+        blocker = QSignalBlocker(focused) if focused is not None else None
+        try:
+            self._detach_properties()
+        finally:
+            if blocker is not None:
+                blocker.unblock()
+
+    def _detach_properties(self):
+        # Detach pooled widgets first so they survive their old parents
+        for entry in self._container_widget_cache.values():
+            entry[1].setParent(None)
+        for entry in self._param_widget_cache.values():
+            entry[1].setParent(None)
+        self._pooled_in_use.clear()
         for i in reversed(range(self.properties_layout.count())):
             child = self.properties_layout.itemAt(i).widget()
             if child:
@@ -113,7 +330,7 @@ class PropertyEditor(QWidget):
             return
         
         try:
-            print(f"[PropertyEditor] _save_current_widget_values: saving {len(self._property_widgets)} properties")
+            logger.debug("_save_current_widget_values: saving %d properties", len(self._property_widgets))
             # Save values from all property widgets
             for property_name, widget in self._property_widgets.items():
                 if hasattr(widget, 'text'):
@@ -133,14 +350,16 @@ class PropertyEditor(QWidget):
                         
                         # Store old value for comparison
                         old_value = target_element.get(property_name, '')
-                        target_element[property_name] = value
+                        self._set_dict_property(target_element, property_name, value)
                         
-                        print(f"[PropertyEditor] Saved {property_name}: '{old_value}' -> '{value}' on element id={id(target_element)} short_name='{target_element.get('short_name')}'")
+                        logger.debug("Saved %s: '%s' -> '%s' on element id=%d short_name='%s'",
+                                     property_name, old_value, value, id(target_element), target_element.get('short_name'))
                     elif hasattr(self._current_element, property_name):
                         # Object with attributes
                         old_value = getattr(self._current_element, property_name, '')
                         setattr(self._current_element, property_name, value)
-                        print(f"[PropertyEditor] Saved {property_name}: '{old_value}' -> '{value}' on object {type(self._current_element).__name__}")
+                        logger.debug("Saved %s: '%s' -> '%s' on object %s",
+                                     property_name, old_value, value, type(self._current_element).__name__)
                     
                     # Mark document as modified
                     if hasattr(self.app, 'current_document') and self.app.current_document:
@@ -216,114 +435,96 @@ class PropertyEditor(QWidget):
                                 self.app.current_document.set_modified(True)
         
         except Exception as e:
-            print(f"Error saving widget values: {e}")
+            logger.error("Error saving widget values: %s", e)
     
     def set_element(self, element):
         """Set the current element for editing"""
+        # Text still being typed belongs to the element shown so far
+        self._apply_pending_edits()
+        # Re-selecting the shown element needs neither a lookup nor an index rebuild
+        if element is not None and element is self._current_element:
+            return
+        self._invalidate_doc_index()
+        
         # Resolve the element first to ensure consistency
         resolved_element = element
+        resolved_instance = None
         if isinstance(element, dict) and hasattr(self.app, 'current_document') and self.app.current_document:
             resolved_instance = self._resolve_to_document(element)
             if resolved_instance is not None:
                 resolved_element = resolved_instance
-                print(f"[PropertyEditor] Resolved element id={id(element)} to document instance id={id(resolved_element)}")
+                logger.debug("Resolved element id=%d to document instance id=%d", id(element), id(resolved_element))
         
         # If setting the same resolved element, no need to recreate widgets
         if self._current_element is resolved_element:
-            print(f"[PropertyEditor] Same element, skipping recreation")
+            logger.debug("Same element, skipping recreation")
             return
         
         # Save current widget values before switching to ensure persistence
         if self._current_element is not None and self._property_widgets:
-            try:
-                if isinstance(self._current_element, dict):
+            if isinstance(self._current_element, dict):
+                if _DEBUG:
                     print(f"[PropertyEditor] Saving values for element id={id(self._current_element)} short_name='{self._current_element.get('short_name')}'")
-                    self._monitor_log(f"SAVE_START: element id={id(self._current_element)} short_name='{self._current_element.get('short_name')}'")
-                else:
+                self._monitor_log("SAVE_START: element id=%d short_name='%s'", id(self._current_element), self._current_element.get('short_name'))
+            else:
+                if _DEBUG:
                     print(f"[PropertyEditor] Saving values for element type={type(self._current_element).__name__}")
-                    self._monitor_log(f"SAVE_START: element type={type(self._current_element).__name__}")
-            except Exception:
-                pass
+                self._monitor_log("SAVE_START: element type=%s", type(self._current_element).__name__)
             self._save_current_widget_values()
         
         # Log the incoming element
+        if isinstance(element, dict):
+            self._monitor_log("SET_ELEMENT: id=%d short_name='%s' type='%s'", id(element), element.get('short_name'), element.get('type'))
+        else:
+            self._monitor_log("SET_ELEMENT: element type=%s", type(element).__name__)
+        
+        # Clear and rebuild the properties with updates off so the switch repaints once
+        self.properties_widget.setUpdatesEnabled(False)
         try:
-            if isinstance(element, dict):
-                self._monitor_log(f"SET_ELEMENT: id={id(element)} short_name='{element.get('short_name')}' type='{element.get('type')}'")
-            else:
-                self._monitor_log(f"SET_ELEMENT: element type={type(element).__name__}")
-        except Exception:
-            pass
+            # Clear properties and set the current element to the resolved one
+            self._clear_properties()
+            self._current_element = resolved_element
         
-        # Clear properties and set the current element to the resolved one
-        self._clear_properties()
-        self._current_element = resolved_element
+            if element is None:
+                self._show_empty_state()
+                return
+
+            # The document instance behind an ECUC dict, found above through the
+            # id index (or the name index for a transient copy)
+            self._original_element = resolved_instance
         
-        if element is None:
-            self._show_empty_state()
-            return
+            # Update title
+            element_type = type(element).__name__
+            self.title_label.setText(f"Properties - {element_type}")
+        
+            # Use the current element (which is already resolved) for widgets
+            element_for_widgets = self._current_element
 
-        # If this is an ECUC dict, try to find and store a reference to the
-        # corresponding top-level element in the current document so edits
-        # can be applied to the document model even if the editor received
-        # a copy or a nested dict.
-        self._original_element = None
-        if isinstance(element, dict) and hasattr(self.app, 'current_document') and self.app.current_document:
-            for doc_elem in self.app.current_document.ecuc_elements:
-                # If the passed element is the top-level element itself
-                if doc_elem is element:
-                    self._original_element = doc_elem
-                    break
-                # Otherwise search nested containers/parameters for identity or best-match
-                found = self._find_dict_in(doc_elem, element)
-                if found is not None:
-                    # store the top-level document element as the original
-                    self._original_element = doc_elem
-                    break
-
-        
-        # Update title
-        element_type = type(element).__name__
-        self.title_label.setText(f"Properties - {element_type}")
-        
-        # Set original element reference for ECUC elements
-        if isinstance(self._current_element, dict):
-            for doc_elem in self.app.current_document.ecuc_elements:
-                if doc_elem is self._current_element:
-                    self._original_element = doc_elem
-                    break
-                if self._find_dict_in(doc_elem, self._current_element) is not None:
-                    self._original_element = doc_elem
-                    break
-        
-        # Use the current element (which is already resolved) for widgets
-        element_for_widgets = self._current_element
-
-        # Debug: log final element being used for widgets and verify persistence
-        try:
-            if isinstance(element_for_widgets, dict):
-                print(f"[PropertyEditor] Creating widgets for element id={id(element_for_widgets)} short_name='{element_for_widgets.get('short_name')}' type='{element_for_widgets.get('type')}'")
-                self._verify_element_persistence(element_for_widgets)
-            else:
-                print(f"[PropertyEditor] Creating widgets for element id={id(element_for_widgets)} type='{type(element_for_widgets).__name__}'")
-        except Exception:
-            pass
+            # Debug: log final element being used for widgets and verify persistence
+            if _DEBUG:
+                if isinstance(element_for_widgets, dict):
+                    print(f"[PropertyEditor] Creating widgets for element id={id(element_for_widgets)} short_name='{element_for_widgets.get('short_name')}' type='{element_for_widgets.get('type')}'")
+                    self._verify_element_persistence(element_for_widgets)
+                else:
+                    print(f"[PropertyEditor] Creating widgets for element id={id(element_for_widgets)} type='{type(element_for_widgets).__name__}'")
 
-        # Create property widgets based on element type
-        if isinstance(element_for_widgets, SwComponentType):
-            self._create_sw_component_type_properties(element_for_widgets)
-        elif isinstance(element_for_widgets, Composition):
-            self._create_composition_properties(element_for_widgets)
-        elif isinstance(element_for_widgets, PortInterface):
-            self._create_port_interface_properties(element_for_widgets)
-        elif isinstance(element_for_widgets, PortPrototype):
-            self._create_port_prototype_properties(element_for_widgets)
-        elif isinstance(element_for_widgets, DataElement):
-            self._create_data_element_properties(element_for_widgets)
-        elif isinstance(element_for_widgets, dict):
-            self._create_ecuc_element_properties(element_for_widgets)
-        else:
-            self._show_empty_state()
+            # Create property widgets based on element type
+            if isinstance(element_for_widgets, SwComponentType):
+                self._create_sw_component_type_properties(element_for_widgets)
+            elif isinstance(element_for_widgets, Composition):
+                self._create_composition_properties(element_for_widgets)
+            elif isinstance(element_for_widgets, PortInterface):
+                self._create_port_interface_properties(element_for_widgets)
+            elif isinstance(element_for_widgets, PortPrototype):
+                self._create_port_prototype_properties(element_for_widgets)
+            elif isinstance(element_for_widgets, DataElement):
+                self._create_data_element_properties(element_for_widgets)
+            elif isinstance(element_for_widgets, dict):
+                self._create_ecuc_element_properties(element_for_widgets)
+            else:
+                self._show_empty_state()
+        finally:
+            self.properties_widget.setUpdatesEnabled(True)
     
     def _create_sw_component_type_properties(self, component_type: SwComponentType):
         """Create properties for software component type"""
@@ -628,7 +829,7 @@ class PropertyEditor(QWidget):
     
     def _create_ecuc_element_properties(self, ecuc_element: dict):
         """Create properties for ECUC element"""
-        try:
+        if _DEBUG:
             print(f"[PropertyEditor] Creating ECUC element widgets for id={id(ecuc_element)} short_name='{ecuc_element.get('short_name')}' type='{ecuc_element.get('type')}' containers={len(ecuc_element.get('containers', []))}")
             
             # Verify this is the document instance
@@ -636,50 +837,8 @@ class PropertyEditor(QWidget):
                 is_doc_instance = any(doc_elem is ecuc_element for doc_elem in self.app.current_document.ecuc_elements)
                 is_nested_instance = any(self._find_dict_in(doc_elem, ecuc_element) is not None for doc_elem in self.app.current_document.ecuc_elements)
                 print(f"[PropertyEditor] Element is document instance: {is_doc_instance}, is nested in document: {is_nested_instance}")
-        except Exception as e:
-            print(f"[PropertyEditor] Error in ECUC element debug: {e}")
-        # Basic properties group
-        basic_group = QGroupBox("Basic Properties")
-        basic_layout = QFormLayout(basic_group)
-        
-        # Type
-        type_label = QLabel(ecuc_element.get('type', 'Unknown'))
-        basic_layout.addRow("Type:", type_label)
-        
-        # Short name
-        short_name_value = ecuc_element.get('short_name', '')
-        self._monitor_log(f"RECREATE_WIDGET: short_name='{short_name_value}' from element id={id(ecuc_element)}")
-        print(f"[PropertyEditor] Creating short_name widget with value '{short_name_value}' for element id={id(ecuc_element)}")
-        short_name_edit = QLineEdit(short_name_value)
-        
-        # Store element reference with the widget to ensure we're always editing the right element
-        short_name_edit.setProperty("ecuc_element", ecuc_element)
-        
-        # Use editingFinished signal for better validation
-        short_name_edit.editingFinished.connect(
-            lambda: self._on_ecuc_property_changed(
-                self._current_element, 
-                "short_name", 
-                short_name_edit.text()
-            )
-        )
-        # Also connect textChanged for real-time updates
-        short_name_edit.textChanged.connect(
-            lambda text: self._on_ecuc_property_changed(
-                self._current_element, 
-                "short_name", 
-                text
-            )
-        )
-        basic_layout.addRow("Short Name:", short_name_edit)
-        self._property_widgets["short_name"] = short_name_edit
-        
-        # UUID (if available)
-        if 'uuid' in ecuc_element:
-            uuid_edit = QLineEdit(ecuc_element['uuid'])
-            uuid_edit.setReadOnly(True)
-            basic_layout.addRow("UUID:", uuid_edit)
-        
+        # Basic properties group, reused across selections
+        basic_group = self._ecuc_basic_group(ecuc_element)
         self.properties_layout.addWidget(basic_group)
         
         # Containers group
@@ -693,12 +852,156 @@ class PropertyEditor(QWidget):
             
             self.properties_layout.addWidget(containers_group)
     
+    def _ecuc_basic_group(self, ecuc_element: dict) -> QGroupBox:
+        """Return the Basic Properties group filled for ecuc_element.
+
+        One group is kept per layout (with or without a UUID row) and only its
+        texts change between selections.
+        """
+        has_uuid = 'uuid' in ecuc_element
+        pooled = self._ecuc_basic_pool.get(has_uuid)
+        if pooled is None:
+            basic_group = QGroupBox("Basic Properties")
+            basic_layout = QFormLayout(basic_group)
+            
+            # Type
+            type_label = QLabel()
+            basic_layout.addRow("Type:", type_label)
+            
+            # Short name
+            short_name_edit = QLineEdit()
+            # Commit on Enter/focus-out only; flush_pending_changes() also picks up
+            # text typed since then (e.g. a save shortcut while still editing)
+            short_name_edit.editingFinished.connect(
+                lambda: self._on_ecuc_property_changed(
+                    self._current_element, 
+                    "short_name", 
+                    short_name_edit.text()
+                )
+            )
+            # Leaving the field notifies listeners right away
+            short_name_edit.editingFinished.connect(self.flush_pending_changes)
+            basic_layout.addRow("Short Name:", short_name_edit)
+            # Store element reference with the widget to ensure we're always editing the right element
+            self._bind_widget(short_name_edit, ecuc_element)
+            
+            # UUID (if available)
+            uuid_edit = None
+            if has_uuid:
+                uuid_edit = QLineEdit()
+                uuid_edit.setReadOnly(True)
+                basic_layout.addRow("UUID:", uuid_edit)
+            
+            pooled = (basic_group, type_label, short_name_edit, uuid_edit)
+            self._ecuc_basic_pool[has_uuid] = pooled
+        
+        basic_group, type_label, short_name_edit, uuid_edit = pooled
+        short_name_value = ecuc_element.get('short_name', '')
+        self._monitor_log("RECREATE_WIDGET: short_name='%s' from element id=%d", short_name_value, id(ecuc_element))
+        logger.debug("Filling short_name widget with value '%s' for element id=%d", short_name_value, id(ecuc_element))
+        type_label.setText(ecuc_element.get('type', 'Unknown'))
+        self._set_text_silently(short_name_edit, short_name_value)
+        self._widget_to_element[id(short_name_edit)] = ecuc_element
+        if uuid_edit is not None:
+            uuid_edit.setText(ecuc_element['uuid'])
+        self._property_widgets["short_name"] = short_name_edit
+        return basic_group
+    
+    @staticmethod
+    def _container_snapshot(container: dict):
+        """(editable texts, layout-shaping fields) of a container widget. A pooled
+        widget is reused while the second part matches; texts are refreshed in place."""
+        return ((container.get('short_name'),),
+                (container.get('definition_ref'), bool(container.get('parameters')),
+                 len(container.get('containers') or ())))
+
+    @staticmethod
+    def _param_snapshot(param: dict):
+        """(editable texts, layout-shaping fields) of a parameter widget"""
+        return ((param.get('short_name'), param.get('value')),
+                (param.get('definition_ref'), bool(param.get('value'))))
+
+    @staticmethod
+    def _set_text_silently(widget: QLineEdit, text):
+        """Set a line edit's text without re-entering the change handlers"""
+        with QSignalBlocker(widget):
+            widget.setText(text or '')
+
+    @staticmethod
+    def _empty_layout(layout):
+        """Remove every widget from layout, leaving the layout itself in place"""
+        while layout.count():
+            item = layout.takeAt(0)
+            widget = item.widget()
+            if widget is not None:
+                widget.setParent(None)
+
+    def _fill_container_children(self, container: dict, params_layout, nested_section):
+        """Place parameter widgets, and nested container widgets if their section is open"""
+        if params_layout is not None:
+            self._empty_layout(params_layout)
+            for param in container['parameters']:
+                params_layout.addWidget(self._create_ecuc_parameter_widget(param))
+        if nested_section is not None:
+            toggle, body = nested_section
+            self._empty_layout(body.layout())
+            if toggle.isChecked():
+                self._populate_nested_section(container, body)
+
+    def _populate_nested_section(self, container: dict, body: QWidget):
+        """Create the nested container widgets of a section"""
+        layout = body.layout()
+        for nested in container['containers']:
+            layout.addWidget(self._create_ecuc_container_widget(nested))
+
+    def _on_nested_section_toggled(self, container: dict, toggle: QToolButton, body: QWidget, checked: bool):
+        """Show/hide a nested containers section, building its children on first open"""
+        toggle.setArrowType(Qt.ArrowType.DownArrow if checked else Qt.ArrowType.RightArrow)
+        if checked and body.layout().count() == 0:
+            self.properties_widget.setUpdatesEnabled(False)
+            try:
+                self._populate_nested_section(container, body)
+            finally:
+                self.properties_widget.setUpdatesEnabled(True)
+        body.setVisible(checked)
+
+    def _create_nested_section(self, container: dict, container_layout: QVBoxLayout):
+        """Add a collapsed "Nested Containers" section; children are created when it is opened"""
+        toggle = QToolButton()
+        toggle.setText(f"Nested Containers ({len(container['containers'])})")
+        toggle.setCheckable(True)
+        toggle.setArrowType(Qt.ArrowType.RightArrow)
+        toggle.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
+        toggle.setStyleSheet("QToolButton { border: none; }")
+
+        body = QWidget()
+        QVBoxLayout(body).setContentsMargins(12, 0, 0, 0)
+        body.setVisible(False)
+
+        toggle.toggled.connect(
+            lambda checked, c=container, t=toggle, b=body: self._on_nested_section_toggled(c, t, b, checked)
+        )
+        container_layout.addWidget(toggle)
+        container_layout.addWidget(body)
+        return toggle, body
+
     def _create_ecuc_container_widget(self, container: dict):
-        """Create widget for ECUC container"""
-        try:
+        """Create widget for ECUC container, reusing the pooled one when still current"""
+        snapshot = self._container_snapshot(container)
+        hit = self._container_widget_cache.get(id(container))
+        if hit is not None and id(hit[1]) not in self._pooled_in_use and hit[2][1] == snapshot[1]:
+            _, container_group, old_snapshot, params_layout, nested_section, short_name_edit = hit
+            if old_snapshot[0] != snapshot[0]:
+                container_group.setTitle(f"Container: {container.get('short_name', 'Unknown')}")
+                self._set_text_silently(short_name_edit, container.get('short_name'))
+                self._container_widget_cache[id(container)] = (
+                    container, container_group, snapshot, params_layout, nested_section, short_name_edit)
+            self._pooled_in_use.add(id(container_group))
+            self._fill_container_children(container, params_layout, nested_section)
+            return container_group
+
+        if _DEBUG:
             print(f"[PropertyEditor] creating container widget id={id(container)} short_name='{container.get('short_name')}' type='{container.get('type')}'")
-        except Exception:
-            pass
 
         container_group = QGroupBox(f"Container: {container.get('short_name', 'Unknown')}")
         container_layout = QVBoxLayout()
@@ -707,12 +1010,13 @@ class PropertyEditor(QWidget):
         # Short name
         short_name_edit = QLineEdit(container.get('short_name', ''))
         # Store container reference for signal handler
-        short_name_edit.setProperty("container_element", container)
+        self._bind_widget(short_name_edit, container)
         short_name_edit.textChanged.connect(
-            lambda text, widget=short_name_edit: self._on_ecuc_container_property_changed(
-                widget.property("container_element"), "short_name", text
+            lambda _text, widget=short_name_edit: self._defer_edit(
+                widget, self._on_ecuc_container_property_changed, "short_name"
             )
         )
+        short_name_edit.editingFinished.connect(self._apply_pending_edits)
         form.addRow("Short Name:", short_name_edit)
 
         # Definition ref
@@ -724,42 +1028,56 @@ class PropertyEditor(QWidget):
         container_layout.addLayout(form)
 
         # Parameters
+        params_layout = None
         if container.get('parameters'):
             params_group = QGroupBox("Parameters")
             params_layout = QVBoxLayout(params_group)
-
-            for param in container['parameters']:
-                param_widget = self._create_ecuc_parameter_widget(param)
-                params_layout.addWidget(param_widget)
-
             container_layout.addWidget(params_group)
 
-        # Nested containers: render recursively
+        # Nested containers: rendered recursively once their section is opened
+        nested_section = None
         if container.get('containers'):
-            nested_group = QGroupBox("Nested Containers")
-            nested_layout = QVBoxLayout(nested_group)
-            for nested in container['containers']:
-                nested_widget = self._create_ecuc_container_widget(nested)
-                nested_layout.addWidget(nested_widget)
-            container_layout.addWidget(nested_group)
+            nested_section = self._create_nested_section(container, container_layout)
 
         container_group.setLayout(container_layout)
+
+        # A dict shown twice in one form gets an unpooled second widget
+        if hit is None or id(hit[1]) not in self._pooled_in_use:
+            self._container_widget_cache[id(container)] = (
+                container, container_group, snapshot, params_layout, nested_section, short_name_edit)
+            self._pooled_in_use.add(id(container_group))
+
+        self._fill_container_children(container, params_layout, nested_section)
         return container_group
     
     def _create_ecuc_parameter_widget(self, param: dict):
-        """Create widget for ECUC parameter"""
+        """Create widget for ECUC parameter, reusing the pooled one when still current"""
+        snapshot = self._param_snapshot(param)
+        hit = self._param_widget_cache.get(id(param))
+        if hit is not None and id(hit[1]) not in self._pooled_in_use and hit[2][1] == snapshot[1]:
+            _, param_group, old_snapshot, short_name_edit, value_edit = hit
+            if old_snapshot[0] != snapshot[0]:
+                param_group.setTitle(f"Parameter: {param.get('short_name', 'Unknown')}")
+                self._set_text_silently(short_name_edit, param.get('short_name'))
+                if value_edit is not None:
+                    self._set_text_silently(value_edit, param.get('value'))
+                self._param_widget_cache[id(param)] = (param, param_group, snapshot, short_name_edit, value_edit)
+            self._pooled_in_use.add(id(param_group))
+            return param_group
+
         param_group = QGroupBox(f"Parameter: {param.get('short_name', 'Unknown')}")
         param_layout = QFormLayout(param_group)
         
         # Short name
         short_name_edit = QLineEdit(param.get('short_name', ''))
         # Store parameter reference for signal handler
-        short_name_edit.setProperty("parameter_element", param)
+        self._bind_widget(short_name_edit, param)
         short_name_edit.textChanged.connect(
-            lambda text, widget=short_name_edit: self._on_ecuc_parameter_property_changed(
-                widget.property("parameter_element"), "short_name", text
+            lambda _text, widget=short_name_edit: self._defer_edit(
+                widget, self._on_ecuc_parameter_property_changed, "short_name"
             )
         )
+        short_name_edit.editingFinished.connect(self._apply_pending_edits)
         param_layout.addRow("Short Name:", short_name_edit)
         
         # Definition ref
@@ -769,81 +1087,76 @@ class PropertyEditor(QWidget):
             param_layout.addRow("Definition Ref:", def_ref_edit)
         
         # Value
+        value_edit = None
         if param.get('value'):
             value_edit = QLineEdit(param['value'])
             # Store parameter reference for signal handler
-            value_edit.setProperty("parameter_element", param)
+            self._bind_widget(value_edit, param)
             value_edit.textChanged.connect(
-                lambda text, widget=value_edit: self._on_ecuc_parameter_property_changed(
-                    widget.property("parameter_element"), "value", text
+                lambda _text, widget=value_edit: self._defer_edit(
+                    widget, self._on_ecuc_parameter_property_changed, "value"
                 )
             )
+            value_edit.editingFinished.connect(self._apply_pending_edits)
             param_layout.addRow("Value:", value_edit)
         
+        if hit is None or id(hit[1]) not in self._pooled_in_use:
+            self._param_widget_cache[id(param)] = (param, param_group, snapshot, short_name_edit, value_edit)
+            self._pooled_in_use.add(id(param_group))
         return param_group
 
     def _find_dict_in(self, container: dict, target: dict):
-        """Recursively search for target dict inside container; return target if found else None.
+        """Search for target dict inside container; return target if found else None.
 
-        This checks identity first, then tries best-effort matching by short_name and type.
+        The whole subtree is walked iteratively and an identity hit returns
+        immediately. Failing that, the first nested dict with the same
+        short_name and type is returned as a best-effort match.
         """
         # Identity match
         if container is target:
             return container
 
-        # Check direct children lists and dict values
-        for key, val in container.items():
-            if val is target:
-                return val
-            if isinstance(val, dict):
-                found = self._find_dict_in(val, target)
-                if found is not None:
-                    return found
-            elif isinstance(val, list):
-                for item in val:
-                    if item is target:
-                        return item
-                    if isinstance(item, dict):
-                        found = self._find_dict_in(item, target)
-                        if found is not None:
-                            return found
-
-        # As fallback, match by short_name/type if present
-        try:
-            tname = target.get('short_name')
-            ttype = target.get('type')
-            if tname:
-                # shallow search by short_name/type
-                for key, val in container.items():
-                    if isinstance(val, list):
-                        for item in val:
-                            if isinstance(item, dict) and item.get('short_name') == tname and item.get('type') == ttype:
-                                return item
-        except Exception:
-            pass
+        tname = target.get('short_name') if isinstance(target, dict) else None
+        ttype = target.get('type') if tname else None
+        name_match = None
+
+        stack = [container]
+        while stack:
+            node = stack.pop()
+            for child in (node.values() if isinstance(node, dict) else node):
+                if child is target:
+                    return child
+                if isinstance(child, dict):
+                    if (name_match is None and tname and child.get('short_name') == tname
+                            and child.get('type') == ttype):
+                        name_match = child
+                    stack.append(child)
+                elif isinstance(child, list):
+                    stack.append(child)
 
-        return None
+        return name_match
     
     def _on_property_changed(self, element, property_name: str, new_value):
         """Handle property change"""
         # Store old value for undo
         old_value = getattr(element, property_name)
+        if old_value == new_value:
+            return
         
         # Update element
         setattr(element, property_name, new_value)
         
-        # Mark document as modified
-        if hasattr(self.app, 'current_document') and self.app.current_document:
-            self.app.current_document.set_modified(True)
-        
-        # Emit signal
-        self.property_changed.emit(element, property_name, new_value)
+        # Document is marked modified and listeners notified on the next flush
+        self._queue_change(element, property_name, new_value)
     
     def _on_ecuc_property_changed(self, ecuc_element: dict, property_name: str, new_value):
         """Handle ECUC element property change"""
         # Validate input
         if not isinstance(ecuc_element, dict):
-            print(f"Warning: ecuc_element is not a dict: {type(ecuc_element)}")
+            logger.warning("ecuc_element is not a dict: %s", type(ecuc_element))
+            return
+        # Focus-out re-sends the current text; nothing to do if it did not change
+        if ecuc_element.get(property_name, '') == new_value:
             return
         
         # Always use the current element if it matches, as it should be the resolved instance
@@ -853,9 +1166,11 @@ class PropertyEditor(QWidget):
         if self._current_element is not None and isinstance(self._current_element, dict):
             # Log the property change attempt
             old_value = ecuc_element.get(property_name, '')
-            self._monitor_log(f"PROPERTY_CHANGED: '{old_value}' -> '{new_value}' on element id={id(ecuc_element)} short_name='{ecuc_element.get('short_name')}'")
-            self._monitor_log(f"CURRENT_ELEMENT: id={id(self._current_element)} short_name='{self._current_element.get('short_name')}'")
-            self._monitor_log(f"ELEMENT_MATCH: {ecuc_element is self._current_element}")
+            self._monitor_log("PROPERTY_CHANGED: '%s' -> '%s' on element id=%d short_name='%s'",
+                              old_value, new_value, id(ecuc_element), ecuc_element.get('short_name'))
+            self._monitor_log("CURRENT_ELEMENT: id=%d short_name='%s'",
+                              id(self._current_element), self._current_element.get('short_name'))
+            self._monitor_log("ELEMENT_MATCH: %s", ecuc_element is self._current_element)
             # If the current element is the same as or contains the ecuc_element, use current element
             if self._current_element is ecuc_element:
                 target_element = self._current_element
@@ -867,20 +1182,14 @@ class PropertyEditor(QWidget):
                     target_element = resolved
         
         old_value = target_element.get(property_name, '')
-        target_element[property_name] = new_value
+        self._set_dict_property(target_element, property_name, new_value)
         
-        try:
-            print(f"[PropertyEditor] _on_ecuc_property_changed: '{old_value}' -> '{new_value}' on element id={id(target_element)} short_name='{target_element.get('short_name')}'")
-        except Exception:
-            pass
+        logger.debug("_on_ecuc_property_changed: '%s' -> '%s' on element id=%d short_name='%s'",
+                     old_value, new_value, id(target_element), target_element.get('short_name'))
 
         # Log after saving - use target_element to avoid UnboundLocalError
-        self._monitor_log(f"SAVED_PROPERTY: {property_name}='{new_value}' on element id={id(target_element)}")
+        self._monitor_log("SAVED_PROPERTY: %s='%s' on element id=%d", property_name, new_value, id(target_element))
 
-        # Mark document as modified
-        if hasattr(self.app, 'current_document') and self.app.current_document:
-            self.app.current_document.set_modified(True)
-        
         # After writing the change, try to canonicalize duplicates in the
         # document so the UI doesn't end up with multiple dict copies for
         # the same logical element (which was causing the "edits lost" bug).
@@ -891,11 +1200,14 @@ class PropertyEditor(QWidget):
         except Exception:
             pass
 
-        # Emit signal with the resolved element that was actually updated
-        self.property_changed.emit(target_element, property_name, new_value)
+        # Notify with the resolved element that was actually updated
+        self._queue_change(target_element, property_name, new_value)
     
     def _on_ecuc_container_property_changed(self, container: dict, property_name: str, new_value):
         """Handle ECUC container property change"""
+        if container.get(property_name, '') == new_value:
+            return
+        self._container_widget_cache.pop(id(container), None)
         # Update container: resolve to document instance if possible
         resolved = None
         doc = getattr(self.app, 'current_document', None)
@@ -903,53 +1215,24 @@ class PropertyEditor(QWidget):
             resolved = self._resolve_to_document(container)
 
         if resolved is not None:
-            try:
-                print(f"[PropertyEditor] _on_ecuc_container_property_changed resolved id={id(resolved)} short_name='{resolved.get('short_name')}' -> setting {property_name}={new_value}")
-            except Exception:
-                pass
-            resolved[property_name] = new_value
+            logger.debug("_on_ecuc_container_property_changed resolved id=%d short_name='%s' -> setting %s=%s",
+                         id(resolved), resolved.get('short_name'), property_name, new_value)
+            self._set_dict_property(resolved, property_name, new_value)
             target_for_emit = resolved
         else:
             # Try to find matching containers in the document by short_name/type
-            updated = False
-            if doc:
-                try:
-                    tname = container.get('short_name')
-                    ttype = container.get('type')
-                    matches = []
-                    for doc_elem in doc.ecuc_elements:
-                        # search nested
-                        found = self._find_dict_in(doc_elem, container)
-                        if found is not None:
-                            matches.append(found)
-                        else:
-                            # fallback shallow match
-                            if tname and doc_elem.get('short_name') == tname and doc_elem.get('type') == ttype:
-                                matches.append(doc_elem)
-                    if matches:
-                        for m in matches:
-                            try:
-                                print(f"[PropertyEditor] _on_ecuc_container_property_changed fallback updating match id={id(m)} short_name='{m.get('short_name')}'")
-                            except Exception:
-                                pass
-                            m[property_name] = new_value
-                            updated = True
-                        target_for_emit = matches[0]
-                    else:
-                        # No doc match found; update the passed container as a last resort
-                        container[property_name] = new_value
-                        target_for_emit = container
-                except Exception:
-                    container[property_name] = new_value
-                    target_for_emit = container
+            matches = list(self._find_by_name(container)) if doc else []
+            if matches:
+                for m in matches:
+                    logger.debug("_on_ecuc_container_property_changed fallback updating match id=%d short_name='%s'",
+                                 id(m), m.get('short_name'))
+                    self._set_dict_property(m, property_name, new_value)
+                target_for_emit = matches[0]
             else:
+                # No doc match found; update the passed container as a last resort
                 container[property_name] = new_value
                 target_for_emit = container
 
-        # Mark document as modified
-        if doc:
-            doc.set_modified(True)
-
         # After writing the change, canonicalize duplicates to prevent
         # transient copies from being selected later.
         try:
@@ -958,22 +1241,16 @@ class PropertyEditor(QWidget):
         except Exception:
             pass
 
-        # Emit signal
-        self.property_changed.emit(target_for_emit, property_name, new_value)
-        # Debug: dump document ECUC elements to show where the change landed
-        try:
-            if doc:
-                print("[PropertyEditor] Document ECUC elements after change:")
-                for e in doc.ecuc_elements:
-                    try:
-                        print(f"  id={id(e)} short_name='{e.get('short_name')}' containers={len(e.get('containers', []))}")
-                    except Exception:
-                        print(f"  id={id(e)} (unreadable)")
-        except Exception:
-            pass
+        # Notify listeners on the next flush
+        self._queue_change(target_for_emit, property_name, new_value)
+        if doc:
+            logger.debug("doc now has %d top-level elements", len(doc.ecuc_elements))
     
     def _on_ecuc_parameter_property_changed(self, parameter: dict, property_name: str, new_value):
         """Handle ECUC parameter property change"""
+        if parameter.get(property_name, '') == new_value:
+            return
+        self._param_widget_cache.pop(id(parameter), None)
         # Update parameter: resolve to document instance if possible
         resolved = None
         doc = getattr(self.app, 'current_document', None)
@@ -981,47 +1258,23 @@ class PropertyEditor(QWidget):
             resolved = self._resolve_to_document(parameter)
 
         if resolved is not None:
-            try:
-                print(f"[PropertyEditor] _on_ecuc_parameter_property_changed resolved id={id(resolved)} short_name='{resolved.get('short_name')}' -> setting {property_name}={new_value}")
-            except Exception:
-                pass
-            resolved[property_name] = new_value
+            logger.debug("_on_ecuc_parameter_property_changed resolved id=%d short_name='%s' -> setting %s=%s",
+                         id(resolved), resolved.get('short_name'), property_name, new_value)
+            self._set_dict_property(resolved, property_name, new_value)
             target_for_emit = resolved
         else:
             # Try to find matching parameters in the document by short_name/type
-            updated = False
-            if doc:
-                try:
-                    tname = parameter.get('short_name')
-                    ttype = parameter.get('type')
-                    matches = []
-                    for doc_elem in doc.ecuc_elements:
-                        found = self._find_dict_in(doc_elem, parameter)
-                        if found is not None:
-                            matches.append(found)
-                    if matches:
-                        for m in matches:
-                            try:
-                                print(f"[PropertyEditor] _on_ecuc_parameter_property_changed fallback updating match id={id(m)} short_name='{m.get('short_name')}'")
-                            except Exception:
-                                pass
-                            m[property_name] = new_value
-                            updated = True
-                        target_for_emit = matches[0]
-                    else:
-                        parameter[property_name] = new_value
-                        target_for_emit = parameter
-                except Exception:
-                    parameter[property_name] = new_value
-                    target_for_emit = parameter
+            matches = list(self._find_by_name(parameter)) if doc else []
+            if matches:
+                for m in matches:
+                    logger.debug("_on_ecuc_parameter_property_changed fallback updating match id=%d short_name='%s'",
+                                 id(m), m.get('short_name'))
+                    self._set_dict_property(m, property_name, new_value)
+                target_for_emit = matches[0]
             else:
                 parameter[property_name] = new_value
                 target_for_emit = parameter
 
-        # Mark document as modified
-        if doc:
-            doc.set_modified(True)
-
         # After writing the change, canonicalize duplicates to prevent
         # transient copies from being selected later.
         try:
@@ -1030,24 +1283,8 @@ class PropertyEditor(QWidget):
         except Exception:
             pass
 
-        # Emit signal
-        self.property_changed.emit(target_for_emit, property_name, new_value)
-
-    def _replace_in_container(self, container: dict, old: dict, new: dict):
-        """Recursively replace references to old with new inside container dicts/lists."""
-        if not isinstance(container, dict):
-            return
-        for key, val in list(container.items()):
-            if val is old:
-                container[key] = new
-            elif isinstance(val, dict):
-                self._replace_in_container(val, old, new)
-            elif isinstance(val, list):
-                for idx, item in enumerate(val):
-                    if item is old:
-                        val[idx] = new
-                    elif isinstance(item, dict):
-                        self._replace_in_container(item, old, new)
+        # Notify listeners on the next flush
+        self._queue_change(target_for_emit, property_name, new_value)
 
     def _dedupe_document(self, canonical: dict):
         """Replace duplicate dict instances in the current document with canonical."""
@@ -1055,88 +1292,50 @@ class PropertyEditor(QWidget):
         if not doc or not isinstance(canonical, dict):
             return
 
-        try:
-            c_name = canonical.get('short_name')
-            c_type = canonical.get('type')
-        except Exception:
+        # Fast path: duplicates can only exist if the (short_name, type) bucket
+        # holds more than one dict, which is the uncommon case.
+        self._rebuild_doc_index_if_needed()
+        bucket = self._doc_by_name.get((canonical.get('short_name'), canonical.get('type')), ())
+        if len(bucket) <= 1:
             return
 
-        # Replace duplicates inside top-level elements and remove duplicate top-levels
-        new_top = []
-        seen_top = set()
-        for elem in doc.ecuc_elements:
-            if elem is canonical:
-                new_top.append(elem)
-                seen_top.add((elem.get('short_name'), elem.get('type')))
-            else:
-                try:
-                    if elem.get('short_name') == c_name and elem.get('type') == c_type:
-                        # Found a duplicate top-level; replace references to it across doc
-                        for top in doc.ecuc_elements:
-                            self._replace_in_container(top, elem, canonical)
-                        # Don't add duplicate to new_top (we keep canonical)
-                        continue
-                except Exception:
-                    pass
-                new_top.append(elem)
-
-        # Update the document's ecuc_elements list if it changed
-        if len(new_top) != len(doc.ecuc_elements) or any(x is not y for x, y in zip(new_top, doc.ecuc_elements)):
-            try:
-                doc._ecuc_elements = new_top
-                print(f"[PropertyEditor] deduped document ECUC elements; now {len(new_top)} top-level elements")
-            except Exception:
-                pass
-        # Debug: dump document ECUC elements after parameter change
-        try:
-            if doc:
-                print("[PropertyEditor] Document ECUC elements after parameter change:")
-                for e in doc.ecuc_elements:
-                    try:
-                        print(f"  id={id(e)} short_name='{e.get('short_name')}' containers={len(e.get('containers', []))}")
-                    except Exception:
-                        print(f"  id={id(e)} (unreadable)")
-        except Exception:
-            pass
+        # Only top-level duplicates are collapsed; nested namesakes are left alone
+        top_ids = {id(elem) for elem in doc.ecuc_elements}
+        duplicates = [d for d in bucket if d is not canonical and id(d) in top_ids]
+        if not duplicates:
+            return
+
+        # Point nested references to each duplicate at canonical, then drop it
+        # from the top-level list (those references are handled by the filter)
+        elements = doc.ecuc_elements
+        for dup in duplicates:
+            for parent, key in self._parent_of.get(id(dup), ()):
+                if parent is not elements and parent[key] is dup:
+                    parent[key] = canonical
+        dup_ids = {id(d) for d in duplicates}
+        new_top = [elem for elem in elements if id(elem) not in dup_ids]
+
+        doc._ecuc_elements = new_top
+        self._invalidate_doc_index()
+        logger.debug("deduped document ECUC elements; now %d top-level elements", len(new_top))
 
     def _resolve_to_document(self, target: dict):
         """Resolve a dict (possibly a transient copy) to the corresponding dict
         instance inside the current document, or return None if not found.
+
+        Document instances are found through the id() index; transient copies
+        fall back to the first document dict with the same short_name/type.
         """
         if not hasattr(self.app, 'current_document') or not self.app.current_document:
             return None
 
-        for doc_elem in self.app.current_document.ecuc_elements:
-            # direct identity
-            try:
-                if doc_elem is target:
-                    print(f"[PropertyEditor] _resolve_to_document: direct identity match id={id(doc_elem)} short_name='{doc_elem.get('short_name')}'")
-                    self._monitor_log(f"RESOLVE_TO_DOC: direct identity match id={id(doc_elem)} short_name='{doc_elem.get('short_name')}'")
-                    return doc_elem
-            except Exception:
-                pass
-            # search nested structures
-            found = self._find_dict_in(doc_elem, target)
-            if found is not None:
-                try:
-                    print(f"[PropertyEditor] _resolve_to_document: nested match id={id(found)} short_name='{found.get('short_name')}' (contained in top-level id={id(doc_elem)})")
-                    self._monitor_log(f"RESOLVE_TO_DOC: nested match id={id(found)} short_name='{found.get('short_name')}' (contained in top-level id={id(doc_elem)})")
-                except Exception:
-                    pass
-                return found
-
-        # Fallback: try to match top-level by short_name/type
-        try:
-            tname = target.get('short_name')
-            ttype = target.get('type')
-            if tname:
-                for doc_elem in self.app.current_document.ecuc_elements:
-                    if doc_elem.get('short_name') == tname and doc_elem.get('type') == ttype:
-                        return doc_elem
-        except Exception:
-            pass
+        self._rebuild_doc_index_if_needed()
+        found = self._doc_dict_index.get(id(target))
+        if found is not None:
+            return found
 
-        return None
+        matches = self._find_by_name(target)
+        return matches[0] if matches else None
     
     def _verify_element_persistence(self, element):
         """Debug method to verify element values are persisted correctly"""
@@ -7,13 +7,44 @@ from PyQt6.QtWidgets import (
     QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget, 
     QHeaderView, QMenu, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QSignalBlocker
 from PyQt6.QtGui import QAction
+from functools import partial
 from ...core.models.autosar_elements import (
     SwComponentType, Composition, PortInterface, PortPrototype,
-    SwComponentTypeCategory, PortType
+    SwComponentTypeCategory, PortType, ServiceInterface, DataElement, DataType,
+    ApplicationSwComponentType, AtomicSwComponentType, CompositionSwComponentType
 )
 
+# Item data roles, resolved once instead of per item
+_UR = Qt.ItemDataRole.UserRole
+_UR1 = Qt.ItemDataRole.UserRole + 1
+# id() of the element an item shows, used to keep _item_by_id in sync
+_UR_ID = Qt.ItemDataRole.UserRole + 2
+
+# Type column labels, looked up by enum member instead of reading .value per item
+_CATEGORY_LABELS = {category: category.value for category in SwComponentTypeCategory}
+_PORT_TYPE_LABELS = {port_type: port_type.value for port_type in PortType}
+_DATA_TYPE_LABELS = {data_type: data_type.value for data_type in DataType}
+
+# Objects whose selection is forwarded through element_selected
+_SELECTABLE_TYPES = (SwComponentType, Composition, PortInterface, PortPrototype, DataElement, dict)
+
+# Keys of an ECUC container dict that never hold child nodes
+_ECUC_NON_CHILD_KEYS = ('short_name', 'type', 'definition_ref', 'parameters', 'containers', 'admin_data')
+
+# Category root keys that accept dropped elements
+_DROP_CATEGORIES = frozenset({"sw_component_types", "compositions", "port_interfaces", "service_interfaces"})
+
+
+class _PlaceholderItem(QTreeWidgetItem):
+    """Stand-in child of a collapsed item; fill() builds the real children on first expand"""
+    
+    def __init__(self, fill):
+        super().__init__(["Loading…"])
+        self.fill = fill
+
+
 class TreeNavigator(QTreeWidget):
     """Tree navigator for AUTOSAR elements"""
     
@@ -24,6 +55,12 @@ class TreeNavigator(QTreeWidget):
     def __init__(self, app):
         super().__init__()
         self.app = app
+        # Tree item of every element currently shown, and the element itself, keyed by id(element)
+        self._item_by_id = {}
+        self._element_by_id = {}
+        self._last_selected_id = None
+        # Document whose element_added/removed/modified signals we follow
+        self._observed_document = None
         self._setup_ui()
         self._connect_signals()
         self._setup_context_menu()
@@ -38,6 +75,10 @@ class TreeNavigator(QTreeWidget):
         # Setup columns
         self.setColumnCount(2)
         self.setHeaderLabels(["Name", "Type"])
+        # All rows are plain two-column text: let Qt cache one row height
+        self.setUniformRowHeights(True)
+        self.setAnimated(False)
+        self.setExpandsOnDoubleClick(False)
         
         # Configure header
         header = self.header()
@@ -63,12 +104,36 @@ class TreeNavigator(QTreeWidget):
         """Connect signals"""
         self.itemSelectionChanged.connect(self._on_selection_changed)
         self.itemDoubleClicked.connect(self._on_item_double_clicked)
-        self.app.document_changed.connect(self.refresh)
+        self.itemExpanded.connect(self._on_item_expanded)
+        self.app.document_changed.connect(self._on_document_changed)
     
     def _setup_context_menu(self):
         """Setup context menu"""
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
+        
+        # The "Add ..." actions never change; build them once and reuse them in every menu
+        self._add_app_action = QAction("Add Application Component", self)
+        self._add_app_action.triggered.connect(self._add_application_component)
+        self._add_atomic_action = QAction("Add Atomic Component", self)
+        self._add_atomic_action.triggered.connect(self._add_atomic_component)
+        self._add_composition_component_action = QAction("Add Composition Component", self)
+        self._add_composition_component_action.triggered.connect(self._add_composition_component)
+        self._add_composition_action = QAction("Add Composition", self)
+        self._add_composition_action.triggered.connect(self._add_composition)
+        self._add_port_interface_action = QAction("Add Port Interface", self)
+        self._add_port_interface_action.triggered.connect(self._add_port_interface)
+        self._add_service_interface_action = QAction("Add Service Interface", self)
+        self._add_service_interface_action.triggered.connect(self._add_service_interface)
+        
+        # Category root key -> the actions offered in its menu
+        self._menu_actions = {
+            "sw_component_types": (self._add_app_action, self._add_atomic_action,
+                                   self._add_composition_component_action),
+            "compositions": (self._add_composition_action,),
+            "port_interfaces": (self._add_port_interface_action,),
+            "service_interfaces": (self._add_service_interface_action,),
+        }
     
     def _show_context_menu(self, position):
         """Show context menu"""
@@ -79,106 +144,234 @@ class TreeNavigator(QTreeWidget):
         menu = QMenu(self)
         
         # Get item data
-        item_data = item.data(0, Qt.ItemDataRole.UserRole)
-        
-        if item_data == "sw_component_types":
-            # Add new component type actions
-            add_app_action = QAction("Add Application Component", self)
-            add_app_action.triggered.connect(self._add_application_component)
-            menu.addAction(add_app_action)
-            
-            add_atomic_action = QAction("Add Atomic Component", self)
-            add_atomic_action.triggered.connect(self._add_atomic_component)
-            menu.addAction(add_atomic_action)
-            
-            add_composition_action = QAction("Add Composition Component", self)
-            add_composition_action.triggered.connect(self._add_composition_component)
-            menu.addAction(add_composition_action)
-        
-        elif item_data == "compositions":
-            add_action = QAction("Add Composition", self)
-            add_action.triggered.connect(self._add_composition)
-            menu.addAction(add_action)
-        
-        elif item_data == "port_interfaces":
-            add_action = QAction("Add Port Interface", self)
-            add_action.triggered.connect(self._add_port_interface)
-            menu.addAction(add_action)
-        
-        elif item_data == "service_interfaces":
-            add_action = QAction("Add Service Interface", self)
-            add_action.triggered.connect(self._add_service_interface)
-            menu.addAction(add_action)
+        item_data = item.data(0, _UR)
         
+        # Root keys are strings; other items may hold unhashable dict copies
+        actions = self._menu_actions.get(item_data) if isinstance(item_data, str) else None
+        if actions:
+            menu.addActions(actions)
         elif isinstance(item_data, (SwComponentType, Composition, PortInterface)):
             # Element-specific actions
-            delete_action = QAction("Delete", self)
-            delete_action.triggered.connect(lambda: self._delete_element(item_data))
-            menu.addAction(delete_action)
+            delete_action = menu.addAction("Delete")
+            delete_action.triggered.connect(partial(self._delete_element, item_data))
         
         if menu.actions():
             menu.exec(self.mapToGlobal(position))
+        # The shared actions are owned by the navigator, only the menu itself goes
+        menu.deleteLater()
     
     def refresh(self):
         """Refresh the tree view"""
-        self.clear()
+        # Items are built detached and attached in one go; paint and selection
+        # signals are suppressed while the tree is repopulated
+        self.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self):
+                self.clear()
+                self._item_by_id.clear()
+                self._element_by_id.clear()
+                self._last_selected_id = None
+                self._observe_document(self.app.current_document)
+                self._populate()
+        finally:
+            self.setUpdatesEnabled(True)
+            # One repaint for the whole rebuild
+            self.viewport().update()
         
+        # Pre-select the first root item if available
+        if self.topLevelItemCount() > 0:
+            first_item = self.topLevelItem(0)
+            self.setCurrentItem(first_item)
+            # Scroll to ensure the selected item is visible
+            self.scrollToItem(first_item)
+    
+    def _on_document_changed(self):
+        """Rebuild when another document is shown. The current one is kept in sync by
+        its element signals, so re-announcing it (e.g. after a save) changes nothing."""
+        if self.app.current_document is not self._observed_document:
+            self.refresh()
+
+    def _observe_document(self, doc):
+        """Follow fine-grained add/remove/modify signals of the current document"""
+        if doc is self._observed_document:
+            return
+        if self._observed_document is not None:
+            try:
+                self._observed_document.element_added.disconnect(self._on_element_added)
+                self._observed_document.element_removed.disconnect(self._on_element_removed)
+                self._observed_document.element_modified.disconnect(self._on_element_modified)
+            except (TypeError, RuntimeError):
+                pass
+        self._observed_document = doc
+        if doc is not None:
+            doc.element_added.connect(self._on_element_added)
+            doc.element_removed.connect(self._on_element_removed)
+            doc.element_modified.connect(self._on_element_modified)
+    
+    def _register_item(self, item: QTreeWidgetItem, element):
+        """Index a tree item by the id of the element it shows"""
+        element_id = id(element)
+        self._item_by_id[element_id] = item
+        self._element_by_id[element_id] = element
+        item.setData(0, _UR_ID, element_id)
+    
+    def _unregister_subtree(self, item: QTreeWidgetItem):
+        """Drop an item and all of its descendants from the id index"""
+        stack = [item]
+        while stack:
+            current = stack.pop()
+            element_id = current.data(0, _UR_ID)
+            if element_id is not None and self._item_by_id.get(element_id) is current:
+                del self._item_by_id[element_id]
+                del self._element_by_id[element_id]
+            stack.extend(current.child(i) for i in range(current.childCount()))
+    
+    def _category_for(self, element):
+        """Return (root attribute, item builder) for a top-level model object"""
+        if isinstance(element, SwComponentType):
+            return 'sw_component_types_item', self._add_component_type_item
+        if isinstance(element, Composition):
+            return 'compositions_item', self._add_composition_item
+        if isinstance(element, PortInterface):
+            return 'port_interfaces_item', self._add_port_interface_item
+        if isinstance(element, ServiceInterface):
+            return 'service_interfaces_item', self._add_service_interface_item
+        if isinstance(element, dict):
+            return 'ecuc_elements_item', self._add_ecuc_element_item
+        return None, None
+    
+    def _update_root_count(self, root: QTreeWidgetItem):
+        root.setText(1, f"{root.childCount()} items")
+    
+    def _on_element_added(self, element):
+        """Insert the item for a newly added element under its category root"""
+        attr, builder = self._category_for(element)
+        root = getattr(self, attr, None) if attr else None
+        if root is None:
+            # Section was empty (no root yet) or unknown element kind
+            self.refresh()
+            return
+        root.addChild(builder(element))
+        self._update_root_count(root)
+    
+    def _on_element_removed(self, element):
+        """Take the item of a removed element out of the tree"""
+        item = self._item_by_id.get(id(element))
+        if item is None:
+            return
+        parent = item.parent()
+        if parent is None:
+            self.refresh()
+            return
+        self._unregister_subtree(item)
+        parent.removeChild(item)
+        if parent.childCount() == 0 and parent.parent() is None:
+            # Empty sections are not shown
+            self.refresh()
+        elif parent.parent() is None:
+            self._update_root_count(parent)
+    
+    def _on_element_modified(self, element):
+        """Refresh the texts of a modified element's item"""
+        self.update_element_item(element)
+    
+    def update_element_item(self, element) -> bool:
+        """Update the name and type shown for element; returns False if it has no item"""
+        item = self._item_by_id.get(id(element))
+        if item is None:
+            return False
+        if isinstance(element, dict):
+            item.setText(0, element.get('short_name', '<no-short-name>'))
+            return True
+        item.setText(0, element.short_name)
+        # Elements with an editable kind show it in the Type column
+        if isinstance(element, SwComponentType):
+            item.setText(1, _CATEGORY_LABELS[element.category])
+        elif isinstance(element, PortPrototype):
+            item.setText(1, _PORT_TYPE_LABELS[element.port_type])
+        elif isinstance(element, DataElement):
+            item.setText(1, _DATA_TYPE_LABELS[element.data_type])
+        return True
+    
+    def _defer_children(self, item: QTreeWidgetItem, fill):
+        """Give item an expand arrow now and build its children only when it is opened"""
+        item.addChild(_PlaceholderItem(fill))
+    
+    def _on_item_expanded(self, item: QTreeWidgetItem):
+        """Replace the placeholder of a lazily populated item by its real children"""
+        if item.childCount() != 1:
+            return
+        placeholder = item.child(0)
+        if not isinstance(placeholder, _PlaceholderItem):
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            item.takeChildren()
+            item.addChildren(placeholder.fill())
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _make_root_item(self, label: str, count: int, key: str) -> QTreeWidgetItem:
+        """Create a detached category root item"""
+        item = QTreeWidgetItem([label, f"{count} items"])
+        item.setData(0, _UR, key)
+        return item
+    
+    def _populate(self):
+        """Build all root items with their children and add them to the tree"""
+        self.sw_component_types_item = None
+        self.compositions_item = None
+        self.port_interfaces_item = None
+        self.service_interfaces_item = None
+        self.ecuc_elements_item = None
         if not self.app.current_document:
             return
+        doc = self.app.current_document
+        roots = []
+        
+        # The document properties return a fresh copy per access; read each list once
+        sw_component_types = doc.sw_component_types
+        compositions = doc.compositions
+        port_interfaces = doc.port_interfaces
+        service_interfaces = doc.service_interfaces
+        ecuc_elements = doc.ecuc_elements
         
         # Only create root items for sections that have content
-        has_sw_components = len(self.app.current_document.sw_component_types) > 0
-        has_compositions = len(self.app.current_document.compositions) > 0
-        has_port_interfaces = len(self.app.current_document.port_interfaces) > 0
-        has_service_interfaces = len(self.app.current_document.service_interfaces) > 0
-        has_ecuc_elements = len(self.app.current_document.ecuc_elements) > 0
-        
-        # Create root items only for non-empty sections
-        if has_sw_components:
-            self.sw_component_types_item = QTreeWidgetItem(self)
-            self.sw_component_types_item.setText(0, "Software Component Types")
-            self.sw_component_types_item.setText(1, f"{len(self.app.current_document.sw_component_types)} items")
-            self.sw_component_types_item.setData(0, Qt.ItemDataRole.UserRole, "sw_component_types")
-            
-            for component_type in self.app.current_document.sw_component_types:
-                self._add_component_type_item(component_type)
-        
-        if has_compositions:
-            self.compositions_item = QTreeWidgetItem(self)
-            self.compositions_item.setText(0, "Compositions")
-            self.compositions_item.setText(1, f"{len(self.app.current_document.compositions)} items")
-            self.compositions_item.setData(0, Qt.ItemDataRole.UserRole, "compositions")
-            
-            for composition in self.app.current_document.compositions:
-                self._add_composition_item(composition)
-        
-        if has_port_interfaces:
-            self.port_interfaces_item = QTreeWidgetItem(self)
-            self.port_interfaces_item.setText(0, "Port Interfaces")
-            self.port_interfaces_item.setText(1, f"{len(self.app.current_document.port_interfaces)} items")
-            self.port_interfaces_item.setData(0, Qt.ItemDataRole.UserRole, "port_interfaces")
-            
-            for port_interface in self.app.current_document.port_interfaces:
-                self._add_port_interface_item(port_interface)
-        
-        if has_service_interfaces:
-            self.service_interfaces_item = QTreeWidgetItem(self)
-            self.service_interfaces_item.setText(0, "Service Interfaces")
-            self.service_interfaces_item.setText(1, f"{len(self.app.current_document.service_interfaces)} items")
-            self.service_interfaces_item.setData(0, Qt.ItemDataRole.UserRole, "service_interfaces")
-            
-            for service_interface in self.app.current_document.service_interfaces:
-                self._add_service_interface_item(service_interface)
-        
-        if has_ecuc_elements:
-            self.ecuc_elements_item = QTreeWidgetItem(self)
-            self.ecuc_elements_item.setText(0, "ECUC Elements")
-            self.ecuc_elements_item.setText(1, f"{len(self.app.current_document.ecuc_elements)} items")
-            self.ecuc_elements_item.setData(0, Qt.ItemDataRole.UserRole, "ecuc_elements")
+        if sw_component_types:
+            self.sw_component_types_item = self._make_root_item(
+                "Software Component Types", len(sw_component_types), "sw_component_types")
+            self.sw_component_types_item.addChildren(
+                [self._add_component_type_item(component_type) for component_type in sw_component_types])
+            roots.append(self.sw_component_types_item)
+        
+        if compositions:
+            self.compositions_item = self._make_root_item(
+                "Compositions", len(compositions), "compositions")
+            self.compositions_item.addChildren(
+                [self._add_composition_item(composition) for composition in compositions])
+            roots.append(self.compositions_item)
+        
+        if port_interfaces:
+            self.port_interfaces_item = self._make_root_item(
+                "Port Interfaces", len(port_interfaces), "port_interfaces")
+            self.port_interfaces_item.addChildren(
+                [self._add_port_interface_item(port_interface) for port_interface in port_interfaces])
+            roots.append(self.port_interfaces_item)
+        
+        if service_interfaces:
+            self.service_interfaces_item = self._make_root_item(
+                "Service Interfaces", len(service_interfaces), "service_interfaces")
+            self.service_interfaces_item.addChildren(
+                [self._add_service_interface_item(service_interface) for service_interface in service_interfaces])
+            roots.append(self.service_interfaces_item)
+        
+        if ecuc_elements:
+            self.ecuc_elements_item = self._make_root_item(
+                "ECUC Elements", len(ecuc_elements), "ecuc_elements")
             # Debug: show how many top-level ECUC elements and basic structure
             try:
-                print(f"[TreeNavigator] refresh: {len(self.app.current_document.ecuc_elements)} ECUC elements")
-                for e in self.app.current_document.ecuc_elements:
+                print(f"[TreeNavigator] refresh: {len(ecuc_elements)} ECUC elements")
+                for e in ecuc_elements:
                     try:
                         print(f"  id={id(e)} short_name='{e.get('short_name')}' type='{e.get('type')}' containers={len(e.get('containers', []))} parameters={len(e.get('parameters', []))}")
                     except Exception:
@@ -186,125 +379,122 @@ class TreeNavigator(QTreeWidget):
             except Exception:
                 pass
 
-            for ecuc_element in self.app.current_document.ecuc_elements:
-                self._add_ecuc_element_item(ecuc_element)
-        
-        # Expand all root items
-        self.expandAll()
-        
-        # Pre-select the first root item if available
-        if self.topLevelItemCount() > 0:
-            first_item = self.topLevelItem(0)
-            self.setCurrentItem(first_item)
-            # Scroll to ensure the selected item is visible
-            self.scrollToItem(first_item)
-    
-    
-    def _add_component_type_item(self, component_type: SwComponentType):
-        """Add component type to tree"""
-        item = QTreeWidgetItem(self.sw_component_types_item)
-        item.setText(0, component_type.short_name)
-        item.setText(1, component_type.category.value)
-        item.setData(0, Qt.ItemDataRole.UserRole, component_type)
-        item.setData(0, Qt.ItemDataRole.UserRole + 1, component_type)
-
-        # Add ports as children
+            self.ecuc_elements_item.addChildren(
+                [self._add_ecuc_element_item(ecuc_element) for ecuc_element in ecuc_elements])
+            roots.append(self.ecuc_elements_item)
+        
+        self.addTopLevelItems(roots)
+        
+        # Expand only the category roots; deeper levels are built when opened
+        for root in roots:
+            root.setExpanded(True)
+    
+    def _add_component_type_item(self, component_type: SwComponentType) -> QTreeWidgetItem:
+        """Build the (detached) tree item for a component type"""
+        item = QTreeWidgetItem([component_type.short_name, _CATEGORY_LABELS[component_type.category]])
+        item.setData(0, _UR, component_type)
+        item.setData(0, _UR1, component_type)
+        self._register_item(item, component_type)
+        if component_type.ports:
+            self._defer_children(item, partial(self._build_port_items, component_type))
+        return item
+    
+    def _build_port_items(self, component_type: SwComponentType) -> list:
+        """Build the port items of a component type"""
+        children = []
         for port in component_type.ports:
-            port_item = QTreeWidgetItem(item)
-            port_item.setText(0, port.short_name)
-            port_item.setText(1, port.port_type.value)
-            port_item.setData(0, Qt.ItemDataRole.UserRole, port)
-            port_item.setData(0, Qt.ItemDataRole.UserRole + 1, port)
-    
-    def _add_composition_item(self, composition: Composition):
-        """Add composition to tree"""
-        item = QTreeWidgetItem(self.compositions_item)
-        item.setText(0, composition.short_name)
-        item.setText(1, "Composition")
-        item.setData(0, Qt.ItemDataRole.UserRole, composition)
-        item.setData(0, Qt.ItemDataRole.UserRole + 1, composition)
-
-        # Add component types as children
+            port_item = QTreeWidgetItem([port.short_name, _PORT_TYPE_LABELS[port.port_type]])
+            port_item.setData(0, _UR, port)
+            port_item.setData(0, _UR1, port)
+            self._register_item(port_item, port)
+            children.append(port_item)
+        return children
+    
+    def _add_composition_item(self, composition: Composition) -> QTreeWidgetItem:
+        """Build the (detached) tree item for a composition"""
+        item = QTreeWidgetItem([composition.short_name, "Composition"])
+        item.setData(0, _UR, composition)
+        item.setData(0, _UR1, composition)
+        self._register_item(item, composition)
+        if composition.component_types:
+            self._defer_children(item, partial(self._build_composition_component_items, composition))
+        return item
+    
+    def _build_composition_component_items(self, composition: Composition) -> list:
+        """Build the component type items of a composition"""
+        children = []
         for component_type in composition.component_types:
-            comp_item = QTreeWidgetItem(item)
-            comp_item.setText(0, component_type.short_name)
-            comp_item.setText(1, component_type.category.value)
-            comp_item.setData(0, Qt.ItemDataRole.UserRole, component_type)
-            comp_item.setData(0, Qt.ItemDataRole.UserRole + 1, component_type)
-    
-    def _add_port_interface_item(self, port_interface: PortInterface):
-        """Add port interface to tree"""
-        item = QTreeWidgetItem(self.port_interfaces_item)
-        item.setText(0, port_interface.short_name)
-        item.setText(1, "Port Interface")
-        item.setData(0, Qt.ItemDataRole.UserRole, port_interface)
-        item.setData(0, Qt.ItemDataRole.UserRole + 1, port_interface)
-
-        # Add data elements as children
+            comp_item = QTreeWidgetItem([component_type.short_name, _CATEGORY_LABELS[component_type.category]])
+            comp_item.setData(0, _UR, component_type)
+            comp_item.setData(0, _UR1, component_type)
+            self._register_item(comp_item, component_type)
+            children.append(comp_item)
+        return children
+    
+    def _add_port_interface_item(self, port_interface: PortInterface) -> QTreeWidgetItem:
+        """Build the (detached) tree item for a port interface"""
+        item = QTreeWidgetItem([port_interface.short_name, "Port Interface"])
+        item.setData(0, _UR, port_interface)
+        item.setData(0, _UR1, port_interface)
+        self._register_item(item, port_interface)
+        if port_interface.data_elements:
+            self._defer_children(item, partial(self._build_data_element_items, port_interface))
+        return item
+    
+    def _build_data_element_items(self, port_interface: PortInterface) -> list:
+        """Build the data element items of a port interface"""
+        children = []
         for data_element in port_interface.data_elements:
-            data_item = QTreeWidgetItem(item)
-            data_item.setText(0, data_element.short_name)
-            data_item.setText(1, data_element.data_type.value)
-            data_item.setData(0, Qt.ItemDataRole.UserRole, data_element)
-            data_item.setData(0, Qt.ItemDataRole.UserRole + 1, data_element)
-    
-    def _add_service_interface_item(self, service_interface):
-        """Add service interface to tree"""
-        item = QTreeWidgetItem(self.service_interfaces_item)
-        item.setText(0, service_interface.short_name)
-        item.setText(1, "Service Interface")
-        item.setData(0, Qt.ItemDataRole.UserRole, service_interface)
-        item.setData(0, Qt.ItemDataRole.UserRole + 1, service_interface)
-    
-    def _add_ecuc_element_item(self, ecuc_element: dict):
-        """Add ECUC element to tree"""
+            data_item = QTreeWidgetItem([data_element.short_name, _DATA_TYPE_LABELS[data_element.data_type]])
+            data_item.setData(0, _UR, data_element)
+            data_item.setData(0, _UR1, data_element)
+            self._register_item(data_item, data_element)
+            children.append(data_item)
+        return children
+    
+    def _add_service_interface_item(self, service_interface) -> QTreeWidgetItem:
+        """Build the (detached) tree item for a service interface"""
+        item = QTreeWidgetItem([service_interface.short_name, "Service Interface"])
+        item.setData(0, _UR, service_interface)
+        item.setData(0, _UR1, service_interface)
+        self._register_item(item, service_interface)
+        return item
+    
+    def _add_ecuc_element_item(self, ecuc_element: dict) -> QTreeWidgetItem:
+        """Build the (detached) tree item for an ECUC element"""
         # Use the exact element instance passed to us to ensure proper matching
         # The canonicalization logic was causing issues with element identity matching
 
-        item = QTreeWidgetItem(self.ecuc_elements_item)
         short = ecuc_element.get('short_name', '<no-short-name>')
         typ = ecuc_element.get('type', '<no-type>')
-        item.setText(0, short)
-        item.setText(1, typ)
+        item = QTreeWidgetItem([short, typ])
         # Store the element ID instead of the element itself to avoid Qt copying issues
         element_id = id(ecuc_element)
-        item.setData(0, Qt.ItemDataRole.UserRole, element_id)
-        item.setData(0, Qt.ItemDataRole.UserRole + 1, element_id)
+        item.setData(0, _UR, element_id)
+        item.setData(0, _UR1, element_id)
+        self._register_item(item, ecuc_element)
 
         # Debug: log creation (can be removed in production)
         # print(f"[TreeNavigator] add_ecuc_element id={id(ecuc_element)} short_name='{short}' type='{typ}' containers={len(ecuc_element.get('containers', []))} parameters={len(ecuc_element.get('parameters', []))}")
 
-        # Add containers (recursively) as children
-        for container in ecuc_element.get('containers', []):
-            self._add_ecuc_container_item(item, container, depth=1)
-
-    def _add_ecuc_container_item(self, parent_item: QTreeWidgetItem, container: dict, depth: int = 0):
-        """Recursively add an ECUC container and its contents to parent_item"""
-        # Canonicalize container instance to the document-owned dict where possible
-        try:
-            doc = getattr(self.app, 'current_document', None)
-            if doc:
-                for doc_elem in doc.ecuc_elements:
-                    # search for the container inside each top-level element
-                    if doc_elem is container:
-                        container = doc_elem
-                        break
-                    found = self._find_dict_in(doc_elem, container)
-                    if found is not None:
-                        container = found
-                        break
-        except Exception:
-            pass
+        # Containers are built when the element is expanded
+        containers = ecuc_element.get('containers', [])
+        if containers:
+            self._defer_children(item, lambda: [self._add_ecuc_container_item(container, depth=1)
+                                                for container in containers])
+        return item
 
-        container_item = QTreeWidgetItem(parent_item)
+    def _add_ecuc_container_item(self, container: dict, depth: int = 0) -> QTreeWidgetItem:
+        """Recursively build the (detached) tree item for an ECUC container and its contents"""
+        # The tree walks the document's own dicts, so no canonicalization is needed here
         short = container.get('short_name', '<no-short-name>')
         typ = container.get('type', 'ECUC-CONTAINER-VALUE')
-        container_item.setText(0, short)
-        container_item.setText(1, typ)
+        container_item = QTreeWidgetItem([short, typ])
         # Store container ID instead of object for consistency with main elements
         container_id = id(container)
-        container_item.setData(0, Qt.ItemDataRole.UserRole, container_id)
-        container_item.setData(0, Qt.ItemDataRole.UserRole + 1, container_id)
+        container_item.setData(0, _UR, container_id)
+        container_item.setData(0, _UR1, container_id)
+        self._register_item(container_item, container)
 
         # Debug: log creation with depth
         try:
@@ -312,29 +502,32 @@ class TreeNavigator(QTreeWidget):
         except Exception:
             pass
 
+        # Nested containers, parameters and groups are built when the container is expanded
+        if self._has_ecuc_children(container):
+            self._defer_children(container_item, partial(self._build_ecuc_container_children, container, depth))
+        return container_item
+
+    def _has_ecuc_children(self, container: dict) -> bool:
+        """Whether a container has nested containers, parameters or grouped child dicts"""
+        if container.get('containers') or container.get('parameters'):
+            return True
+        return any(isinstance(val, list) and val and isinstance(val[0], dict)
+                   for key, val in container.items() if key not in _ECUC_NON_CHILD_KEYS)
+
+    def _build_ecuc_container_children(self, container: dict, depth: int) -> list:
+        """Build the child items (nested containers, parameters, groups) of a container"""
         # Add nested containers recursively
+        children = []
         for nested in container.get('containers', []):
-            # Pass nested through the same canonicalization when adding
-            self._add_ecuc_container_item(container_item, nested, depth=depth+1)
+            children.append(self._add_ecuc_container_item(nested, depth=depth+1))
 
         # Add parameters as children of this container
         for param in container.get('parameters', []):
-            param_item = QTreeWidgetItem(container_item)
-            param_item.setText(0, param.get('short_name', ''))
-            param_item.setText(1, param.get('type', 'ECUC-PARAMETER-VALUE'))
-            # Canonicalize parameter dicts as well
-            try:
-                doc = getattr(self.app, 'current_document', None)
-                if doc:
-                    for doc_elem in doc.ecuc_elements:
-                        found = self._find_dict_in(doc_elem, param)
-                        if found is not None:
-                            param = found
-                            break
-            except Exception:
-                pass
-            param_item.setData(0, Qt.ItemDataRole.UserRole, param)
-            param_item.setData(0, Qt.ItemDataRole.UserRole + 1, param)
+            param_item = QTreeWidgetItem([param.get('short_name', ''), param.get('type', 'ECUC-PARAMETER-VALUE')])
+            param_item.setData(0, _UR, param)
+            param_item.setData(0, _UR1, param)
+            self._register_item(param_item, param)
+            children.append(param_item)
             try:
                 print(f"[TreeNavigator] {'  '*(depth+1)}add_param depth={depth+1} id={id(param)} short_name='{param.get('short_name')}' type='{param.get('type')}'")
             except Exception:
@@ -342,130 +535,33 @@ class TreeNavigator(QTreeWidget):
         
         # Also handle any other list-valued child keys that may contain dict children
         for key, val in container.items():
-            if key in ('short_name', 'type', 'definition_ref', 'parameters', 'containers', 'admin_data'):
+            if key in _ECUC_NON_CHILD_KEYS:
                 continue
             if isinstance(val, list) and val and isinstance(val[0], dict):
                 # Add a grouping node for this key
-                group_item = QTreeWidgetItem(container_item)
-                group_item.setText(0, key)
-                group_item.setText(1, 'group')
-                group_item.setData(0, Qt.ItemDataRole.UserRole, key)
+                group_item = QTreeWidgetItem([key, 'group'])
+                group_item.setData(0, _UR, key)
+                group_children = []
                 for child in val:
                     # If child looks like a container, recurse, else add as param-like
                     if isinstance(child, dict) and 'short_name' in child:
-                        # Attempt to canonicalize this child to the document instance
-                        try:
-                            doc = getattr(self.app, 'current_document', None)
-                            if doc:
-                                for doc_elem in doc.ecuc_elements:
-                                    found = self._find_dict_in(doc_elem, child)
-                                    if found is not None:
-                                        child = found
-                                        break
-                        except Exception:
-                            pass
-
-                        if child.get('type', '').endswith('CONTAINER') or child.get('type', '').endswith('CONTAINER-VALUE'):
-                            self._add_ecuc_container_item(group_item, child)
+                        child_type = child.get('type', '')
+                        if child_type.endswith(('CONTAINER', 'CONTAINER-VALUE')):
+                            group_children.append(self._add_ecuc_container_item(child))
                         else:
-                            child_item = QTreeWidgetItem(group_item)
-                            child_item.setText(0, child.get('short_name', ''))
-                            child_item.setText(1, child.get('type', 'ECUC-CHILD'))
-                            child_item.setData(0, Qt.ItemDataRole.UserRole, child)
-                            child_item.setData(0, Qt.ItemDataRole.UserRole + 1, child)
-
-    def _find_element_by_id(self, container: dict, target_id: int):
-        """Recursively search for element with target_id inside container"""
-        # Identity match
-        if id(container) == target_id:
-            return container
-
-        # Search direct values
-        for key, val in container.items():
-            if id(val) == target_id:
-                return val
-            if isinstance(val, dict):
-                found = self._find_element_by_id(val, target_id)
-                if found is not None:
-                    return found
-            elif isinstance(val, list):
-                for item in val:
-                    if id(item) == target_id:
-                        return item
-                    if isinstance(item, dict):
-                        found = self._find_element_by_id(item, target_id)
-                        if found is not None:
-                            return found
-        return None
+                            child_item = QTreeWidgetItem([child['short_name'], child.get('type', 'ECUC-CHILD')])
+                            child_item.setData(0, _UR, child)
+                            child_item.setData(0, _UR1, child)
+                            self._register_item(child_item, child)
+                            group_children.append(child_item)
+                group_item.addChildren(group_children)
+                children.append(group_item)
 
-    def _find_dict_in(self, container: dict, target: dict):
-        """Recursively search for target dict inside container; return the found dict or None.
-
-        This mirrors the search used in the PropertyEditor so the tree can resolve
-        transient dicts to the authoritative instances stored in the document.
-        """
-        # Identity match
-        if container is target:
-            return container
-
-        # Search direct values
-        for key, val in container.items():
-            if val is target:
-                return val
-            if isinstance(val, dict):
-                found = self._find_dict_in(val, target)
-                if found is not None:
-                    return found
-            elif isinstance(val, list):
-                for item in val:
-                    if item is target:
-                        return item
-                    if isinstance(item, dict):
-                        found = self._find_dict_in(item, target)
-                        if found is not None:
-                            return found
-
-        # Fallback shallow match by short_name/type
-        try:
-            tname = target.get('short_name')
-            ttype = target.get('type')
-            if tname:
-                for key, val in container.items():
-                    if isinstance(val, list):
-                        for item in val:
-                            if isinstance(item, dict) and item.get('short_name') == tname and item.get('type') == ttype:
-                                return item
-        except Exception:
-            pass
+        return children
 
-        return None
-    
     def find_tree_item_by_element(self, element):
         """Find tree item that corresponds to the given element"""
-        element_id = id(element)
-        
-        def search_item(item):
-            # Check both UserRole and UserRole+1 data for our element ID
-            item_data = item.data(0, Qt.ItemDataRole.UserRole)
-            item_data_alt = item.data(0, Qt.ItemDataRole.UserRole + 1)
-            
-            # Check if stored ID matches our element ID
-            if item_data == element_id or item_data_alt == element_id:
-                return item
-            
-            # Search children recursively
-            for i in range(item.childCount()):
-                child_result = search_item(item.child(i))
-                if child_result:
-                    return child_result
-            return None
-        
-        # Search all top-level items
-        for i in range(self.topLevelItemCount()):
-            result = search_item(self.topLevelItem(i))
-            if result:
-                return result
-        return None
+        return self._item_by_id.get(id(element))
     
     def update_element_name_in_tree(self, element, new_name):
         """Update the display name of an element in the tree"""
@@ -484,165 +580,46 @@ class TreeNavigator(QTreeWidget):
         """Handle selection changed and emit the latest model object"""
         current_item = self.currentItem()
         if not current_item:
+            self._last_selected_id = None
+            return
+        # itemSelectionChanged fires several times per click; emit once per element
+        element_id = current_item.data(0, _UR_ID)
+        if element_id is None or element_id == self._last_selected_id:
             return
-        # Get the element ID stored in the tree item
-        item_data = current_item.data(0, Qt.ItemDataRole.UserRole)
-        item_data_alt = current_item.data(0, Qt.ItemDataRole.UserRole + 1)
-
-        element_id = item_data_alt if item_data_alt is not None else item_data
-
-        # Debug: show stored element ID (can be removed in production)
-        # print(f"[TreeNavigator] item data[UserRole] id={element_id} type={type(element_id).__name__}")
-
-        # Find the element by ID
-        emitted = None
-        if hasattr(self.app, 'current_document') and self.app.current_document:
-            for doc_elem in self.app.current_document.ecuc_elements:
-                if id(doc_elem) == element_id:
-                    emitted = doc_elem
-                    break
-                # Also search nested containers
-                found = self._find_element_by_id(doc_elem, element_id)
-                if found is not None:
-                    emitted = found
-                    break
 
-        if emitted is not None:
-            # Debug: show emitted element (can be removed in production)
-            # try:
-            #     if isinstance(emitted, dict):
-            #         print(f"[TreeNavigator] emitting id={id(emitted)} short_name='{emitted.get('short_name')}'")
-            #     else:
-            #         print(f"[TreeNavigator] emitting id={id(emitted)} type={type(emitted).__name__}")
-            # except Exception:
-            #     pass
-            self.element_selected.emit(emitted)
-        else:
-            # Debug: show error (can be removed in production)
-            # print(f"[TreeNavigator] Could not find element with ID {element_id}")
-            pass
+        # The index holds the document's own objects, never QVariant copies
+        element = self._element_by_id.get(element_id)
+        if isinstance(element, _SELECTABLE_TYPES):
+            self._last_selected_id = element_id
+            self.element_selected.emit(element)
     
     def _on_item_double_clicked(self, item, column):
         """Handle item double click"""
-        item_data = item.data(0, Qt.ItemDataRole.UserRole)
+        item_data = item.data(0, _UR)
         if isinstance(item_data, (SwComponentType, Composition, PortInterface, PortPrototype)):
             self.element_double_clicked.emit(item_data)
     
     def update_item_text(self, element, new_short_name):
         """Update the tree item text when an element's short_name changes"""
-        # Find the item that contains this element
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            if self._update_item_recursive(item, element, new_short_name):
-                return True
-        return False
-    
-    def _update_item_recursive(self, item, element, new_short_name):
-        """Recursively update item text"""
-        if not item:
-            return False
-        
-        item_data = item.data(0, Qt.ItemDataRole.UserRole)
-        
-        # Check if this is the element we're looking for
-        if isinstance(item_data, dict) and item_data is element:
-            item.setText(0, new_short_name)
-            return True
-        
-        # Check children
-        for i in range(item.childCount()):
-            if self._update_item_recursive(item.child(i), element, new_short_name):
-                return True
-        
-        return False
+        return self.update_element_name_in_tree(element, new_short_name)
     
     def _add_application_component(self):
         """Add application component type"""
-        from ...core.models.autosar_elements import ApplicationSwComponentType
         component = ApplicationSwComponentType(short_name="NewApplicationComponent")
         self.app.current_document.add_sw_component_type(component)
-        self.refresh()
     
     def _add_atomic_component(self):
         """Add atomic component type"""
-        from ...core.models.autosar_elements import AtomicSwComponentType
         component = AtomicSwComponentType(short_name="NewAtomicComponent")
         self.app.current_document.add_sw_component_type(component)
-        self.refresh()
     
     def _add_composition_component(self):
         """Add composition component type"""
-        from ...core.models.autosar_elements import CompositionSwComponentType
         component = CompositionSwComponentType(short_name="NewCompositionComponent")
         self.app.current_document.add_sw_component_type(component)
-        self.refresh()
-    
-    def _add_composition(self):
-        """Add composition"""
-        from ...core.models.autosar_elements import Composition
-        composition = Composition(short_name="NewComposition")
-        self.app.current_document.add_composition(composition)
-        self.refresh()
-    
-    def _add_port_interface(self):
-        """Add port interface"""
-        from ...core.models.autosar_elements import PortInterface
-        port_interface = PortInterface(short_name="NewPortInterface")
-        self.app.current_document.add_port_interface(port_interface)
-        self.refresh()
-    
-    def _add_service_interface(self):
-        """Add service interface"""
-        from ...core.models.autosar_elements import ServiceInterface
-        service_interface = ServiceInterface(short_name="NewServiceInterface")
-        self.app.current_document.add_service_interface(service_interface)
-        self.refresh()
-    
-    def contextMenuEvent(self, event):
-        """Handle context menu event"""
-        item = self.itemAt(event.position().toPoint())
-        if not item:
-            return
-        
-        menu = QMenu(self)
-        
-        # Get element data
-        element_data = item.data(0, Qt.ItemDataRole.UserRole)
-        element = item.data(0, Qt.ItemDataRole.UserRole + 1)
-        
-        if element_data == "sw_component_types":
-            # Add new component type
-            add_action = QAction("Add Component Type", self)
-            add_action.triggered.connect(self._add_component_type)
-            menu.addAction(add_action)
-        elif element_data == "compositions":
-            # Add new composition
-            add_action = QAction("Add Composition", self)
-            add_action.triggered.connect(self._add_composition)
-            menu.addAction(add_action)
-        elif element_data == "port_interfaces":
-            # Add new port interface
-            add_action = QAction("Add Port Interface", self)
-            add_action.triggered.connect(self._add_port_interface)
-            menu.addAction(add_action)
-        elif element_data == "service_interfaces":
-            # Add new service interface
-            add_action = QAction("Add Service Interface", self)
-            add_action.triggered.connect(self._add_service_interface)
-            menu.addAction(add_action)
-        elif element and hasattr(element, 'short_name'):
-            # Delete existing element
-            delete_action = QAction("Delete", self)
-            delete_action.triggered.connect(lambda: self._delete_element(element))
-            menu.addAction(delete_action)
-        
-        if menu.actions():
-            menu.exec(self.mapToGlobal(event.position().toPoint()))
     
     def _add_component_type(self):
         """Add new component type"""
-        from ...core.models.autosar_elements import ApplicationSwComponentType, SwComponentTypeCategory
-        
         # Create new component type
         new_component = ApplicationSwComponentType(
             short_name="NewComponent",
@@ -652,15 +629,12 @@ class TreeNavigator(QTreeWidget):
         
         # Add to document
         self.app.current_document.add_sw_component_type(new_component)
-        self.refresh()
         
         # Select the new item
         self._select_element(new_component)
     
     def _add_composition(self):
         """Add new composition"""
-        from ...core.models.autosar_elements import Composition
-        
         # Create new composition
         new_composition = Composition(
             short_name="NewComposition",
@@ -669,15 +643,12 @@ class TreeNavigator(QTreeWidget):
         
         # Add to document
         self.app.current_document.add_composition(new_composition)
-        self.refresh()
         
         # Select the new item
         self._select_element(new_composition)
     
     def _add_port_interface(self):
         """Add new port interface"""
-        from ...core.models.autosar_elements import PortInterface
-        
         # Create new port interface
         new_interface = PortInterface(
             short_name="NewInterface",
@@ -687,15 +658,12 @@ class TreeNavigator(QTreeWidget):
         
         # Add to document
         self.app.current_document.add_port_interface(new_interface)
-        self.refresh()
         
         # Select the new item
         self._select_element(new_interface)
     
     def _add_service_interface(self):
         """Add new service interface"""
-        from ...core.models.autosar_elements import ServiceInterface
-        
         # Create new service interface
         new_interface = ServiceInterface(
             short_name="NewServiceInterface",
@@ -704,30 +672,15 @@ class TreeNavigator(QTreeWidget):
         
         # Add to document
         self.app.current_document.add_service_interface(new_interface)
-        self.refresh()
         
         # Select the new item
         self._select_element(new_interface)
     
     def _select_element(self, element):
         """Select an element in the tree"""
-        # Find and select the item corresponding to the element
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            if self._find_element_in_item(item, element):
-                self.setCurrentItem(item)
-                break
-    
-    def _find_element_in_item(self, item, element):
-        """Find element in item hierarchy"""
-        if item.data(0, Qt.ItemDataRole.UserRole + 1) == element:
-            return True
-        
-        for i in range(item.childCount()):
-            if self._find_element_in_item(item.child(i), element):
-                return True
-        
-        return False
+        item = self._item_by_id.get(id(element))
+        if item is not None:
+            self.setCurrentItem(item)
     
     def _delete_element(self, element):
         """Delete element with confirmation and children warning"""
@@ -779,54 +732,11 @@ class TreeNavigator(QTreeWidget):
                 self.app.current_document.remove_port_interface(element)
             elif isinstance(element, ServiceInterface):
                 self.app.current_document.remove_service_interface(element)
-            
-            self.refresh()
-    
-    def dragEnterEvent(self, event):
-        """Handle drag enter event"""
-        if event.source() == self:
-            event.accept()
-        else:
-            event.ignore()
-    
-    def dropEvent(self, event):
-        """Handle drop event"""
-        if event.source() != self:
-            event.ignore()
-            return
-        
-        # Get the dragged item
-        dragged_item = self.currentItem()
-        if not dragged_item:
-            event.ignore()
-            return
-        
-        # Get the target item
-        target_item = self.itemAt(event.position().toPoint())
-        if not target_item:
-            event.ignore()
-            return
-        
-        # Get the dragged element
-        dragged_element = dragged_item.data(0, Qt.ItemDataRole.UserRole + 1)
-        if not dragged_element:
-            event.ignore()
-            return
-        
-        # Get target item data
-        target_data = target_item.data(0, Qt.ItemDataRole.UserRole)
-        
-        # Only allow moving elements within the same category or to a different category
-        if self._can_move_element(dragged_element, target_data):
-            self._move_element(dragged_element, target_data)
-            event.accept()
-        else:
-            event.ignore()
     
     def _can_move_element(self, element, target_data):
         """Check if element can be moved to target"""
-        # Allow moving elements to category roots
-        if target_data in ["sw_component_types", "compositions", "port_interfaces", "service_interfaces"]:
+        # Allow moving elements to category roots (ECUC dicts are unhashable, so check str first)
+        if isinstance(target_data, str) and target_data in _DROP_CATEGORIES:
             return True
         
         # Allow moving elements to other elements of the same type
@@ -870,8 +780,8 @@ class TreeNavigator(QTreeWidget):
                 # Check if we can move to this location
                 dragged_item = self.currentItem()
                 if dragged_item:
-                    dragged_element = dragged_item.data(0, Qt.ItemDataRole.UserRole)
-                    target_element = item.data(0, Qt.ItemDataRole.UserRole)
+                    dragged_element = dragged_item.data(0, _UR)
+                    target_element = item.data(0, _UR)
                     
                     if self._can_move_element(dragged_element, target_element):
                         event.acceptProposedAction()
@@ -900,8 +810,8 @@ class TreeNavigator(QTreeWidget):
                 return
             
             # Get elements
-            dragged_element = dragged_item.data(0, Qt.ItemDataRole.UserRole)
-            target_element = target_item.data(0, Qt.ItemDataRole.UserRole)
+            dragged_element = dragged_item.data(0, _UR)
+            target_element = target_item.data(0, _UR)
             
             # Check if move is allowed
             if self._can_move_element(dragged_element, target_element):
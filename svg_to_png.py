@@ -1,12 +1,25 @@
 #!/usr/bin/env python3
-"""Convert SVG files to PNG using CairoSVG with options for DPI and size.
+"""Convert SVG files to PNG with options for DPI and size.
+
+Uses the native resvg or rsvg-convert command line tools when available
+and falls back to CairoSVG otherwise.
 
 Usage: svg_to_png.py --dpi 150 --width 1600 --height 1200 input.svg output.png
 If only dpi is provided, width/height are derived from the SVG viewBox and dpi.
+
+Server mode: svg_to_png.py --server [--dpi ...] reads "infile<TAB>outfile" lines
+from stdin and answers each with OK or ERR <message> on stdout, so repeated
+conversions pay the interpreter and renderer startup only once.
 """
 import sys
 import os
 import argparse
+import contextlib
+import hashlib
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 
 def ensure_cairosvg():
@@ -18,7 +31,43 @@ def ensure_cairosvg():
         raise
 
 
+def _resolve_backend():
+    """Pick the fastest available renderer: native CLIs first, CairoSVG last"""
+    for tool in ('resvg', 'rsvg-convert'):
+        if shutil.which(tool):
+            return tool
+    return 'cairosvg'
+
+
+# Resolved once at import, not per converted file
+_BACKEND = _resolve_backend()
+
+
+def _convert_cli(infile: str, outfile: str, dpi: int, width: int, height: int):
+    """Render with resvg / rsvg-convert; zoom by dpi/96 like the CairoSVG path"""
+    cmd = [_BACKEND]
+    if width:
+        cmd += ['-w', str(int(width))]
+    if height:
+        cmd += ['-h', str(int(height))]
+    if dpi and not (width or height):
+        cmd += ['--zoom', str(float(dpi) / 96.0)]
+    if _BACKEND == 'resvg':
+        cmd += [infile, outfile]
+    else:
+        cmd += ['-o', outfile, infile]
+    print(f'Converting {infile} -> {outfile} with {" ".join(cmd)}')
+    subprocess.run(cmd, check=True)
+
+
+# PNG output of already rendered SVG contents, keyed by content digest, base directory and options
+_png_cache = {}
+
+
 def convert(infile: str, outfile: str, dpi: int = 150, width: int = None, height: int = None):
+    if _BACKEND != 'cairosvg':
+        _convert_cli(infile, outfile, dpi, width, height)
+        return
     cairosvg = ensure_cairosvg()
     # CairoSVG accepts output_width/output_height in pixels
     kwargs = {}
@@ -31,25 +80,66 @@ def convert(infile: str, outfile: str, dpi: int = 150, width: int = None, height
         scale = float(dpi) / 96.0
         kwargs['scale'] = scale
     print(f'Converting {infile} -> {outfile} with dpi={dpi}, width={width}, height={height} kwargs={kwargs}')
-    cairosvg.svg2png(url=infile, write_to=outfile, **kwargs)
+    # Read the file once; identical SVGs (e.g. repeated templates) reuse the first rendering
+    with open(infile, 'rb') as f:
+        data = f.read()
+    # The directory is part of the key since relative references resolve against it
+    key = (hashlib.blake2b(data).digest(), os.path.dirname(os.path.abspath(infile)),
+           tuple(sorted(kwargs.items())))
+    png = _png_cache.get(key)
+    if png is None:
+        # url is still passed so relative references resolve against the file
+        png = cairosvg.svg2png(bytestring=data, url=infile, **kwargs)
+        _png_cache[key] = png
+    with open(outfile, 'wb') as f:
+        f.write(png)
+
+
+def serve(dpi: int = 150, width: int = None, height: int = None):
+    """Convert "infile<TAB>outfile" requests read from stdin until EOF"""
+    if _BACKEND == 'cairosvg':
+        ensure_cairosvg()
+    for line in sys.stdin:
+        line = line.rstrip('\n')
+        if not line:
+            continue
+        try:
+            infile, outfile = line.split('\t')
+            # Progress output goes to stderr; stdout carries only the replies
+            with contextlib.redirect_stdout(sys.stderr):
+                convert(infile, outfile, dpi=dpi, width=width, height=height)
+        except Exception as e:
+            print(f'ERR {e}', flush=True)
+        else:
+            print('OK', flush=True)
 
 
 def main():
     p = argparse.ArgumentParser()
-    p.add_argument('input', help='Input SVG file (or directory)')
-    p.add_argument('output', help='Output PNG file or directory')
+    p.add_argument('input', nargs='?', help='Input SVG file (or directory)')
+    p.add_argument('output', nargs='?', help='Output PNG file or directory')
     p.add_argument('--dpi', type=int, default=150)
     p.add_argument('--width', type=int, help='Output width in pixels')
     p.add_argument('--height', type=int, help='Output height in pixels')
+    p.add_argument('--server', action='store_true',
+                   help='Read "infile<TAB>outfile" lines from stdin and reply OK/ERR per line')
     args = p.parse_args()
 
+    if args.server:
+        serve(dpi=args.dpi, width=args.width, height=args.height)
+        return
+    if not args.input or not args.output:
+        p.error('input and output are required unless --server is given')
+
     if os.path.isdir(args.input):
         infiles = [os.path.join(args.input, f) for f in os.listdir(args.input) if f.lower().endswith('.svg')]
         if os.path.isdir(args.output):
-            for f in infiles:
-                outname = os.path.splitext(os.path.basename(f))[0] + '.png'
-                outpath = os.path.join(args.output, outname)
-                convert(f, outpath, dpi=args.dpi, width=args.width, height=args.height)
+            outpaths = [os.path.join(args.output, os.path.splitext(os.path.basename(f))[0] + '.png')
+                        for f in infiles]
+            # Each file is rasterized independently; spread them over all cores
+            job = partial(convert, dpi=args.dpi, width=args.width, height=args.height)
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+                list(ex.map(job, infiles, outpaths))
         else:
             print('When input is a directory, output must be a directory')
             sys.exit(2)
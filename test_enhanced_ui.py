@@ -7,16 +7,14 @@ Test script for the enhanced ARXML Editor UI features:
 
 import sys
 import os
-from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtCore import QTimer
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from factory import ARXMLEditorFactory
+import traceback
 
 def test_enhanced_ui():
     """Test the enhanced UI features"""
+    # Qt and the factory are only imported when the test actually runs
+    from PyQt6.QtWidgets import QApplication, QMessageBox
+    from PyQt6.QtCore import QTimer
+    from src.factory import ARXMLEditorFactory
     
     # Create application
     app_qt = QApplication(sys.argv)
@@ -28,18 +26,24 @@ def test_enhanced_ui():
     
     main_window.show()
     
+    # Without a terminal (e.g. CI) load the sample right away and exit instead
+    # of waiting for the user
+    interactive = sys.stdout.isatty() and not os.environ.get('CI')
+    
     # Test auto-loading a sample ARXML file after a short delay
     def auto_load_sample():
         sample_files = ['sample.arxml', 'haytham.arxml', 'master.arxml']
+        # One directory read instead of a stat call per candidate
+        present = {entry.name for entry in os.scandir('.') if entry.is_file()}
         for sample_file in sample_files:
-            if os.path.exists(sample_file):
+            if sample_file in present:
                 print(f"Auto-loading sample file: {sample_file}")
                 if app.load_document(sample_file):
                     main_window.status_bar.showMessage(f"Auto-loaded: {sample_file}")
                     break
     
     # Schedule auto-load after 2 seconds
-    QTimer.singleShot(2000, auto_load_sample)
+    QTimer.singleShot(2000 if interactive else 0, auto_load_sample)
     
     # Show information about enhanced features
     def show_features_info():
@@ -74,7 +78,10 @@ To test these features:
         QMessageBox.information(main_window, "Enhanced UI Features", info_text)
     
     # Show features info after 3 seconds
-    QTimer.singleShot(3000, show_features_info)
+    if interactive:
+        QTimer.singleShot(3000, show_features_info)
+    else:
+        QTimer.singleShot(100, app_qt.quit)
     
     # Run the application
     return app_qt.exec()
@@ -84,6 +91,5 @@ if __name__ == "__main__":
         sys.exit(test_enhanced_ui())
     except Exception as e:
         print(f"Error running enhanced UI test: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
\ No newline at end of file
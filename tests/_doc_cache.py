@@ -0,0 +1,47 @@
+"""
+Parse cache for tests that load the same ARXML file many times
+
+load_cached() behaves like ARXMLEditorApp.load_document() but parses each file
+only once per modification time and size; every call still gets its own document.
+
+The cache is per process only. A pickled copy of a large stdlib tree loads
+slower than expat re-parses the file, so nothing is kept on disk.
+"""
+
+import copy
+import os
+from functools import lru_cache
+from src.core.application import ARXMLEditorApp
+from src.core.models.arxml_document import ARXMLDocument
+
+
+@lru_cache(maxsize=8)
+def _parse(path, mtime_ns, size):
+    """Parse path once; returns (root element, detected schema version) or None"""
+    parsing_app = ARXMLEditorApp()
+    root = parsing_app.arxml_parser.parse_arxml_file(path)
+    if root is None:
+        return None
+    return root, parsing_app.schema_service.detected_version
+
+
+def load_cached(arxml_app, path):
+    """Load path into arxml_app from the parse cache; returns True on success"""
+    if not os.path.exists(path):
+        print(f"Error: File not found: {path}")
+        return False
+    # Size guards against rewrites that land within the file system's mtime resolution
+    stat = os.stat(path)
+    parsed = _parse(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if parsed is None:
+        return False
+    root, version = parsed
+    if version:
+        arxml_app.set_schema_version(version)
+
+    document = ARXMLDocument()
+    document.load_from_element(copy.deepcopy(root), arxml_app.arxml_parser)
+    arxml_app.validation_service.validate_document(document)
+    arxml_app._current_document = document
+    arxml_app.document_changed.emit()
+    return True
@@ -0,0 +1,27 @@
+"""
+File access recorder for tests that must stay in memory
+
+with recorded_file_opens() as opened: ... collects the path of every file the
+block opens through open() or io.open(); the files are still opened normally.
+"""
+
+import builtins
+import io
+from contextlib import contextmanager
+
+
+@contextmanager
+def recorded_file_opens():
+    """Record the files opened inside the block in the yielded list"""
+    opened = []
+    real_open = builtins.open
+
+    def recording_open(file, *args, **kwargs):
+        opened.append(file)
+        return real_open(file, *args, **kwargs)
+
+    builtins.open = io.open = recording_open
+    try:
+        yield opened
+    finally:
+        builtins.open = io.open = real_open
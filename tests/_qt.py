@@ -0,0 +1,28 @@
+"""
+Shared QApplication for the UI tests
+"""
+
+import sys
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QEvent
+
+
+# Held for the whole run: a QApplication that only a test's local refers to is
+# collected with it, and destroying it takes the next tests' QObjects down too
+_app = None
+
+
+def qapp():
+    """Return the process-wide QApplication, creating it on first use"""
+    global _app
+    if _app is None:
+        _app = QApplication.instance() or QApplication(sys.argv)
+    return _app
+
+
+def dispose(*widgets):
+    """Destroy the widgets now, while the QApplication is still alive; None entries are skipped"""
+    for widget in widgets:
+        if widget is not None:
+            widget.deleteLater()
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
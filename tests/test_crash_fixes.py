@@ -3,12 +3,12 @@
 Test the crash fixes for nested container elements
 """
 
-import sys
-from PyQt6.QtWidgets import QApplication
 from src.ui.views.tree_navigator import TreeNavigator
 from src.ui.views.property_editor import PropertyEditor
 from src.ui.main_window import MainWindow
 from src.core.application import ARXMLEditorApp
+from tests._qt import qapp
+from tests._doc_cache import load_cached
 
 def test_nested_container_crash_fix():
     """Test that nested container editing doesn't crash"""
@@ -17,9 +17,7 @@ def test_nested_container_crash_fix():
     print("=" * 80)
     
     # Create Qt application
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
+    app = qapp()
     
     try:
         # Create main window (which creates its own ARXMLEditorApp)
@@ -33,7 +31,7 @@ def test_nested_container_crash_fix():
         # Load document to test tree functionality
         ecuc_file = "Backup/ECUC/FCA_mPAD_Safety_Can_Can_ecuc.arxml"
         print(f"Loading: {ecuc_file}")
-        main_window.app.load_document(ecuc_file)
+        load_cached(main_window.app, ecuc_file)
         main_window.tree_navigator.refresh()
         
         if not main_window.app.current_document or not main_window.app.current_document.ecuc_elements:
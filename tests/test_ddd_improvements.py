@@ -8,6 +8,13 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+def _make_components(*names, category=None):
+    """Build one SwComponentType per name, sharing a single category (APPLICATION by default)"""
+    from src.core.models.autosar_elements import SwComponentType, SwComponentTypeCategory
+    if category is None:
+        category = SwComponentTypeCategory.APPLICATION
+    return [SwComponentType(name, category) for name in names]
+
 def test_aggregate_boundaries():
     """Test strengthened aggregate boundaries"""
     print("=" * 60)
@@ -54,6 +61,15 @@ def test_aggregate_boundaries():
         
         violations = doc.validate_document_consistency()
         assert any("Duplicate name" in v for v in violations)
+        
+        # Test orphaned interface reference detection
+        from src.core.models.autosar_elements import PortPrototype, PortType
+        comp1.ports.append(PortPrototype("Port1", PortType.REQUIRER, interface_ref="MissingInterface"))
+        comp1.ports.append(PortPrototype("Port2", PortType.PROVIDER, interface_ref="KnownInterface"))
+        doc.add_port_interface(PortInterface("KnownInterface"))
+        violations = doc.validate_document_consistency()
+        assert any("non-existent interface 'MissingInterface'" in v for v in violations)
+        assert not any("'KnownInterface'" in v for v in violations)
         print("✅ Document consistency validation working")
         
         return True
@@ -141,8 +157,7 @@ def test_enriched_domain_models():
         # Test 5: Composition business logic
         print("✓ Testing Composition business logic...")
         
-        comp1 = SwComponentType("Comp1", SwComponentTypeCategory.APPLICATION)
-        comp2 = SwComponentType("Comp2", SwComponentTypeCategory.APPLICATION)
+        comp1, comp2 = _make_components("Comp1", "Comp2")
         composition = Composition("TestComposition")
         
         assert composition.can_add_component_type(comp1)
@@ -232,8 +247,7 @@ def test_domain_invariants():
         print("✓ Testing composition invariants...")
         
         composition = Composition("TestComposition")
-        comp1 = SwComponentType("Comp1", SwComponentTypeCategory.APPLICATION)
-        comp2 = SwComponentType("Comp1", SwComponentTypeCategory.APPLICATION)  # Duplicate name
+        comp1, comp2 = _make_components("Comp1", "Comp1")  # Duplicate name
         
         composition.add_component_type(comp1)
         # Add duplicate directly to test validation (bypassing can_add_component_type check)
@@ -309,20 +323,40 @@ def test_business_operations():
         interface2.add_data_element(data2)
         
         assert interface1.is_compatible_with(interface2)
+        
+        # Same size but a differing name or type is incompatible
+        interface3 = PortInterface("Interface3", False)
+        interface3.add_data_element(DataElement("Data2", DataType.INTEGER))
+        interface4 = PortInterface("Interface4", False)
+        interface4.add_data_element(DataElement("Data1", DataType.FLOAT))
+        assert not interface1.is_compatible_with(interface3)
+        assert not interface1.is_compatible_with(interface4)
         print("✅ Interface compatibility working")
         
         # Test 5: Composition integrity
         print("✓ Testing composition integrity...")
         
         composition = Composition("TestComposition")
-        comp1 = SwComponentType("Comp1", SwComponentTypeCategory.APPLICATION)
-        comp2 = SwComponentType("Comp2", SwComponentTypeCategory.APPLICATION)
+        comp1, comp2 = _make_components("Comp1", "Comp2")
         
         composition.add_component_type(comp1)
         composition.add_component_type(comp2)
         
         assert composition.get_component_count() == 2
         assert composition.get_connection_count() == 0
+        
+        # Connections are resolved to their owning components
+        from src.core.models.autosar_elements import PortConnection
+        source = PortPrototype("Source", PortType.PROVIDER)
+        target = PortPrototype("Target", PortType.REQUIRER)
+        comp1.ports.append(source)
+        comp2.ports.append(target)
+        connection = PortConnection(source, target, "Conn1")
+        assert composition.add_connection(connection)
+        assert composition.get_connections_for_component(comp2) == [connection]
+        assert composition.validate_composition_integrity() == []
+        assert composition.remove_component_type(comp2)
+        assert composition.get_connection_count() == 0
         print("✅ Composition integrity working")
         
         return True
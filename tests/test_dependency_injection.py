@@ -5,201 +5,161 @@ Tests the new DI system while ensuring backward compatibility
 """
 
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-def test_di_container():
-    """Test dependency injection container functionality"""
-    print("=" * 60)
-    print("DEPENDENCY INJECTION SYSTEM TEST")
-    print("=" * 60)
-    
-    try:
-        # Test 1: Container Setup
-        print("✓ Testing container setup...")
-        from src.core.container import setup_container
+import functools
+from operator import attrgetter
+import traceback
+import logging
+
+_BAR = "=" * 60
+
+log = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=1)
+def _get_container():
+    """Build the DI container once and share it between tests"""
+    from src.core.container import setup_container
+    return setup_container()
+
+# Services an application exposes whether or not it was built with DI;
+# raises AttributeError naming the first one missing
+_app_services = attrgetter('validation_service', 'schema_service', 'command_service', 'arxml_parser')
+
+# Methods each service interface is expected to provide
+REQUIRED_METHODS = {
+    'ISchemaService': frozenset({'set_version', 'validate_arxml', 'detect_schema_version_from_file', 'get_available_versions'}),
+    'IValidationService': frozenset({'validate_document', 'validate_element', 'clear_issues'}),
+    'ICommandService': frozenset({'execute_command', 'undo', 'redo', 'can_undo', 'can_redo'}),
+    'IARXMLParser': frozenset({'parse_arxml_file', 'parse_sw_component_types', 'parse_port_interfaces'})
+}
+
+def _resolve_services():
+    """Resolve every interface in REQUIRED_METHODS from the shared container"""
+    from src.core import interfaces
+    
+    container = _get_container()
+    services = {name: container.get(getattr(interfaces, name)) for name in REQUIRED_METHODS}
+    return container, services
+
+def test_container_setup():
+    """Test that the container can be set up"""
+    from src.core.container import setup_container
+    assert setup_container() is not None
+
+def test_service_resolution():
+    """Test that every service interface resolves to an implementation"""
+    container, services = _resolve_services()
+    for name, service in services.items():
+        assert service is not None, name
+        log.debug("%s: %s", name, type(service).__name__)
+
+def test_singleton_services():
+    """Test that resolving a service twice returns the same instance"""
+    from src.core.interfaces import ISchemaService
+    container, services = _resolve_services()
+    assert container.get(ISchemaService) is services['ISchemaService']
+
+def test_containers_are_released():
+    """Test that a dropped container is freed with its services"""
+    import gc
+    import weakref
+    from src.core.container import setup_container
+    from src.core.application_services import IDocumentApplicationService
+    from src.core.domain_events.handlers import EventHandlerRegistry
+    refs = []
+    for _ in range(3):
         container = setup_container()
-        print("✅ Container setup successful")
-        
-        # Test 2: Service Registration
-        print("✓ Testing service registration...")
-        from src.core.interfaces import ISchemaService, IValidationService, ICommandService, IARXMLParser
-        
-        schema_service = container.get(ISchemaService)
-        validation_service = container.get(IValidationService)
-        command_service = container.get(ICommandService)
-        parser_service = container.get(IARXMLParser)
-        
-        print(f"   - Schema Service: {type(schema_service).__name__}")
-        print(f"   - Validation Service: {type(validation_service).__name__}")
-        print(f"   - Command Service: {type(command_service).__name__}")
-        print(f"   - Parser Service: {type(parser_service).__name__}")
-        print("✅ All services resolved successfully")
-        
-        # Test 3: Singleton Behavior
-        print("✓ Testing singleton behavior...")
-        schema_service2 = container.get(ISchemaService)
-        if schema_service is schema_service2:
-            print("✅ Singleton behavior working correctly")
-        else:
-            print("❌ Singleton behavior not working")
-            return False
-        
-        # Test 4: Service Interface Compliance
-        print("✓ Testing interface compliance...")
-        
-        # Check if services implement required methods
-        required_methods = {
-            ISchemaService: ['set_version', 'validate_arxml', 'detect_schema_version_from_file', 'get_available_versions'],
-            IValidationService: ['validate_document', 'validate_element', 'clear_issues'],
-            ICommandService: ['execute_command', 'undo', 'redo', 'can_undo', 'can_redo'],
-            IARXMLParser: ['parse_arxml_file', 'parse_sw_component_types', 'parse_port_interfaces']
-        }
-        
-        services = {
-            ISchemaService: schema_service,
-            IValidationService: validation_service,
-            ICommandService: command_service,
-            IARXMLParser: parser_service
-        }
-        
-        for interface, service in services.items():
-            missing_methods = []
-            for method_name in required_methods[interface]:
-                if not hasattr(service, method_name):
-                    missing_methods.append(method_name)
-            
-            if missing_methods:
-                print(f"❌ {interface.__name__} missing methods: {missing_methods}")
-                return False
-            else:
-                print(f"   - {interface.__name__}: All methods present ✓")
-        
-        print("✅ All services implement required interfaces")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Container test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+        container.get(IDocumentApplicationService)
+        container.get(EventHandlerRegistry)
+        refs.append(weakref.ref(container))
+    del container
+    gc.collect()
+    assert [ref for ref in refs if ref() is not None] == []
+
+def test_interface_compliance():
+    """Test that services implement the methods of their interface"""
+    container, services = _resolve_services()
+    service_attrs = {name: frozenset(dir(service)) for name, service in services.items()}
+    for name, methods in REQUIRED_METHODS.items():
+        missing_methods = methods - service_attrs[name]
+        assert not missing_methods, f"{name} missing methods: {sorted(missing_methods)}"
 
 def test_application_with_di():
     """Test application creation with dependency injection"""
-    print("\n✓ Testing application with DI...")
+    from src.core.application import ARXMLEditorApp
     
-    try:
-        from src.core.container import setup_container
-        from src.core.application import ARXMLEditorApp
-        
-        # Test with DI container
-        container = setup_container()
-        app_with_di = ARXMLEditorApp(container)
-        
-        # Verify services are injected
-        assert hasattr(app_with_di, 'validation_service')
-        assert hasattr(app_with_di, 'schema_service')
-        assert hasattr(app_with_di, 'command_service')
-        assert hasattr(app_with_di, 'arxml_parser')
-        
-        print("✅ Application with DI created successfully")
-        
-        # Test legacy mode (backward compatibility)
-        app_legacy = ARXMLEditorApp(None)
-        
-        # Verify services are still available
-        assert hasattr(app_legacy, 'validation_service')
-        assert hasattr(app_legacy, 'schema_service')
-        assert hasattr(app_legacy, 'command_service')
-        assert hasattr(app_legacy, 'arxml_parser')
-        
-        print("✅ Legacy application mode still works")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Application test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    # Test with DI container
+    container = _get_container()
+    app_with_di = ARXMLEditorApp(container)
+    
+    # Verify services are injected
+    _app_services(app_with_di)
+    
+    # Test legacy mode (backward compatibility)
+    app_legacy = ARXMLEditorApp(None)
+    
+    # Verify services are still available
+    _app_services(app_legacy)
 
 def test_factory():
     """Test factory methods"""
-    print("\n✓ Testing factory methods...")
-    
-    try:
-        from src.factory import ARXMLEditorFactory, create_arxml_editor
-        
-        # Test factory creation
-        app1 = ARXMLEditorFactory.create_application()
-        app2 = ARXMLEditorFactory.create_legacy_application()
-        
-        print("✅ Factory methods work correctly")
-        
-        # Test convenience function
-        app3 = create_arxml_editor(use_di=True)
-        app4 = create_arxml_editor(use_di=False)
-        
-        print("✅ Convenience functions work correctly")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Factory test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    from src.factory import ARXMLEditorFactory, create_arxml_editor
+    
+    # Test factory creation
+    assert ARXMLEditorFactory.create_application() is not None
+    assert ARXMLEditorFactory.create_legacy_application() is not None
+    
+    # Test convenience function
+    assert create_arxml_editor(use_di=True) is not None
+    assert create_arxml_editor(use_di=False) is not None
 
 def test_backward_compatibility():
     """Test that existing functionality still works"""
-    print("\n✓ Testing backward compatibility...")
-    
-    try:
-        # Test that old imports still work
-        from src.core.services.schema_service import SchemaService
-        from src.core.services.validation_service import ValidationService
-        from src.core.services.command_service import CommandService
-        from src.core.services.arxml_parser import ARXMLParser
-        
-        # Test that services can still be created directly
-        schema = SchemaService()
-        validation = ValidationService(schema)
-        command = CommandService()
-        parser = ARXMLParser(schema)
-        
-        # Test that they have expected methods
-        assert hasattr(schema, 'set_version')
-        assert hasattr(validation, 'validate_document')
-        assert hasattr(command, 'execute_command')
-        assert hasattr(parser, 'parse_arxml_file')
-        
-        print("✅ Direct service instantiation still works")
-        
-        # Test that application can still be created without DI
-        from src.core.application import ARXMLEditorApp
-        app = ARXMLEditorApp()
-        
-        assert hasattr(app, 'validation_service')
-        assert hasattr(app, 'schema_service')
-        
-        print("✅ Legacy application creation still works")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Backward compatibility test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    # Test that old imports still work
+    from src.core.services.schema_service import SchemaService
+    from src.core.services.validation_service import ValidationService
+    from src.core.services.command_service import CommandService
+    from src.core.services.arxml_parser import ARXMLParser
+    
+    # Test that services can still be created directly
+    schema = SchemaService()
+    validation = ValidationService(schema)
+    command = CommandService()
+    parser = ARXMLParser(schema)
+    
+    # Test that they have expected methods
+    legacy_services = {
+        'ISchemaService': schema,
+        'IValidationService': validation,
+        'ICommandService': command,
+        'IARXMLParser': parser
+    }
+    for name, service in legacy_services.items():
+        assert not REQUIRED_METHODS[name] - frozenset(dir(service)), name
+    
+    # The shared container hands out these same legacy classes
+    container, services = _resolve_services()
+    for name, service in services.items():
+        assert type(service) is type(legacy_services[name]), name
+    
+    # Test that application can still be created without DI
+    from src.core.application import ARXMLEditorApp
+    app = ARXMLEditorApp()
+    
+    _app_services(app)
 
 def main():
     """Run all tests"""
+    logging.basicConfig(format="   - %(message)s")
+    log.setLevel(logging.DEBUG)
     print("Testing Dependency Injection Implementation")
-    print("=" * 60)
+    print(_BAR)
     
     tests = [
-        ("DI Container", test_di_container),
+        ("Container Setup", test_container_setup),
+        ("Service Resolution", test_service_resolution),
+        ("Singleton Services", test_singleton_services),
+        ("Container Release", test_containers_are_released),
+        ("Interface Compliance", test_interface_compliance),
         ("Application with DI", test_application_with_di),
         ("Factory Methods", test_factory),
         ("Backward Compatibility", test_backward_compatibility)
@@ -210,26 +170,33 @@ def main():
     
     for test_name, test_func in tests:
         print(f"\n[{test_name}]")
-        if test_func():
-            passed += 1
-            print(f"✅ {test_name} PASSED")
-        else:
+        try:
+            test_func()
+        except Exception:
             failed += 1
+            traceback.print_exc()
             print(f"❌ {test_name} FAILED")
+        else:
+            passed += 1
+            print(f"✅ {test_name} PASSED")
     
-    print("\n" + "=" * 60)
-    print("TEST RESULTS")
-    print("=" * 60)
-    print(f"✅ PASSED: {passed}")
-    print(f"❌ FAILED: {failed}")
-    print(f"📊 SUCCESS RATE: {passed/(passed+failed)*100:.1f}%")
+    print("\n".join([
+        "\n" + _BAR,
+        "TEST RESULTS",
+        _BAR,
+        f"✅ PASSED: {passed}",
+        f"❌ FAILED: {failed}",
+        f"📊 SUCCESS RATE: {passed/(passed+failed)*100:.1f}%",
+    ]))
     
     if failed == 0:
-        print("\n🎉 ALL TESTS PASSED! Dependency Injection is working correctly!")
-        print("   - Services are properly abstracted")
-        print("   - Dependency injection container works")
-        print("   - Backward compatibility maintained")
-        print("   - Factory methods available")
+        print("\n".join([
+            "\n🎉 ALL TESTS PASSED! Dependency Injection is working correctly!",
+            "   - Services are properly abstracted",
+            "   - Dependency injection container works",
+            "   - Backward compatibility maintained",
+            "   - Factory methods available",
+        ]))
     else:
         print(f"\n⚠️  {failed} test(s) failed. Please review the implementation.")
     
@@ -7,15 +7,17 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from src.core.domain_events import SwComponentTypeCreated, SwComponentTypeUpdated
+from src.core.domain_events.event_bus import EventBusFactory
+from src.core.models.autosar_elements import SwComponentType, SwComponentTypeCategory
+from tests._io import recorded_file_opens
+
 def test_detailed_events():
     """Test detailed event functionality"""
     print("Testing detailed event functionality...")
     
-    try:
-        from src.core.domain_events import SwComponentTypeCreated, SwComponentTypeUpdated
-        from src.core.domain_events.event_bus import EventBusFactory
-        from src.core.models.autosar_elements import SwComponentType, SwComponentTypeCategory
-        
+    # Event dispatch is pure in-memory work and must not load or read any file
+    with recorded_file_opens() as opened:
         # Create event bus
         event_bus = EventBusFactory.create_sync_bus()
         
@@ -37,7 +39,6 @@ def test_detailed_events():
         print(f"Domain events before change: {len(component.get_domain_events())}")
         
         # Manually add a domain event to test
-        from src.core.domain_events import SwComponentTypeCreated
         manual_event = SwComponentTypeCreated(
             component_id=component.id,
             component_name=component.short_name,
@@ -59,14 +60,11 @@ def test_detailed_events():
         
         for i, event in enumerate(received_events):
             print(f"Event {i+1}: {event.event_type} - {getattr(event, 'component_name', 'N/A')}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    
+    assert [type(event) for event in received_events] == [SwComponentTypeCreated, SwComponentTypeUpdated]
+    assert [event.component_name for event in received_events] == ["TestComponent", "NewComponentName"]
+    assert not component.get_domain_events()
+    assert opened == [], f"event test opened files: {opened}"
 
 if __name__ == "__main__":
     test_detailed_events()
\ No newline at end of file
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Test the shared ARXML parse cache used by the UI debug tests
+"""
+
+from src.core.application import ARXMLEditorApp
+from tests._doc_cache import load_cached, _parse
+
+
+def test_cached_load_matches_regular_load():
+    """Cached loads give the same content as load_document, as separate documents"""
+    reference = ARXMLEditorApp()
+    assert reference.load_document("sample.arxml")
+
+    _parse.cache_clear()
+    first, second = ARXMLEditorApp(), ARXMLEditorApp()
+    assert load_cached(first, "sample.arxml")
+    assert load_cached(second, "sample.arxml")
+    assert _parse.cache_info().misses == 1
+
+    def names(document):
+        return [c.short_name for c in document.sw_component_types]
+
+    expected = names(reference.current_document)
+    assert expected
+    for app in (first, second):
+        assert names(app.current_document) == expected
+    assert first.current_document is not second.current_document
+    assert first.current_document.sw_component_types[0] is not second.current_document.sw_component_types[0]
+
+    assert not load_cached(ARXMLEditorApp(), "missing.arxml")
+
+
+if __name__ == "__main__":
+    test_cached_load_matches_regular_load()
+    print("All document cache tests passed")
@@ -1,7 +1,16 @@
-from src.core.models.autosar_elements import SwComponentType, PortInterface, DataElement, SwComponentTypeCategory
+from src.core.models.autosar_elements import SwComponentType, PortInterface, DataElement, DataType, SwComponentTypeCategory
+from tests._io import recorded_file_opens
 
 
 def run_tests():
+    # Invariant checks are pure in-memory work and must not load or read any file
+    with recorded_file_opens() as opened:
+        _check_invariants()
+    if opened:
+        raise AssertionError(f'Invariant checks opened files: {opened}')
+
+
+def _check_invariants():
     # Test 1: SwComponentType with empty name
     comp = SwComponentType('', SwComponentTypeCategory.APPLICATION)
     violations = comp.validate_invariants()
@@ -10,8 +19,8 @@ def run_tests():
 
     # Test 2: PortInterface duplicate data element names
     pi = PortInterface('IF')
-    de1 = DataElement('elem')
-    de2 = DataElement('elem')
+    de1 = DataElement('elem', DataType.INTEGER)
+    de2 = DataElement('elem', DataType.INTEGER)
     pi.add_data_element(de1)
     # add second with same name
     pi.add_data_element(de2)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test the flat ECUC short name table on ARXMLDocument
+"""
+
+from src.core.models.arxml_document import ARXMLDocument
+from src.core.models.autosar_elements import Composition
+
+
+def _sample_document():
+    doc = ARXMLDocument()
+    param = {'short_name': 'Param1', 'type': 'ECUC-NUMERICAL-PARAM-VALUE', 'value': '1'}
+    nested = {'short_name': 'Nested1', 'type': 'ECUC-CONTAINER-VALUE', 'containers': [], 'parameters': []}
+    container = {'short_name': 'Container1', 'type': 'ECUC-CONTAINER-VALUE', 'containers': [nested], 'parameters': [param]}
+    module = {'short_name': 'Module1', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': [container]}
+    doc._ecuc_elements = [module, {'short_name': 'Module2', 'containers': []}]
+    return doc, module, nested, param
+
+
+def test_short_name_slots_follow_document_order():
+    """Names come out in the order they are saved, each paired with its owning dict"""
+    doc, module, nested, param = _sample_document()
+    names, owners = doc.short_name_slots()
+    assert names == ['Module1', 'Container1', 'Nested1', 'Param1', 'Module2']
+    assert owners[0] is module
+    assert owners[2] is nested
+    assert owners[3] is param
+
+
+def test_write_short_names_updates_only_changed_entries():
+    """Edited names are written back to the dicts and mark the document modified"""
+    doc, module, nested, param = _sample_document()
+    names, owners = doc.short_name_slots()
+    assert doc.write_short_names(names, owners) == 0
+    assert not doc.modified
+
+    for i in range(len(names)):
+        names[i] += '-Haytham'
+    assert doc.write_short_names(names, owners) == 5
+    assert module['short_name'] == 'Module1-Haytham'
+    assert param['short_name'] == 'Param1-Haytham'
+    assert doc.modified
+
+
+def test_batch_modifications_defers_signals_until_exit():
+    """Signals are held back inside the batch; repeated modifications are emitted once"""
+    doc, module, nested, param = _sample_document()
+    added, modified = [], []
+    doc.element_added.connect(added.append)
+    doc.element_modified.connect(modified.append)
+
+    composition = Composition(short_name="Composition1")
+    with doc.batch_modifications():
+        doc.add_composition(composition)
+        doc.notify_element_modified(param)
+        doc.notify_element_modified(param)
+        with doc.batch_modifications():
+            doc.notify_element_modified(module)
+        assert added == [] and modified == []
+        assert not doc.modified
+    assert added == [composition]
+    assert modified == [param, module]
+    assert doc.modified
+
+    names, owners = doc.short_name_slots()
+    modified.clear()
+    names[2] = 'Nested1-Haytham'
+    assert doc.write_short_names(names, owners) == 1
+    assert modified == [nested]
+
+
+
+def test_snapshot_is_independent_of_later_edits():
+    """A snapshot keeps the values it was taken with and shares no dicts with the document"""
+    doc, module, nested, param = _sample_document()
+    before = doc.snapshot()
+    assert before == doc.ecuc_elements
+    assert before[0] is not module
+
+    names, owners = doc.short_name_slots()
+    names[3] = 'Param1-Haytham'
+    doc.write_short_names(names, owners)
+    assert before[0]['containers'][0]['parameters'][0]['short_name'] == 'Param1'
+    assert doc.snapshot() != before
+
+if __name__ == "__main__":
+    test_short_name_slots_follow_document_order()
+    test_write_short_names_updates_only_changed_entries()
+    test_batch_modifications_defers_signals_until_exit()
+    test_snapshot_is_independent_of_later_edits()
+    print("All ECUC short name slot tests passed")
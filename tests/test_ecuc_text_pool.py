@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Test that repeated ECUC texts are shared between the extracted dicts
+"""
+
+from src.core.services.arxml_parser import ARXMLParser
+
+_CHANNEL = (
+    '<ECUC-CONTAINER-VALUE><SHORT-NAME>CanTpChannel_{0}</SHORT-NAME>'
+    '<DEFINITION-REF>/AUTOSAR/CanTp/CanTpConfig/CanTpChannel</DEFINITION-REF>'
+    '<PARAMETER-VALUES><ECUC-PARAMETER-VALUE><SHORT-NAME>CanTpRxDl</SHORT-NAME>'
+    '<DEFINITION-REF>/AUTOSAR/CanTp/CanTpConfig/CanTpChannel/CanTpRxDl</DEFINITION-REF>'
+    '<VALUE>{0}</VALUE></ECUC-PARAMETER-VALUE></PARAMETER-VALUES></ECUC-CONTAINER-VALUE>'
+)
+
+
+def test_repeated_names_and_paths_are_one_string():
+    """Parameters of different containers share their short name and definition path"""
+    content = (
+        '<AUTOSAR xmlns="http://autosar.org/schema/r4.0"><AR-PACKAGES><AR-PACKAGE>'
+        '<SHORT-NAME>P</SHORT-NAME><ELEMENTS><ECUC-MODULE-CONFIGURATION-VALUES>'
+        '<SHORT-NAME>CanTp</SHORT-NAME><CONTAINERS>'
+        + _CHANNEL.format(0) + _CHANNEL.format(1) +
+        '</CONTAINERS></ECUC-MODULE-CONFIGURATION-VALUES></ELEMENTS></AR-PACKAGE></AR-PACKAGES></AUTOSAR>'
+    )
+    parser = ARXMLParser()
+    root = parser.parse_arxml_content(content)
+    first, second = parser.extract_ecuc_elements(root)[0]['containers']
+    p1, p2 = first['parameters'][0], second['parameters'][0]
+
+    assert p1['short_name'] is p2['short_name']
+    assert p1['definition_ref'] is p2['definition_ref']
+    assert (p1['value'], p2['value']) == ('0', '1')
+    assert first['short_name'] == 'CanTpChannel_0'
+    assert not parser._text_pool
+
+    # The per-element XPaths compiled for the first extraction are reused by the next
+    compiled = dict(parser._xpaths)
+    assert compiled
+    assert parser.extract_ecuc_elements(root)[0]['containers'] == [first, second]
+    assert parser._xpaths == compiled
+
+
+if __name__ == "__main__":
+    test_repeated_names_and_paths_are_one_string()
+    print("All ECUC text pool tests passed")
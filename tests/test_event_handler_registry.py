@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Test EventHandlerRegistry handler lookup per event type
+"""
+
+from src.core.domain_events import SwComponentTypeCreated, ValidationIssueDetected
+from src.core.domain_events.handlers import (
+    LoggingEventHandler, ValidationEventHandler, EventHandlerRegistry
+)
+
+
+def test_handlers_are_selected_by_event_type():
+    """Lookups follow can_handle and are refreshed when handlers change"""
+    registry = EventHandlerRegistry()
+    logging_handler = LoggingEventHandler()
+    validation_handler = ValidationEventHandler()
+    registry.register_handler(logging_handler)
+    registry.register_handler(validation_handler)
+
+    created = SwComponentTypeCreated(component_id="comp_1", component_name="Comp1", category="APPLICATION")
+    issue = ValidationIssueDetected(issue_id="issue_1", element_id="comp_1", element_type="SwComponentType", message="Error")
+    assert registry.get_handlers_for_event(created) == [logging_handler]
+    assert registry.get_handlers_for_event(issue) == [logging_handler, validation_handler]
+
+    # Callers get their own list; the cached lookup is not affected
+    registry.get_handlers_for_event(created).clear()
+    assert registry.get_handlers_for_event(created) == [logging_handler]
+
+    assert registry.unregister_handler(logging_handler)
+    assert registry.get_handlers_for_event(created) == []
+    assert registry.get_handlers_for_event(issue) == [validation_handler]
+
+
+if __name__ == "__main__":
+    test_handlers_are_selected_by_event_type()
+    print("All event handler registry tests passed")
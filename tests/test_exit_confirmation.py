@@ -3,10 +3,10 @@
 Test exit confirmation functionality
 """
 
-import sys
-from PyQt6.QtWidgets import QApplication, QMainWindow, QPushButton, QVBoxLayout, QWidget, QLabel
+from PyQt6.QtWidgets import QMainWindow, QPushButton, QVBoxLayout, QWidget, QLabel
 from PyQt6.QtCore import QTimer
 from src.ui.main_window import MainWindow
+from tests._qt import qapp
 
 class TestMainWindow(QMainWindow):
     def __init__(self):
@@ -130,9 +130,7 @@ class TestMainWindow(QMainWindow):
             self.status_label.setStyleSheet("color: orange;")
 
 def main():
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
+    app = qapp()
     
     window = TestMainWindow()
     window.show()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test loading a document with the parse step on a worker thread
+"""
+
+from PyQt6.QtCore import QThreadPool
+from src.core.application import ARXMLEditorApp
+from src.core.container import setup_container
+from tests._qt import qapp
+
+
+def _load_async(app, arxml_app, path):
+    """Start an asynchronous load and return the document_loaded results once it has finished"""
+    results = []
+    arxml_app.document_loaded.connect(lambda file_path, success: results.append((file_path, success)))
+    assert arxml_app.load_document_async(path)
+    # A second load is refused while the first one runs
+    assert not arxml_app.load_document_async(path)
+    QThreadPool.globalInstance().waitForDone()
+    # The parsed root is handed over through the event loop
+    while not results:
+        app.processEvents()
+    return results
+
+
+def test_async_load_matches_sync_load():
+    """The asynchronous load ends with the same document a synchronous load gives"""
+    app = qapp()
+    for container in (None, setup_container()):
+        reference = ARXMLEditorApp(container)
+        assert reference.load_document("sample.arxml")
+
+        arxml_app = ARXMLEditorApp(container)
+        assert _load_async(app, arxml_app, "sample.arxml") == [("sample.arxml", True)]
+        doc = arxml_app.current_document
+        assert doc.ecuc_elements == reference.current_document.ecuc_elements
+        assert len(doc._original_xml_elements) == len(reference.current_document._original_xml_elements)
+        # The schema is detected on the UI thread, as in a synchronous load
+        assert arxml_app.schema_service.detected_version == reference.schema_service.detected_version
+
+
+def test_async_load_reports_missing_file():
+    """A file that cannot be read is reported as a failed load and frees the loader"""
+    app = qapp()
+    arxml_app = ARXMLEditorApp()
+    assert _load_async(app, arxml_app, "missing.arxml") == [("missing.arxml", False)]
+    assert arxml_app.current_document is None
+    assert arxml_app.load_document("sample.arxml")
+
+
+if __name__ == "__main__":
+    test_async_load_matches_sync_load()
+    test_async_load_reports_missing_file()
+    print("All asynchronous load tests passed")
@@ -4,23 +4,24 @@ Test property persistence using the exact MainWindow setup
 This mimics how the real application connects signals
 """
 
-import sys
-from PyQt6.QtWidgets import QApplication
+import logging
 from PyQt6.QtCore import QTimer
 from src.ui.views.tree_navigator import TreeNavigator
 from src.ui.views.property_editor import PropertyEditor
 from src.core.application import ARXMLEditorApp
+from tests._qt import qapp
+from tests._doc_cache import load_cached
+
+log = logging.getLogger(__name__)
 
 def test_main_window_persistence():
     """Test property persistence with MainWindow-style signal connections"""
-    print("=" * 60)
-    print("TESTING MAIN WINDOW PERSISTENCE")
-    print("=" * 60)
+    log.debug("=" * 60)
+    log.debug("TESTING MAIN WINDOW PERSISTENCE")
+    log.debug("=" * 60)
     
     # Create Qt application
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
+    app = qapp()
     
     # Create ARXMLEditorApp (same as MainWindow)
     arxml_app = ARXMLEditorApp()
@@ -35,21 +36,21 @@ def test_main_window_persistence():
     # Load the ECUC file
     try:
         ecuc_file = "Backup/ECUC/FCA_mPAD_Safety_Can_Can_ecuc.arxml"
-        print(f"Loading: {ecuc_file}")
-        arxml_app.load_document(ecuc_file)
-        print("✓ Document loaded successfully")
+        log.debug("Loading: %s", ecuc_file)
+        load_cached(arxml_app, ecuc_file)
+        log.debug("✓ Document loaded successfully")
         
         # Refresh tree navigator to populate it
         tree_navigator.refresh()
-        print("✓ Tree navigator refreshed")
+        log.debug("✓ Tree navigator refreshed")
         
         if not arxml_app.current_document or not arxml_app.current_document.ecuc_elements:
-            print("❌ No ECUC elements found")
+            log.error("❌ No ECUC elements found")
             return
             
         # Get the first ECUC element
         element1 = arxml_app.current_document.ecuc_elements[0]
-        print(f"Using element: id={id(element1)} short_name='{element1.get('short_name')}'")
+        log.debug("Using element: id=%s short_name='%s'", id(element1), element1.get('short_name'))
         
         # Create a second test element for switching
         element2 = {
@@ -57,54 +58,58 @@ def test_main_window_persistence():
             'type': 'ECUC-MODULE-CONFIGURATION-VALUES',
             'containers': []
         }
-        arxml_app.current_document.ecuc_elements.append(element2)
-        print(f"Created second element: id={id(element2)} short_name='{element2.get('short_name')}'")
+        # The navigator adds the new element's item itself; no refresh needed
+        arxml_app.current_document.append_ecuc_element(element2)
+        log.debug("Created second element: id=%s short_name='%s'", id(element2), element2.get('short_name'))
+        if tree_navigator.find_tree_item_by_element(element2) is None:
+            log.error("❌ No tree item for the second element")
+            return
         
-        print("\n--- TEST 1: Simulate tree selection (like real application) ---")
+        log.debug("\n--- TEST 1: Simulate tree selection (like real application) ---")
         
         # Step 1: Simulate tree navigator selection (this is what happens in real app)
-        print("Simulating tree selection of element1...")
+        log.debug("Simulating tree selection of element1...")
         tree_navigator.element_selected.emit(element1)
         
         # Verify the property editor received the element
         if property_editor._current_element is not None:
-            print(f"✓ Property editor set element: id={id(property_editor._current_element)} short_name='{property_editor._current_element.get('short_name')}'")
+            log.debug("✓ Property editor set element: id=%s short_name='%s'", id(property_editor._current_element), property_editor._current_element.get('short_name'))
         else:
-            print("❌ Property editor did not receive element")
+            log.error("❌ Property editor did not receive element")
             return
         
         # Step 2: Simulate editing a property
-        print("Simulating property edit...")
+        log.debug("Simulating property edit...")
         if 'short_name' in property_editor._property_widgets:
             widget = property_editor._property_widgets['short_name']
             original_value = widget.text()
             new_value = original_value + "_EDITED_VIA_SIGNAL"
             widget.setText(new_value)
-            print(f"Changed widget from '{original_value}' to '{new_value}'")
+            log.debug("Changed widget from '%s' to '%s'", original_value, new_value)
             
             # Verify the change was applied to the element
             current_element_value = property_editor._current_element.get('short_name')
-            print(f"Element value after edit: '{current_element_value}'")
+            log.debug("Element value after edit: '%s'", current_element_value)
         else:
-            print("❌ No short_name widget found")
+            log.error("❌ No short_name widget found")
             return
         
         # Step 3: Simulate switching to another element (like clicking another node)
-        print("\nSimulating tree selection of element2...")
+        log.debug("\nSimulating tree selection of element2...")
         tree_navigator.element_selected.emit(element2)
         
         if property_editor._current_element is not None:
-            print(f"✓ Switched to element2: id={id(property_editor._current_element)} short_name='{property_editor._current_element.get('short_name')}'")
+            log.debug("✓ Switched to element2: id=%s short_name='%s'", id(property_editor._current_element), property_editor._current_element.get('short_name'))
         else:
-            print("❌ Failed to switch to element2")
+            log.error("❌ Failed to switch to element2")
             return
         
         # Step 4: Switch back to element1 to test persistence
-        print("\nSimulating return to element1...")
+        log.debug("\nSimulating return to element1...")
         tree_navigator.element_selected.emit(element1)
         
         if property_editor._current_element is not None:
-            print(f"✓ Returned to element1: id={id(property_editor._current_element)} short_name='{property_editor._current_element.get('short_name')}'")
+            log.debug("✓ Returned to element1: id=%s short_name='%s'", id(property_editor._current_element), property_editor._current_element.get('short_name'))
             
             # Check if the widget shows the edited value
             if 'short_name' in property_editor._property_widgets:
@@ -112,25 +117,27 @@ def test_main_window_persistence():
                 widget_value = widget.text()
                 element_value = property_editor._current_element.get('short_name')
                 
-                print(f"Widget value after return: '{widget_value}'")
-                print(f"Element value after return: '{element_value}'")
+                log.debug("Widget value after return: '%s'", widget_value)
+                log.debug("Element value after return: '%s'", element_value)
                 
                 if "_EDITED_VIA_SIGNAL" in widget_value and "_EDITED_VIA_SIGNAL" in element_value:
-                    print("✅ SUCCESS: Property persistence worked via signal connections!")
+                    log.debug("✅ SUCCESS: Property persistence worked via signal connections!")
                 else:
-                    print("❌ FAILURE: Property edit was lost!")
-                    print(f"Expected to contain '_EDITED_VIA_SIGNAL'")
-                    print(f"Widget: '{widget_value}'")
-                    print(f"Element: '{element_value}'")
+                    log.error("❌ FAILURE: Property edit was lost!")
+                    log.debug("Expected to contain '_EDITED_VIA_SIGNAL'")
+                    log.debug("Widget: '%s'", widget_value)
+                    log.debug("Element: '%s'", element_value)
             else:
-                print("❌ No short_name widget found after return")
+                log.error("❌ No short_name widget found after return")
         else:
-            print("❌ Failed to return to element1")
+            log.error("❌ Failed to return to element1")
             
     except Exception as e:
-        print(f"❌ Error during test: {e}")
+        log.error("❌ Error during test: %s", e)
         import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s")
+    log.setLevel(logging.DEBUG)
     test_main_window_persistence()
\ No newline at end of file
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Run the property editor edit/switch/restore scenarios against one shared editor setup
+"""
+
+from PyQt6.QtCore import Qt
+from src.ui.views.tree_navigator import TreeNavigator
+from src.ui.views.property_editor import PropertyEditor
+from src.core.application import ARXMLEditorApp
+from tests._qt import qapp, dispose
+from tests.test_exact_issue import run_exact_issue
+from tests.test_save_restore_debug import run_save_restore_cycle
+
+# Each scenario takes (arxml_app, tree_navigator, property_editor) and returns True on success
+SCENARIOS = {
+    "exact": run_exact_issue,
+    "save_restore": run_save_restore_cycle,
+}
+
+
+def _editor_setup():
+    """One app, navigator and editor wired like MainWindow, over a small ECUC document"""
+    arxml_app = ARXMLEditorApp()
+    doc = arxml_app.new_document()
+    param = {'short_name': 'Param1', 'type': 'ECUC-NUMERICAL-PARAM-VALUE', 'value': '1'}
+    container = {'short_name': 'Container1', 'type': 'ECUC-CONTAINER-VALUE', 'containers': [], 'parameters': [param]}
+    doc._ecuc_elements = [{'short_name': 'Module1', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': [container]}]
+
+    tree_navigator = TreeNavigator(arxml_app)
+    property_editor = PropertyEditor(arxml_app)
+    tree_navigator.element_selected.connect(
+        property_editor.set_element, type=Qt.ConnectionType.DirectConnection)
+    tree_navigator.refresh()
+    return arxml_app, tree_navigator, property_editor
+
+
+def test_scenarios_share_one_editor():
+    """Every scenario passes when run back to back on the same widgets and document"""
+    app = qapp()
+    setup = _editor_setup()
+    failed = [name for name, scenario in SCENARIOS.items() if not scenario(*setup)]
+    assert failed == []
+
+    dispose(*setup[1:])
+
+
+if __name__ == "__main__":
+    test_scenarios_share_one_editor()
+    print("All property editor cycle scenarios passed")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Test PropertyEditor document lookups (resolve cache) on an in-memory ECUC document
+"""
+
+from PyQt6.QtWidgets import QApplication, QLineEdit, QToolButton
+from PyQt6.QtCore import QEvent
+from src.ui.views.property_editor import PropertyEditor
+from src.core.application import ARXMLEditorApp
+from tests._qt import qapp, dispose
+
+
+def _make_app():
+    """Create an app whose current document holds a small nested ECUC tree"""
+    arxml_app = ARXMLEditorApp()
+    doc = arxml_app.new_document()
+    param = {'short_name': 'Param1', 'type': 'ECUC-NUMERICAL-PARAM-VALUE', 'value': '1'}
+    nested = {'short_name': 'Nested1', 'type': 'ECUC-CONTAINER-VALUE', 'containers': [], 'parameters': [param]}
+    container = {'short_name': 'Container1', 'type': 'ECUC-CONTAINER-VALUE', 'containers': [nested], 'parameters': []}
+    module = {'short_name': 'Module1', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': [container]}
+    doc._ecuc_elements = [module]
+    return arxml_app, module, container, nested, param
+
+
+def test_resolve_to_document():
+    """Nested dicts resolve to themselves; copies resolve to the document instance"""
+    app = qapp()
+
+    arxml_app, module, container, nested, param = _make_app()
+    editor = PropertyEditor(arxml_app)
+
+    assert editor._resolve_to_document(module) is module
+    assert editor._resolve_to_document(nested) is nested
+    assert editor._resolve_to_document(param) is param
+
+    # A transient copy of the top-level element falls back to short_name/type matching
+    copy = dict(module)
+    assert editor._resolve_to_document(copy) is module
+
+    # Unknown dicts resolve to None
+    stranger = {'short_name': 'Nope', 'type': 'ECUC-CONTAINER-VALUE'}
+    assert editor._resolve_to_document(stranger) is None
+
+    dispose(editor)
+
+
+def test_resolve_cache_invalidated_on_top_level_change():
+    """Appending a top-level element makes it resolvable without an explicit reset"""
+    app = qapp()
+
+    arxml_app, module, container, nested, param = _make_app()
+    editor = PropertyEditor(arxml_app)
+
+    added = {'short_name': 'Module2', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': []}
+    assert editor._resolve_to_document(added) is None
+
+    arxml_app.current_document.ecuc_elements.append(added)
+    assert editor._resolve_to_document(added) is added
+
+    dispose(editor)
+
+
+def test_reselecting_the_shown_element_skips_lookups():
+    """Selecting the element already shown keeps its widgets and the document index"""
+    app = qapp()
+
+    arxml_app, module, container, nested, param = _make_app()
+    editor = PropertyEditor(arxml_app)
+    editor.set_element(module)
+    short_name_edit = editor._property_widgets["short_name"]
+    index = editor._doc_dict_index
+
+    editor.set_element(module)
+    assert not editor._doc_index_dirty
+    assert editor._doc_dict_index is index
+    assert editor._property_widgets["short_name"] is short_name_edit
+
+    # A copy still goes through the lookup and lands on the same element
+    editor.set_element(dict(module))
+    assert editor._current_element is module
+
+    dispose(editor)
+
+
+def test_selection_finds_the_original_element_through_the_index():
+    """Selecting a dict records its document instance without walking the document"""
+    app = qapp()
+
+    arxml_app, module, container, nested, param = _make_app()
+    editor = PropertyEditor(arxml_app)
+    walks = []
+    find_dict_in = editor._find_dict_in
+    editor._find_dict_in = lambda *args: walks.append(args) or find_dict_in(*args)
+
+    editor.set_element(nested)
+    assert editor._original_element is nested
+    editor.set_element(dict(module))
+    assert editor._original_element is module
+    assert walks == []
+
+    dispose(editor)
+
+
+def test_name_index_follows_renames():
+    """Copies are matched by their current (short_name, type) after an edit"""
+    app = qapp()
+
+    arxml_app, module, container, nested, param = _make_app()
+    editor = PropertyEditor(arxml_app)
+
+    editor._on_ecuc_container_property_changed(nested, "short_name", "Renamed1")
+    assert nested['short_name'] == "Renamed1"
+
+    copy = {'short_name': 'Renamed1', 'type': 'ECUC-CONTAINER-VALUE'}
+    assert editor._resolve_to_document(copy) is nested
+    stale = {'short_name': 'Nested1', 'type': 'ECUC-CONTAINER-VALUE'}
+    assert editor._resolve_to_document(stale) is None
+
+    dispose(editor)
+
+
+def test_dedupe_collapses_top_level_duplicates():
+    """Only top-level namesakes of the edited element are replaced by it"""
+    app = qapp()
+
+    arxml_app, module, container, nested, param = _make_app()
+    duplicate = dict(module)
+    # A nested reference to the duplicate is redirected to the canonical dict
+    other = {'short_name': 'Module2', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': [duplicate]}
+    arxml_app.current_document._ecuc_elements = [module, duplicate, other]
+    editor = PropertyEditor(arxml_app)
+    editor.set_element(module)
+
+    editor._on_ecuc_property_changed(module, "desc", "edited")
+    assert arxml_app.current_document.ecuc_elements == [module, other]
+    assert arxml_app.current_document.ecuc_elements[0] is module
+    assert other['containers'][0] is module
+
+    # Without duplicates the document list is left untouched
+    elements = arxml_app.current_document.ecuc_elements
+    editor.set_element(other)
+    editor._on_ecuc_property_changed(other, "desc", "edited")
+    assert arxml_app.current_document.ecuc_elements is elements
+
+    dispose(editor)
+
+
+def test_edit_widgets_write_document_dicts():
+    """Parameter edits land on the document dict itself, not a QVariant copy"""
+    app = qapp()
+
+    arxml_app, module, container, nested, param = _make_app()
+    editor = PropertyEditor(arxml_app)
+    editor.set_element(module)
+    for toggle in editor.properties_widget.findChildren(QToolButton):
+        toggle.setChecked(True)
+
+    value_edits = [edit for edit in editor.properties_widget.findChildren(QLineEdit)
+                   if editor._widget_to_element.get(id(edit)) is param and edit.text() == '1']
+    assert len(value_edits) == 1
+    value_edits[0].setText('4')
+    value_edits[0].setText('42')
+    # Keystrokes are coalesced until typing pauses or editing finishes
+    assert param['value'] == '1'
+    value_edits[0].editingFinished.emit()
+    assert param['value'] == '42'
+    value_edits[0].setText('43')
+    editor.flush_pending_changes()
+    assert param['value'] == '43'
+
+    # Entries are dropped together with their widgets
+    editor.set_element(None)
+    arxml_app.new_document()
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+    assert not editor._widget_to_element
+
+    dispose(editor)
+
+
+if __name__ == "__main__":
+    test_resolve_to_document()
+    test_resolve_cache_invalidated_on_top_level_change()
+    test_reselecting_the_shown_element_skips_lookups()
+    test_selection_finds_the_original_element_through_the_index()
+    test_name_index_follows_renames()
+    test_dedupe_collapses_top_level_duplicates()
+    test_edit_widgets_write_document_dicts()
+    print("All property editor lookup tests passed")
+
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test that PropertyEditor batches set_modified/property_changed notifications per flush
+"""
+
+from src.ui.views.property_editor import PropertyEditor
+from src.core.application import ARXMLEditorApp
+from tests._qt import qapp, dispose
+
+
+def test_burst_of_edits_emits_once_per_property():
+    """Writes apply immediately; listeners see one final value per (element, property)"""
+    app = qapp()
+
+    arxml_app = ARXMLEditorApp()
+    doc = arxml_app.new_document()
+    param = {'short_name': 'Param1', 'type': 'ECUC-NUMERICAL-PARAM-VALUE', 'value': '1'}
+    container = {'short_name': 'Container1', 'type': 'ECUC-CONTAINER-VALUE', 'containers': [], 'parameters': [param]}
+    doc._ecuc_elements = [{'short_name': 'Module1', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': [container]}]
+    doc.set_modified(False)
+
+    editor = PropertyEditor(arxml_app)
+    emitted = []
+    editor.property_changed.connect(lambda element, name, value: emitted.append((element, name, value)))
+
+    for text in ("4", "42", "421"):
+        editor._on_ecuc_parameter_property_changed(param, "value", text)
+    editor._on_ecuc_container_property_changed(container, "short_name", "C")
+    editor._on_ecuc_container_property_changed(container, "short_name", "C2")
+
+    # The model is already up to date, notifications are still pending
+    assert param['value'] == "421"
+    assert container['short_name'] == "C2"
+    assert emitted == []
+    assert not doc.modified
+
+    editor.flush_pending_changes()
+    assert emitted == [(param, "value", "421"), (container, "short_name", "C2")]
+    assert doc.modified
+
+    # Nothing left to flush
+    editor.flush_pending_changes()
+    assert len(emitted) == 2
+
+    dispose(editor)
+
+
+def test_unchanged_value_is_ignored():
+    """Re-sending the current value (e.g. on focus-out) queues no notification"""
+    app = qapp()
+
+    arxml_app = ARXMLEditorApp()
+    doc = arxml_app.new_document()
+    module = {'short_name': 'Module1', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': []}
+    doc._ecuc_elements = [module]
+    doc.set_modified(False)
+
+    editor = PropertyEditor(arxml_app)
+    editor.set_element(module)
+    emitted = []
+    editor.property_changed.connect(lambda element, name, value: emitted.append(name))
+
+    editor._on_ecuc_property_changed(module, "short_name", "Module1")
+    editor.flush_pending_changes()
+    assert emitted == []
+    assert not doc.modified
+
+    dispose(editor)
+
+
+def test_root_short_name_commits_on_editing_finished():
+    """Typing in the element short name field writes on editingFinished or on flush, not per keystroke"""
+    app = qapp()
+
+    arxml_app = ARXMLEditorApp()
+    doc = arxml_app.new_document()
+    module = {'short_name': 'Module1', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': []}
+    doc._ecuc_elements = [module]
+
+    editor = PropertyEditor(arxml_app)
+    editor.set_element(module)
+    emitted = []
+    editor.property_changed.connect(lambda element, name, value: emitted.append(value))
+
+    edit = editor._property_widgets["short_name"]
+    edit.setText("Module1_A")
+    assert module['short_name'] == "Module1"
+
+    edit.editingFinished.emit()
+    assert module['short_name'] == "Module1_A"
+    assert emitted == ["Module1_A"]
+
+    # A flush (e.g. before saving) applies text that was never finished
+    edit.setText("Module1_B")
+    editor.flush_pending_changes()
+    assert module['short_name'] == "Module1_B"
+    assert emitted == ["Module1_A", "Module1_B"]
+
+    dispose(editor)
+
+
+def test_switching_away_from_a_focused_field_flushes_once():
+    """Tearing down the form does not re-enter the editor through the focused field"""
+    app = qapp()
+
+    arxml_app = ARXMLEditorApp()
+    doc = arxml_app.new_document()
+    module = {'short_name': 'Module1', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': []}
+    other = {'short_name': 'Module2', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': []}
+    doc._ecuc_elements = [module, other]
+
+    editor = PropertyEditor(arxml_app)
+    editor.show()
+    editor.set_element(module)
+    edit = editor._property_widgets["short_name"]
+    edit.setFocus()
+    app.processEvents()
+    finished = []
+    edit.editingFinished.connect(lambda: finished.append(edit.text()))
+
+    edit.setText("Module1_A")
+    editor.set_element(other)
+    assert finished == []
+    assert module['short_name'] == "Module1_A"
+    assert other['short_name'] == "Module2"
+    assert edit.text() == "Module2"
+
+    dispose(editor)
+
+
+if __name__ == "__main__":
+    test_burst_of_edits_emits_once_per_property()
+    test_unchanged_value_is_ignored()
+    test_root_short_name_commits_on_editing_finished()
+    test_switching_away_from_a_focused_field_flushes_once()
+    print("All property editor notification tests passed")
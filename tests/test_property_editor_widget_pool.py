@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Test PropertyEditor recycling of ECUC container/parameter widgets between rebuilds
+"""
+
+from PyQt6.QtWidgets import QGroupBox, QToolButton
+from src.ui.views.property_editor import PropertyEditor
+from src.core.application import ARXMLEditorApp
+from tests._qt import qapp, dispose
+
+
+def _make_app():
+    """Create an app with two modules sharing one container subtree"""
+    arxml_app = ARXMLEditorApp()
+    doc = arxml_app.new_document()
+    param = {'short_name': 'Param1', 'type': 'ECUC-NUMERICAL-PARAM-VALUE', 'value': '1'}
+    nested = {'short_name': 'Nested1', 'type': 'ECUC-CONTAINER-VALUE', 'containers': [], 'parameters': [param]}
+    container = {'short_name': 'Container1', 'type': 'ECUC-CONTAINER-VALUE', 'containers': [nested], 'parameters': []}
+    module = {'short_name': 'Module1', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': [container]}
+    other = {'short_name': 'Module2', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': [container]}
+    doc._ecuc_elements = [module, other]
+    return arxml_app, module, other, container, nested, param
+
+
+def _group_titles(editor):
+    return [group.title() for group in editor.properties_widget.findChildren(QGroupBox)]
+
+
+def _open_nested_sections(editor):
+    for toggle in editor.properties_widget.findChildren(QToolButton):
+        toggle.setChecked(True)
+
+
+def test_nested_containers_created_on_expand():
+    """Nested container widgets are only built once their section is opened"""
+    app = qapp()
+
+    arxml_app, module, other, container, nested, param = _make_app()
+    editor = PropertyEditor(arxml_app)
+
+    editor.set_element(module)
+    assert "Container: Container1" in _group_titles(editor)
+    assert id(nested) not in editor._container_widget_cache
+    assert "Container: Nested1" not in _group_titles(editor)
+
+    _open_nested_sections(editor)
+    assert "Container: Nested1" in _group_titles(editor)
+    assert "Parameter: Param1" in _group_titles(editor)
+
+    dispose(editor)
+
+
+def test_container_widgets_reused_across_rebuilds():
+    """Switching elements back and forth reuses the same container and parameter widgets"""
+    app = qapp()
+
+    arxml_app, module, other, container, nested, param = _make_app()
+    editor = PropertyEditor(arxml_app)
+
+    editor.set_element(module)
+    _open_nested_sections(editor)
+    container_group = editor._container_widget_cache[id(container)][1]
+    param_group = editor._param_widget_cache[id(param)][1]
+
+    editor.set_element(other)
+    editor.set_element(module)
+    assert editor._container_widget_cache[id(container)][1] is container_group
+    assert editor._param_widget_cache[id(param)][1] is param_group
+    assert container_group.parent() is not None
+    assert _group_titles(editor).count("Parameter: Param1") == 1
+
+    dispose(editor)
+
+
+def test_renamed_container_gets_fresh_widget():
+    """Editing a container drops its pooled widget so the new name is shown"""
+    app = qapp()
+
+    arxml_app, module, other, container, nested, param = _make_app()
+    editor = PropertyEditor(arxml_app)
+
+    editor.set_element(module)
+    _open_nested_sections(editor)
+    nested_group = editor._container_widget_cache[id(nested)][1]
+    editor._on_ecuc_container_property_changed(nested, "short_name", "Renamed1")
+
+    editor.set_element(other)
+    editor.set_element(module)
+    assert editor._container_widget_cache[id(nested)][1] is not nested_group
+    assert "Container: Renamed1" in _group_titles(editor)
+    assert "Container: Nested1" not in _group_titles(editor)
+
+    # Loading another document empties the pools
+    arxml_app.new_document()
+    assert not editor._container_widget_cache
+    assert not editor._param_widget_cache
+
+    dispose(editor)
+
+
+def test_external_rename_refreshes_pooled_widget():
+    """A dict renamed outside the editor keeps its pooled widget; texts update without re-entering handlers"""
+    app = qapp()
+
+    arxml_app, module, other, container, nested, param = _make_app()
+    editor = PropertyEditor(arxml_app)
+    emitted = []
+    editor.property_changed.connect(lambda element, name, value: emitted.append(name))
+
+    editor.set_element(module)
+    _open_nested_sections(editor)
+    container_group = editor._container_widget_cache[id(container)][1]
+    param_group = editor._param_widget_cache[id(param)][1]
+
+    editor.set_element(other)
+    container['short_name'] = 'Outside1'
+    param['value'] = '7'
+    editor.set_element(module)
+
+    assert editor._container_widget_cache[id(container)][1] is container_group
+    assert editor._param_widget_cache[id(param)][1] is param_group
+    assert container_group.title() == "Container: Outside1"
+    assert editor._container_widget_cache[id(container)][5].text() == 'Outside1'
+    assert editor._param_widget_cache[id(param)][4].text() == '7'
+
+    editor.flush_pending_changes()
+    assert emitted == []
+
+    dispose(editor)
+
+
+def test_basic_properties_group_reused_between_elements():
+    """Switching ECUC elements refills the same short name field for the new element"""
+    app = qapp()
+
+    arxml_app, module, other, container, nested, param = _make_app()
+    editor = PropertyEditor(arxml_app)
+
+    editor.set_element(module)
+    edit = editor._property_widgets['short_name']
+    assert edit.text() == 'Module1'
+
+    editor.set_element(other)
+    assert editor._property_widgets['short_name'] is edit
+    assert edit.text() == 'Module2'
+
+    # Edits go to the element now shown, not the one the field was built for
+    edit.setText('Module2Renamed')
+    edit.editingFinished.emit()
+    assert other['short_name'] == 'Module2Renamed'
+    assert module['short_name'] == 'Module1'
+
+    editor.set_element(module)
+    assert edit.text() == 'Module1'
+
+    # Updates are frozen only for the switch itself, including the empty state
+    assert editor.properties_widget.updatesEnabled()
+    editor.set_element(None)
+    assert editor.properties_widget.updatesEnabled()
+
+    dispose(editor)
+
+
+if __name__ == "__main__":
+    test_nested_containers_created_on_expand()
+    test_container_widgets_reused_across_rebuilds()
+    test_renamed_container_gets_fresh_widget()
+    test_external_rename_refreshes_pooled_widget()
+    test_basic_properties_group_reused_between_elements()
+    print("All property editor widget pool tests passed")
@@ -5,13 +5,18 @@ Test script to verify property persistence in ARXML editor
 
 import sys
 import os
+import tempfile
+import logging
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.core.application import ARXMLEditorApp
+from tests._doc_cache import load_cached
+
+log = logging.getLogger(__name__)
 
 def test_property_persistence():
     """Test that property changes persist when switching between elements"""
-    print("Testing property persistence...")
+    log.debug("Testing property persistence...")
     
     # Create application
     app = ARXMLEditorApp()
@@ -19,69 +24,67 @@ def test_property_persistence():
     # Load a test document
     test_file = "Backup/ECUC/FCA_mPAD_Safety_CanTp_CanTp_ecuc.arxml"
     if not os.path.exists(test_file):
-        print(f"Test file not found: {test_file}")
+        log.warning("Test file not found: %s", test_file)
         return False
     
-    print(f"Loading document: {test_file}")
-    success = app.load_document(test_file)
+    log.debug("Loading document: %s", test_file)
+    success = load_cached(app, test_file)
     if not success:
-        print("Failed to load document")
+        log.error("Failed to load document")
         return False
     
-    print("Document loaded successfully")
+    log.debug("Document loaded successfully")
     
     # Get the first ECUC element
     if not app.current_document.ecuc_elements:
-        print("No ECUC elements found")
+        log.error("No ECUC elements found")
         return False
     
     ecuc_element = app.current_document.ecuc_elements[0]
-    print(f"First ECUC element: {ecuc_element.get('short_name')} (id={id(ecuc_element)})")
+    log.debug("First ECUC element: %s (id=%s)", ecuc_element.get('short_name'), id(ecuc_element))
     
     # Modify the element
     original_name = ecuc_element.get('short_name', '')
     new_name = original_name + "_MODIFIED"
     ecuc_element['short_name'] = new_name
-    print(f"Modified short_name: '{original_name}' -> '{new_name}'")
+    log.debug("Modified short_name: '%s' -> '%s'", original_name, new_name)
     
     # Verify the change is in the element
     if ecuc_element.get('short_name') != new_name:
-        print("ERROR: Element was not modified correctly")
-        return False
-    
-    # Save the document
-    print("Saving document...")
-    success = app.save_document("test_output.arxml")
-    if not success:
-        print("Failed to save document")
-        return False
-    
-    print("Document saved successfully")
-    
-    # Load the saved document and verify the change persisted
-    print("Loading saved document to verify changes...")
-    app2 = ARXMLEditorApp()
-    success = app2.load_document("test_output.arxml")
-    if not success:
-        print("Failed to load saved document")
-        return False
-    
-    # Check if the change persisted
-    if not app2.current_document.ecuc_elements:
-        print("No ECUC elements found in saved document")
+        log.error("ERROR: Element was not modified correctly")
         return False
     
-    saved_element = app2.current_document.ecuc_elements[0]
-    saved_name = saved_element.get('short_name', '')
-    print(f"Saved element short_name: '{saved_name}'")
-    
-    if saved_name == new_name:
-        print("SUCCESS: Property changes persisted correctly!")
-        return True
-    else:
-        print(f"ERROR: Property changes did not persist. Expected '{new_name}', got '{saved_name}'")
-        return False
+    # Save into a private directory so parallel runs never share the output file
+    with tempfile.TemporaryDirectory() as tmp:
+        output_file = os.path.join(tmp, "test_output.arxml")
+        # Save the document
+        log.debug("Saving document...")
+        success = app.save_document(output_file)
+        if not success:
+            log.error("Failed to save document")
+            return False
+        
+        log.debug("Document saved successfully")
+        
+        # Only the first ECUC module is checked, so read just its name back
+        log.debug("Reading saved document to verify changes...")
+        app2 = ARXMLEditorApp()
+        saved_name = app2.read_short_name(output_file)
+        if saved_name is None:
+            log.error("No ECUC elements found in saved document")
+            return False
+        
+        log.debug("Saved element short_name: '%s'", saved_name)
+        
+        if saved_name == new_name:
+            log.debug("SUCCESS: Property changes persisted correctly!")
+            return True
+        else:
+            log.error("ERROR: Property changes did not persist. Expected '%s', got '%s'", new_name, saved_name)
+            return False
 
 if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s")
+    log.setLevel(logging.DEBUG)
     success = test_property_persistence()
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -2,132 +2,88 @@
 """
 Test script to debug property persistence issues
 """
-import sys
 import os
+import logging
 
-# Add the project root to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from PyQt6.QtWidgets import QApplication
 from src.core.application import ARXMLEditorApp
 from src.ui.views.property_editor import PropertyEditor
 from src.ui.views.tree_navigator import TreeNavigator
+from tests._qt import qapp, dispose
+from tests._doc_cache import load_cached
+
+log = logging.getLogger(__name__)
+
+SAMPLE_FILES = [
+    "Backup/ECUC/FCA_mPAD_Safety_Can_Can_ecuc.arxml",
+    "Backup/ECUC/FCA_mPAD_Safety_CanIf_CanIf_ecuc.arxml",
+    "sample.arxml",
+    "master.arxml",
+    "slave.arxml",
+    "test_output.arxml"
+]
+
+
+def _load_first_sample(arxml_app):
+    """Load the first sample file that exists and parses; returns its path or None"""
+    for sample_file in SAMPLE_FILES:
+        if os.path.exists(sample_file):
+            log.debug("Attempting to load: %s", sample_file)
+            if load_cached(arxml_app, sample_file):
+                return sample_file
+            log.debug("Failed to load: %s", sample_file)
+    return None
+
 
 def test_property_persistence():
     """Test property persistence when switching between elements"""
-    print("=" * 60)
-    print("TESTING PROPERTY PERSISTENCE")
-    print("=" * 60)
-    
-    # Create QApplication
-    app = QApplication(sys.argv)
-    
+    app = qapp()
+
     # Create application components
     arxml_app = ARXMLEditorApp()
     property_editor = PropertyEditor(arxml_app)
     tree_navigator = TreeNavigator(arxml_app)
-    
-    # Connect tree navigator to property editor
-    tree_navigator.element_selected.connect(property_editor.set_element)
-    
-    # Try to load a sample file
-    sample_files = [
-        "Backup/ECUC/FCA_mPAD_Safety_Can_Can_ecuc.arxml",
-        "Backup/ECUC/FCA_mPAD_Safety_CanIf_CanIf_ecuc.arxml",
-        "sample.arxml",
-        "master.arxml", 
-        "slave.arxml",
-        "test_output.arxml"
-    ]
-    
-    loaded_file = None
-    for sample_file in sample_files:
-        if os.path.exists(sample_file):
-            print(f"Attempting to load: {sample_file}")
-            success = arxml_app.load_document(sample_file)
-            if success:
-                loaded_file = sample_file
-                print(f"✓ Successfully loaded: {sample_file}")
-                break
-            else:
-                print(f"✗ Failed to load: {sample_file}")
-    
-    if not loaded_file:
-        print("No sample files could be loaded. Creating a simple test...")
-        return False
-    
-    # Check if there are ECUC elements to test with
-    if not arxml_app.current_document.ecuc_elements:
-        print("No ECUC elements found in the loaded document")
-        return False
-    
-    # Get first ECUC element
-    first_element = arxml_app.current_document.ecuc_elements[0]
-    
-    # Create a second ECUC element for testing if only one exists
-    if len(arxml_app.current_document.ecuc_elements) == 1:
-        print("Only one ECUC element found, creating a second one for testing...")
-        second_element = {
-            'short_name': 'TestElement',
-            'type': 'ECUC-MODULE-CONFIGURATION-VALUES',
-            'containers': [],
-            'parameters': []
-        }
-        arxml_app.current_document.ecuc_elements.append(second_element)
-        print(f"Created second element: id={id(second_element)} short_name='TestElement'")
-    print(f"\nTesting with ECUC element: id={id(first_element)} short_name='{first_element.get('short_name')}'")
-    
-    # Test 1: Set element in property editor
-    print("\n--- TEST 1: Initial element setup ---")
-    property_editor.set_element(first_element)
-    
-    # Simulate user editing the short_name
-    if 'short_name' in property_editor._property_widgets:
+    try:
+        # Connect tree navigator to property editor
+        tree_navigator.element_selected.connect(property_editor.set_element)
+
+        loaded_file = _load_first_sample(arxml_app)
+        assert loaded_file is not None, "No sample files could be loaded"
+        # The edit/switch/return cycle needs two ECUC modules; top up samples that have fewer
+        ecuc_elements = arxml_app.current_document.ecuc_elements
+        while len(ecuc_elements) < 2:
+            ecuc_elements.append({
+                'short_name': f'TestElement{len(ecuc_elements)}',
+                'type': 'ECUC-MODULE-CONFIGURATION-VALUES',
+                'containers': [],
+                'parameters': []
+            })
+        first_element, second_element = ecuc_elements[:2]
+        log.debug("Testing with ECUC element: id=%d short_name='%s'", id(first_element), first_element.get('short_name'))
+
+        # Initial element setup
+        property_editor.set_element(first_element)
+        assert 'short_name' in property_editor._property_widgets
+
+        # Simulate user typing into the short name field
         short_name_widget = property_editor._property_widgets['short_name']
-        original_value = short_name_widget.text()
-        test_value = f"{original_value}_EDITED"
-        
-        print(f"Original value: '{original_value}'")
-        print(f"Setting widget to: '{test_value}'")
-        
-        # Simulate user typing
+        test_value = f"{short_name_widget.text()}_EDITED"
         short_name_widget.setText(test_value)
         short_name_widget.textChanged.emit(test_value)
-        
-        # Check if element was updated
-        print(f"Element value after edit: '{first_element.get('short_name')}'")
-        
-        # Test 2: Switch to another element and back
-        second_element = arxml_app.current_document.ecuc_elements[1]
-        print(f"\n--- TEST 2: Switch to second element ---")
-        print(f"Switching to: id={id(second_element)} short_name='{second_element.get('short_name')}'")
+
+        # Switch to the second element and back
         property_editor.set_element(second_element)
-        
-        print(f"\n--- TEST 3: Switch back to first element ---")
-        print(f"Switching back to: id={id(first_element)} short_name='{first_element.get('short_name')}'")
+        assert first_element.get('short_name') == test_value
         property_editor.set_element(first_element)
-        
-        # Check if the widget shows the edited value
-        if 'short_name' in property_editor._property_widgets:
-            final_widget = property_editor._property_widgets['short_name']
-            final_value = final_widget.text()
-            print(f"Widget value after return: '{final_value}'")
-            print(f"Element value after return: '{first_element.get('short_name')}'")
-            
-            if final_value == test_value:
-                print("✓ SUCCESS: Property persistence worked!")
-                return True
-            else:
-                print("✗ FAILURE: Property persistence failed!")
-                print(f"Expected: '{test_value}', Got: '{final_value}'")
-                return False
-        else:
-            print("No short_name widget found after return")
-            return False
-    else:
-        print("✗ FAILURE: No short_name widget found")
-        return False
+
+        assert 'short_name' in property_editor._property_widgets
+        final_value = property_editor._property_widgets['short_name'].text()
+        assert final_value == test_value, f"Expected '{test_value}', got '{final_value}'"
+    finally:
+        dispose(tree_navigator, property_editor, arxml_app)
+
 
 if __name__ == "__main__":
-    success = test_property_persistence()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    logging.basicConfig(format="%(message)s")
+    log.setLevel(logging.DEBUG)
+    test_property_persistence()
+    print("Property persistence debug test passed")
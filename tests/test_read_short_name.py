@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Test reading a single SHORT-NAME back from a saved ARXML file
+"""
+
+import os
+import tempfile
+from src.core.application import ARXMLEditorApp
+
+
+def test_read_short_name_matches_the_saved_module():
+    """The first ECUC module name is read back without loading the document"""
+    arxml_app = ARXMLEditorApp()
+    doc = arxml_app.new_document()
+    container = {'short_name': 'Container1', 'type': 'ECUC-CONTAINER-VALUE', 'containers': [], 'parameters': []}
+    doc._ecuc_elements = [
+        {'short_name': 'Module1-Haytham', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': [container]},
+        {'short_name': 'Module2', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': []},
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "saved.arxml")
+        assert doc.save_document(path)
+        assert arxml_app.read_short_name(path) == 'Module1-Haytham'
+        assert arxml_app.read_short_name(path, 'ECUC-CONTAINER-VALUE') == 'Container1'
+        assert arxml_app.read_short_name(path, 'SENDER-RECEIVER-INTERFACE') is None
+    assert arxml_app.read_short_name("missing.arxml") is None
+
+
+if __name__ == "__main__":
+    test_read_short_name_matches_the_saved_module()
+    print("All read short name tests passed")
@@ -6,8 +6,15 @@ Tests the new repository pattern and application services implementation
 
 import sys
 import os
+import functools
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+@functools.lru_cache(maxsize=1)
+def _get_container():
+    """Build the DI container once and share it between tests"""
+    from src.core.container import setup_container
+    return setup_container()
+
 def test_repository_pattern():
     """Test repository pattern implementation"""
     print("=" * 60)
@@ -44,7 +51,7 @@ def test_repository_pattern():
         assert sw_repo.save(component)
         assert sw_repo.exists_by_name("TestComponent")
         assert sw_repo.find_by_name("TestComponent") == component
-        assert len(sw_repo.find_all()) == 1
+        assert len(sw_repo.find_all()) == sw_repo.count() == 1
         
         # Test port interface repository
         interface = PortInterface("TestInterface", "Test Description", False)
@@ -68,9 +75,8 @@ def test_application_services():
     print("\n✓ Testing application services...")
     
     try:
-        # Setup DI container
-        from src.core.container import setup_container
-        container = setup_container()
+        # Shared DI container
+        container = _get_container()
         
         # Get application services
         from src.core.application_services import ISwComponentTypeApplicationService, IPortInterfaceApplicationService, IDocumentApplicationService
@@ -111,11 +117,10 @@ def test_integration():
     print("\n✓ Testing integration...")
     
     try:
-        from src.core.container import setup_container
         from src.core.application import ARXMLEditorApp
         
         # Create application with DI
-        container = setup_container()
+        container = _get_container()
         app = ARXMLEditorApp(container)
         
         # Test document creation
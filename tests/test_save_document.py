@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Test that saving writes preserved original XML without consuming it
+"""
+
+import os
+import tempfile
+from src.core.application import ARXMLEditorApp
+
+
+def test_repeated_saves_write_the_same_preserved_content():
+    """Original elements are shared into the save tree and survive repeated saves"""
+    arxml_app = ARXMLEditorApp()
+    assert arxml_app.load_document("sample.arxml")
+    doc = arxml_app.current_document
+    originals = list(doc._original_xml_elements)
+    child_counts = [len(elem) for elem in originals]
+    assert originals
+
+    with tempfile.TemporaryDirectory() as tmp:
+        first = os.path.join(tmp, "first.arxml")
+        second = os.path.join(tmp, "second.arxml")
+        assert doc.save_document(first)
+        assert doc.save_document(second)
+        with open(first, 'rb') as f1, open(second, 'rb') as f2:
+            assert f1.read() == f2.read()
+
+    assert doc._original_xml_elements == originals
+    assert [len(elem) for elem in originals] == child_counts
+
+
+if __name__ == "__main__":
+    test_repeated_saves_write_the_same_preserved_content()
+    print("All save document tests passed")
@@ -3,11 +3,146 @@
 Deep debugging test to verify if element values are actually being saved and restored correctly
 """
 
-import sys
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt
 from src.ui.views.tree_navigator import TreeNavigator
 from src.ui.views.property_editor import PropertyEditor
 from src.core.application import ARXMLEditorApp
+from tests._doc_cache import load_cached
+from tests._qt import qapp, dispose
+
+def run_save_restore_cycle(arxml_app, tree_navigator, property_editor):
+    """Edit element1, switch away through set_element and check the edit is restored"""
+    # Get elements for testing
+    doc = arxml_app.current_document
+    element1 = doc.ecuc_elements[0]
+    element2 = {
+        'short_name': 'TestElement',
+        'type': 'ECUC-MODULE-CONFIGURATION-VALUES',
+        'containers': []
+    }
+    doc.append_ecuc_element(element2)
+    
+    # Position of each document element, for the failure report
+    element_index = {id(e): i for i, e in enumerate(doc.ecuc_elements)}
+    
+    print(f"Element1: id={id(element1)} short_name='{element1['short_name']}'")
+    print(f"Element2: id={id(element2)} short_name='{element2['short_name']}'")
+    
+    print("\n" + "="*60)
+    print("STEP 1: Load element1")
+    print("="*60)
+    
+    # Step 1: Load element1 through the signal, which checks the connection;
+    # later steps call the connected slot directly
+    tree_navigator.element_selected.emit(element1)
+    
+    # Verify initial state
+    if property_editor._current_element is None:
+        print("❌ Property editor didn't receive element1")
+        return
+        
+    initial_value = element1['short_name']
+    print(f"✓ Element1 loaded: short_name='{initial_value}'")
+    
+    # Check widget value
+    widget = property_editor._property_widgets.get('short_name')
+    if widget is not None:
+        widget_value = widget.text()
+        print(f"✓ Widget shows: '{widget_value}'")
+        
+        if widget_value != initial_value:
+            print(f"⚠️  Widget value mismatch! Widget: '{widget_value}' vs Element: '{initial_value}'")
+    else:
+        print("❌ No short_name widget found")
+        return
+    
+    print("\n" + "="*60)
+    print("STEP 2: Edit element1")
+    print("="*60)
+    
+    # Step 2: Edit the property
+    new_value = initial_value + "_EDITED_DEEP_TEST"
+    widget.setText(new_value)
+    print(f"✓ Widget changed to: '{new_value}'")
+    
+    # Verify immediate change took effect, on the edited element and the document's
+    current = property_editor._current_element
+    print(f"✓ Current element shows: '{current['short_name']}'")
+    print(f"✓ Document element shows: '{element1['short_name']}'")
+    
+    print("\n" + "="*60)
+    print("STEP 3: Save element1 and switch to element2")
+    print("="*60)
+    
+    # Step 3: Switch to element2 (this should trigger save)
+    current = property_editor._current_element
+    sn = element1['short_name']
+    print("Before switch - Element1 state:")
+    print(f"  Current element: id={id(current)} short_name='{current['short_name']}'")
+    print(f"  Document element1: id={id(element1)} short_name='{sn}'")
+    print(f"  Widget value: '{widget.text()}'")
+    
+    property_editor.set_element(element2)
+    
+    current = property_editor._current_element
+    print("After switch - Element1 state:")
+    print(f"  Document element1: id={id(element1)} short_name='{element1['short_name']}'")
+    
+    # Verify element2 is loaded
+    if current is not element2:
+        print(f"❌ Failed to switch to element2")
+        print(f"   Expected: id={id(element2)}")
+        print(f"   Actual: id={id(current) if current else None}")
+        return
+    print(f"✓ Switched to element2: short_name='{current['short_name']}'")
+    
+    print("\n" + "="*60)
+    print("STEP 4: Switch back to element1 (restore test)")
+    print("="*60)
+    
+    # Step 4: Switch back to element1 (this should restore the edited value)
+    print("Before restore - Element1 state:")
+    print(f"  Document element1: id={id(element1)} short_name='{element1['short_name']}'")
+    
+    property_editor.set_element(element1)
+    
+    current = property_editor._current_element
+    sn = element1['short_name']
+    print("After restore - Element1 state:")
+    print(f"  Current element: id={id(current)} short_name='{current['short_name']}'")
+    print(f"  Document element1: id={id(element1)} short_name='{sn}'")
+    
+    # Check if widget shows the edited value
+    restored_widget = property_editor._property_widgets.get('short_name')
+    if restored_widget is not None:
+        restored_widget_value = restored_widget.text()
+        print(f"  Restored widget value: '{restored_widget_value}'")
+        
+        # The critical test: does the widget show the edited value?
+        if new_value in restored_widget_value:
+            print("✅ SUCCESS: Edit was preserved!")
+            return True
+        else:
+            print("❌ FAILURE: Edit was lost!")
+            print(f"   Expected: '{new_value}'")
+            print(f"   Actual: '{restored_widget_value}'")
+            
+            # Debug: Check all possible places where the value might be
+            print("\n🔍 DEBUGGING: Where did the value go?")
+            print(f"   Original element1 dict: {element1}")
+            print(f"   Current _current_element: {current}")
+            print(f"   Are they the same object? {element1 is current}")
+            
+            # Check document state
+            i = element_index.get(id(element1))
+            if i is not None:
+                print(f"   Document element {i}: id={id(element1)} short_name='{sn}'")
+            
+            return False
+    else:
+        print("❌ No short_name widget found after restore")
+        return False
+
 
 def test_save_restore_cycle():
     """Test the complete save and restore cycle in detail"""
@@ -16,158 +151,39 @@ def test_save_restore_cycle():
     print("=" * 80)
     
     # Create Qt application
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
+    app = qapp()
     
     # Create ARXML app and components
     arxml_app = ARXMLEditorApp()
     tree_navigator = TreeNavigator(arxml_app)
     property_editor = PropertyEditor(arxml_app)
     
-    # Connect signals like MainWindow does
-    tree_navigator.element_selected.connect(property_editor.set_element)
+    # Connect signals like MainWindow does (same thread, so called directly)
+    tree_navigator.element_selected.connect(
+        property_editor.set_element, type=Qt.ConnectionType.DirectConnection)
     
     # Load document
     try:
         ecuc_file = "Backup/ECUC/FCA_mPAD_Safety_Can_Can_ecuc.arxml"
         print(f"Loading: {ecuc_file}")
-        arxml_app.load_document(ecuc_file)
+        load_cached(arxml_app, ecuc_file)
         tree_navigator.refresh()
         
-        if not arxml_app.current_document or not arxml_app.current_document.ecuc_elements:
+        doc = arxml_app.current_document
+        if not doc or not doc.ecuc_elements:
             print("❌ No ECUC elements found")
             return
             
-        # Get elements for testing
-        element1 = arxml_app.current_document.ecuc_elements[0]
-        element2 = {
-            'short_name': 'TestElement',
-            'type': 'ECUC-MODULE-CONFIGURATION-VALUES',
-            'containers': []
-        }
-        arxml_app.current_document.ecuc_elements.append(element2)
-        
-        print(f"Element1: id={id(element1)} short_name='{element1.get('short_name')}'")
-        print(f"Element2: id={id(element2)} short_name='{element2.get('short_name')}'")
-        
-        print("\n" + "="*60)
-        print("STEP 1: Load element1")
-        print("="*60)
-        
-        # Step 1: Load element1
-        tree_navigator.element_selected.emit(element1)
-        
-        # Verify initial state
-        if property_editor._current_element is None:
-            print("❌ Property editor didn't receive element1")
-            return
-            
-        initial_value = element1.get('short_name')
-        print(f"✓ Element1 loaded: short_name='{initial_value}'")
-        
-        # Check widget value
-        if 'short_name' in property_editor._property_widgets:
-            widget = property_editor._property_widgets['short_name']
-            widget_value = widget.text()
-            print(f"✓ Widget shows: '{widget_value}'")
-            
-            if widget_value != initial_value:
-                print(f"⚠️  Widget value mismatch! Widget: '{widget_value}' vs Element: '{initial_value}'")
-        else:
-            print("❌ No short_name widget found")
-            return
-        
-        print("\n" + "="*60)
-        print("STEP 2: Edit element1")
-        print("="*60)
-        
-        # Step 2: Edit the property
-        new_value = initial_value + "_EDITED_DEEP_TEST"
-        widget.setText(new_value)
-        print(f"✓ Widget changed to: '{new_value}'")
-        
-        # Verify immediate change took effect
-        current_element_value = property_editor._current_element.get('short_name')
-        print(f"✓ Current element shows: '{current_element_value}'")
-        
-        # Also check the original document element
-        doc_element_value = element1.get('short_name')
-        print(f"✓ Document element shows: '{doc_element_value}'")
-        
-        print("\n" + "="*60)
-        print("STEP 3: Save element1 and switch to element2")
-        print("="*60)
-        
-        # Step 3: Switch to element2 (this should trigger save)
-        print("Before switch - Element1 state:")
-        print(f"  Current element: id={id(property_editor._current_element)} short_name='{property_editor._current_element.get('short_name')}'")
-        print(f"  Document element1: id={id(element1)} short_name='{element1.get('short_name')}'")
-        print(f"  Widget value: '{widget.text()}'")
-        
-        tree_navigator.element_selected.emit(element2)
-        
-        print("After switch - Element1 state:")
-        print(f"  Document element1: id={id(element1)} short_name='{element1.get('short_name')}'")
-        
-        # Verify element2 is loaded
-        if property_editor._current_element is not element2:
-            print(f"❌ Failed to switch to element2")
-            print(f"   Expected: id={id(element2)}")
-            print(f"   Actual: id={id(property_editor._current_element) if property_editor._current_element else None}")
-            return
-        print(f"✓ Switched to element2: short_name='{property_editor._current_element.get('short_name')}'")
-        
-        print("\n" + "="*60)
-        print("STEP 4: Switch back to element1 (restore test)")
-        print("="*60)
-        
-        # Step 4: Switch back to element1 (this should restore the edited value)
-        print("Before restore - Element1 state:")
-        print(f"  Document element1: id={id(element1)} short_name='{element1.get('short_name')}'")
-        
-        tree_navigator.element_selected.emit(element1)
-        
-        print("After restore - Element1 state:")
-        print(f"  Current element: id={id(property_editor._current_element)} short_name='{property_editor._current_element.get('short_name')}'")
-        print(f"  Document element1: id={id(element1)} short_name='{element1.get('short_name')}'")
-        
-        # Check if widget shows the edited value
-        if 'short_name' in property_editor._property_widgets:
-            restored_widget = property_editor._property_widgets['short_name']
-            restored_widget_value = restored_widget.text()
-            print(f"  Restored widget value: '{restored_widget_value}'")
-            
-            # The critical test: does the widget show the edited value?
-            if new_value in restored_widget_value:
-                print("✅ SUCCESS: Edit was preserved!")
-                return True
-            else:
-                print("❌ FAILURE: Edit was lost!")
-                print(f"   Expected: '{new_value}'")
-                print(f"   Actual: '{restored_widget_value}'")
-                
-                # Debug: Check all possible places where the value might be
-                print("\n🔍 DEBUGGING: Where did the value go?")
-                print(f"   Original element1 dict: {element1}")
-                print(f"   Current _current_element: {property_editor._current_element}")
-                print(f"   Are they the same object? {element1 is property_editor._current_element}")
-                
-                # Check document state
-                for i, doc_elem in enumerate(arxml_app.current_document.ecuc_elements):
-                    if doc_elem is element1:
-                        print(f"   Document element {i}: id={id(doc_elem)} short_name='{doc_elem.get('short_name')}'")
-                
-                return False
-        else:
-            print("❌ No short_name widget found after restore")
-            return False
-            
+        return run_save_restore_cycle(arxml_app, tree_navigator, property_editor)
+
     except Exception as e:
         print(f"❌ Error during test: {e}")
         import traceback
         traceback.print_exc()
         return False
+    finally:
+        # Free the widget trees here rather than whenever the collector reaches them
+        dispose(tree_navigator, property_editor)
 
 if __name__ == "__main__":
     result = test_save_restore_cycle()
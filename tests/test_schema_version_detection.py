@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Test schema version detection from the ARXML root element
+"""
+
+import os
+import tempfile
+from src.core.services.schema_service import SchemaService
+
+
+def _write_arxml(directory, namespace, body=""):
+    path = os.path.join(directory, "detect.arxml")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<AUTOSAR xmlns="{namespace}">{body}</AUTOSAR>')
+    return path
+
+
+def test_version_comes_from_root_namespace():
+    """The root namespace decides the version, for files and for content strings"""
+    service = SchemaService()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_arxml(tmp, "http://autosar.org/schema/r4.2", "<AR-PACKAGES/>")
+        assert service.detect_schema_version_from_file(path) == "4.5.0"
+
+    content = '<AUTOSAR xmlns="http://autosar.org/schema/r4.3"><AR-PACKAGES/></AUTOSAR>'
+    assert service.detect_schema_version_from_content(content) == "4.4.0"
+
+
+def test_detection_stops_at_the_root_start_tag():
+    """Content after the root start tag is not read, so a broken body does not matter"""
+    service = SchemaService()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_arxml(tmp, "http://autosar.org/schema/r4.1", "<AR-PACKAGES><unclosed>")
+        assert service.detect_schema_version_from_file(path) == "4.6.0"
+    assert service.detect_schema_version_from_file("missing.arxml") is None
+
+
+if __name__ == "__main__":
+    test_version_comes_from_root_namespace()
+    test_detection_stops_at_the_root_start_tag()
+    print("All schema version detection tests passed")
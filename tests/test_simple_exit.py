@@ -3,16 +3,28 @@
 Simple test for exit confirmation functionality
 """
 
-import sys
-from PyQt6.QtWidgets import QApplication, QMainWindow, QPushButton, QVBoxLayout, QWidget, QLabel, QMessageBox
+from PyQt6.QtWidgets import QMainWindow, QPushButton, QVBoxLayout, QWidget, QLabel, QMessageBox
 from PyQt6.QtCore import QTimer
+from PyQt6 import sip
 from src.ui.main_window import MainWindow
+from tests._qt import qapp
 
 class SimpleTestWindow(QMainWindow):
+    # One MainWindow is built per process and handed from test window to test window
+    _shared_main_window = None
+    
     def __init__(self):
         super().__init__()
-        self.main_window = MainWindow()
+        self.main_window = self._get_main_window()
+        self.main_window.app.new_document()
         self.setup_ui()
+    
+    @classmethod
+    def _get_main_window(cls):
+        """Return the shared MainWindow, building it again if Qt has deleted it with an old parent"""
+        if cls._shared_main_window is None or sip.isdeleted(cls._shared_main_window):
+            cls._shared_main_window = MainWindow()
+        return cls._shared_main_window
         
     def setup_ui(self):
         """Setup simple test UI"""
@@ -101,9 +113,7 @@ class SimpleTestWindow(QMainWindow):
             self.status_label.setStyleSheet("color: orange;")
 
 def main():
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
+    app = qapp()
     
     window = SimpleTestWindow()
     window.show()
@@ -3,11 +3,11 @@
 Test real-time tree name updates when editing properties
 """
 
-import sys
-from PyQt6.QtWidgets import QApplication
 from src.ui.views.tree_navigator import TreeNavigator
 from src.ui.views.property_editor import PropertyEditor
 from src.core.application import ARXMLEditorApp
+from tests._qt import qapp
+from tests._doc_cache import load_cached
 
 def test_tree_name_updates():
     """Test that tree names update when properties change"""
@@ -16,9 +16,7 @@ def test_tree_name_updates():
     print("=" * 80)
     
     # Create Qt application
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
+    app = qapp()
     
     # Create ARXML app and components
     arxml_app = ARXMLEditorApp()
@@ -44,7 +42,7 @@ def test_tree_name_updates():
     try:
         ecuc_file = "Backup/ECUC/FCA_mPAD_Safety_Can_Can_ecuc.arxml"
         print(f"Loading: {ecuc_file}")
-        arxml_app.load_document(ecuc_file)
+        load_cached(arxml_app, ecuc_file)
         tree_navigator.refresh()
         
         if not arxml_app.current_document or not arxml_app.current_document.ecuc_elements:
@@ -78,6 +76,8 @@ def test_tree_name_updates():
             
             print(f"Changing name from '{original_name}' to '{new_name}'")
             widget.setText(new_name)
+            # Short names are committed when editing finishes
+            widget.editingFinished.emit()
             
             # Check if tree item was updated
             tree_text = tree_item.text(0)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Test TreeNavigator incremental updates from document add/remove/modify signals
+"""
+
+import os
+import tempfile
+from src.ui.views.tree_navigator import TreeNavigator
+from src.core.application import ARXMLEditorApp
+from src.core.models.autosar_elements import (
+    Composition, SwComponentType, SwComponentTypeCategory, PortPrototype, PortType
+)
+from src.ui.main_window import MainWindow
+from tests._qt import qapp, dispose
+
+
+def _child_names(item):
+    return [item.child(i).text(0) for i in range(item.childCount())]
+
+
+def test_added_and_removed_elements_update_tree_in_place():
+    """Adding to a shown section appends one item; the rest of the tree is kept"""
+    app = qapp()
+
+    arxml_app = ARXMLEditorApp()
+    doc = arxml_app.new_document()
+    navigator = TreeNavigator(arxml_app)
+    navigator.refresh()
+
+    first = Composition(short_name="First")
+    doc.add_composition(first)
+    root = navigator.compositions_item
+    assert root is not None
+    first_item = navigator._item_by_id[id(first)]
+
+    second = Composition(short_name="Second")
+    doc.add_composition(second)
+    assert navigator.compositions_item is root
+    assert navigator._item_by_id[id(first)] is first_item
+    assert _child_names(root) == ["First", "Second"]
+    assert root.text(1) == "2 items"
+
+    doc.remove_composition(first)
+    assert _child_names(root) == ["Second"]
+    assert root.text(1) == "1 items"
+    assert id(first) not in navigator._item_by_id
+
+    second.short_name = "Renamed"
+    doc.element_modified.emit(second)
+    assert _child_names(root) == ["Renamed"]
+
+    # Removing the last element hides the section
+    doc.remove_composition(second)
+    assert navigator.compositions_item is None
+    assert navigator.topLevelItemCount() == 0
+
+    dispose(navigator)
+
+
+def test_update_element_item_for_ecuc_dicts():
+    """ECUC items are built on expand and renamed through the id index"""
+    app = qapp()
+
+    arxml_app = ARXMLEditorApp()
+    doc = arxml_app.new_document()
+    container = {'short_name': 'Container1', 'type': 'ECUC-CONTAINER-VALUE', 'containers': [], 'parameters': []}
+    doc._ecuc_elements = [{'short_name': 'Module1', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': [container]}]
+    navigator = TreeNavigator(arxml_app)
+    navigator.refresh()
+
+    # Containers are only built once their module is expanded
+    assert id(container) not in navigator._item_by_id
+    module_item = navigator.ecuc_elements_item.child(0)
+    assert module_item.childCount() == 1
+    module_item.setExpanded(True)
+    assert navigator._item_by_id[id(container)] is module_item.child(0)
+
+    container['short_name'] = 'Renamed1'
+    assert navigator.update_element_item(container)
+    assert navigator._item_by_id[id(container)].text(0) == 'Renamed1'
+    assert not navigator.update_element_item({'short_name': 'Unknown'})
+
+    dispose(navigator)
+
+
+def test_appended_ecuc_element_gets_its_own_item():
+    """append_ecuc_element adds one item under the ECUC root and keeps the existing ones"""
+    app = qapp()
+
+    arxml_app = ARXMLEditorApp()
+    doc = arxml_app.new_document()
+    doc._ecuc_elements = [{'short_name': 'Module1', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': []}]
+    navigator = TreeNavigator(arxml_app)
+    navigator.refresh()
+    root = navigator.ecuc_elements_item
+    first_item = root.child(0)
+
+    added = {'short_name': 'Module2', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': []}
+    doc.append_ecuc_element(added)
+    assert doc.ecuc_elements[-1] is added
+    assert doc.modified
+    assert navigator.ecuc_elements_item is root
+    assert root.child(0) is first_item
+    assert _child_names(root) == ["Module1", "Module2"]
+    assert root.text(1) == "2 items"
+    assert navigator._item_by_id[id(added)] is root.child(1)
+
+    dispose(navigator)
+
+
+def test_added_element_is_selected():
+    """The add helpers select the new element's own item"""
+    app = qapp()
+
+    arxml_app = ARXMLEditorApp()
+    arxml_app.new_document()
+    navigator = TreeNavigator(arxml_app)
+    navigator.refresh()
+
+    navigator._add_composition()
+    navigator._add_port_interface()
+    current = navigator.currentItem()
+    assert current.text(0) == "NewInterface"
+    assert current.parent() is navigator.port_interfaces_item
+
+    dispose(navigator)
+
+
+def test_saving_keeps_the_tree_and_a_new_document_rebuilds_it():
+    """document_changed for the shown document (a save) reuses the items; a new document rebuilds"""
+    app = qapp()
+
+    arxml_app = ARXMLEditorApp()
+    doc = arxml_app.new_document()
+    doc._ecuc_elements = [{'short_name': 'Module1', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': []}]
+    navigator = TreeNavigator(arxml_app)
+    navigator.refresh()
+    module_item = navigator.ecuc_elements_item.child(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        assert arxml_app.save_document(os.path.join(tmp, "saved.arxml"))
+    assert navigator.ecuc_elements_item.child(0) is module_item
+
+    arxml_app.new_document()
+    assert navigator.ecuc_elements_item is None
+    assert not navigator._item_by_id
+
+    dispose(navigator)
+
+
+def test_type_change_updates_the_type_column():
+    """Changing a port's type through the main window rewrites its expanded item's Type column"""
+    app = qapp()
+    main_window = MainWindow()
+    try:
+        doc = main_window.app.new_document()
+        component = SwComponentType("Component", SwComponentTypeCategory.APPLICATION)
+        port = PortPrototype("Port", PortType.PROVIDER)
+        component.add_port(port)
+        doc.add_sw_component_type(component)
+        navigator = main_window.tree_navigator
+
+        navigator._item_by_id[id(component)].setExpanded(True)
+        port_item = navigator._item_by_id[id(port)]
+        assert port_item.text(1) == PortType.PROVIDER.value
+
+        port.port_type = PortType.REQUIRER
+        main_window._on_property_changed(port, 'port_type', PortType.REQUIRER)
+        assert navigator._item_by_id[id(port)] is port_item
+        assert port_item.text(1) == PortType.REQUIRER.value
+
+        component.category = SwComponentTypeCategory.ATOMIC
+        main_window._on_property_changed(component, 'category', SwComponentTypeCategory.ATOMIC)
+        assert navigator._item_by_id[id(component)].text(1) == SwComponentTypeCategory.ATOMIC.value
+    finally:
+        dispose(main_window)
+
+
+if __name__ == "__main__":
+    test_added_and_removed_elements_update_tree_in_place()
+    test_update_element_item_for_ecuc_dicts()
+    test_appended_ecuc_element_gets_its_own_item()
+    test_added_element_is_selected()
+    test_saving_keeps_the_tree_and_a_new_document_rebuilds_it()
+    test_type_change_updates_the_type_column()
+    print("All tree navigator incremental update tests passed")
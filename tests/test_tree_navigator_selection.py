@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Test TreeNavigator selection: the emitted element is the document object, emitted once
+"""
+
+from src.ui.views.tree_navigator import TreeNavigator
+from src.core.application import ARXMLEditorApp
+from src.core.models.autosar_elements import Composition
+from tests._qt import qapp, dispose
+
+
+def test_selection_emits_document_objects_once():
+    """Parameters emit the document dict (not a QVariant copy); reselecting does not re-emit"""
+    app = qapp()
+
+    arxml_app = ARXMLEditorApp()
+    doc = arxml_app.new_document()
+    param = {'short_name': 'Param1', 'type': 'ECUC-NUMERICAL-PARAM-VALUE', 'value': '1'}
+    container = {'short_name': 'Container1', 'type': 'ECUC-CONTAINER-VALUE', 'containers': [], 'parameters': [param]}
+    doc._ecuc_elements = [{'short_name': 'Module1', 'type': 'ECUC-MODULE-CONFIGURATION-VALUES', 'containers': [container]}]
+    composition = Composition(short_name="Composition1")
+    doc._compositions.append(composition)
+
+    navigator = TreeNavigator(arxml_app)
+    navigator.refresh()
+    emitted = []
+    navigator.element_selected.connect(emitted.append)
+
+    navigator.ecuc_elements_item.child(0).setExpanded(True)
+    navigator._item_by_id[id(container)].setExpanded(True)
+    param_item = navigator._item_by_id[id(param)]
+    navigator.setCurrentItem(param_item)
+    assert len(emitted) == 1
+    assert emitted[0] is param
+
+    # Selecting the same item again is not forwarded a second time
+    navigator.itemSelectionChanged.emit()
+    assert len(emitted) == 1
+
+    # Non-ECUC model objects are forwarded as well
+    navigator.setCurrentItem(navigator._item_by_id[id(composition)])
+    assert emitted[-1] is composition
+
+    # Category roots have no element
+    navigator.setCurrentItem(navigator.compositions_item)
+    assert len(emitted) == 2
+
+    dispose(navigator)
+
+
+if __name__ == "__main__":
+    test_selection_emits_document_objects_once()
+    print("All tree navigator selection tests passed")
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Test that domain elements notify the UI event bus once per change
+"""
+
+from src.core.events.ui_event_bus import UIEventBus
+from src.core.models.autosar_elements import (
+    SwComponentType, SwComponentTypeCategory, PortPrototype, PortType
+)
+
+
+def test_each_change_is_published_once():
+    """A single model change reaches UI listeners exactly once"""
+    bus = UIEventBus()
+    received = []
+    bus.subscribe('element_changed', received.append)
+
+    comp = SwComponentType("Component1", SwComponentTypeCategory.APPLICATION)
+    comp.set_ui_event_bus(bus)
+    comp.add_port(PortPrototype("Port1", PortType.PROVIDER))
+    assert received == [comp]
+
+    comp.change_name("Component2")
+    assert received == [comp, comp]
+
+
+def test_failing_listener_does_not_break_the_change():
+    """Listener errors are contained by the bus and the change still applies"""
+    bus = UIEventBus()
+
+    def failing_listener(payload):
+        raise RuntimeError("listener failed")
+
+    bus.subscribe('element_changed', failing_listener)
+    comp = SwComponentType("Component1", SwComponentTypeCategory.APPLICATION)
+    comp.set_ui_event_bus(bus)
+    comp.add_port(PortPrototype("Port1", PortType.PROVIDER))
+    assert len(comp.ports) == 1
+
+
+if __name__ == "__main__":
+    test_each_change_is_published_once()
+    test_failing_listener_does_not_break_the_change()
+    print("All UI event notification tests passed")
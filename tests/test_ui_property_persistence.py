@@ -5,19 +5,23 @@ Test script to verify UI property persistence in ARXML editor
 
 import sys
 import os
+import tempfile
+import logging
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.core.application import ARXMLEditorApp
 from src.ui.views.property_editor import PropertyEditor
 from src.ui.views.tree_navigator import TreeNavigator
-from PyQt6.QtWidgets import QApplication
+from tests._qt import qapp
+from tests._doc_cache import load_cached
+
+log = logging.getLogger(__name__)
 
 def test_ui_property_persistence():
     """Test that property changes persist in the UI"""
-    print("Testing UI property persistence...")
+    log.debug("Testing UI property persistence...")
     
-    # Create QApplication
-    app = QApplication(sys.argv)
+    app = qapp()
     
     # Create application
     arxml_app = ARXMLEditorApp()
@@ -25,81 +29,87 @@ def test_ui_property_persistence():
     # Load a test document
     test_file = "Backup/ECUC/FCA_mPAD_Safety_Can_Can_ecuc.arxml"
     if not os.path.exists(test_file):
-        print(f"Test file not found: {test_file}")
+        log.warning("Test file not found: %s", test_file)
         return False
     
-    print(f"Loading document: {test_file}")
-    success = arxml_app.load_document(test_file)
+    log.debug("Loading document: %s", test_file)
+    success = load_cached(arxml_app, test_file)
     if not success:
-        print("Failed to load document")
+        log.error("Failed to load document")
         return False
     
-    print("Document loaded successfully")
+    log.debug("Document loaded successfully")
     
     # Get the first ECUC element
     if not arxml_app.current_document.ecuc_elements:
-        print("No ECUC elements found")
+        log.error("No ECUC elements found")
         return False
     
     original_element = arxml_app.current_document.ecuc_elements[0]
-    print(f"Original element: {original_element.get('short_name')} (id={id(original_element)})")
+    log.debug("Original element: %s (id=%s)", original_element.get('short_name'), id(original_element))
     
     # Create property editor
     property_editor = PropertyEditor(arxml_app)
     
     # Set the element in the property editor
     property_editor.set_element(original_element)
-    print(f"Property editor original element: {property_editor._original_element.get('short_name')} (id={id(property_editor._original_element)})")
+    log.debug("Property editor original element: %s (id=%s)", property_editor._original_element.get('short_name'), id(property_editor._original_element))
     
     # Verify that the original element reference is correct
     if property_editor._original_element is not original_element:
-        print("ERROR: Property editor original element reference is incorrect")
+        log.error("ERROR: Property editor original element reference is incorrect")
         return False
     
     # Modify the element through the property editor
+    before = arxml_app.current_document.snapshot()
     new_name = original_element.get('short_name', '') + "_UI_MODIFIED"
     property_editor._on_ecuc_property_changed(original_element, "short_name", new_name)
     
     # Verify the change is in the original element
     if original_element.get('short_name') != new_name:
-        print(f"ERROR: Original element was not modified correctly. Expected '{new_name}', got '{original_element.get('short_name')}'")
-        return False
-    
-    print(f"Original element modified successfully: '{original_element.get('short_name')}'")
-    
-    # Save the document
-    print("Saving document...")
-    success = arxml_app.save_document("test_ui_output.arxml")
-    if not success:
-        print("Failed to save document")
+        log.error("ERROR: Original element was not modified correctly. Expected '%s', got '%s'", new_name, original_element.get('short_name'))
         return False
     
-    print("Document saved successfully")
+    log.debug("Original element modified successfully: '%s'", original_element.get('short_name'))
     
-    # Load the saved document and verify the change persisted
-    print("Loading saved document to verify changes...")
-    arxml_app2 = ARXMLEditorApp()
-    success = arxml_app2.load_document("test_ui_output.arxml")
-    if not success:
-        print("Failed to load saved document")
-        return False
-    
-    # Check if the change persisted
-    if not arxml_app2.current_document.ecuc_elements:
-        print("No ECUC elements found in saved document")
+    # Compare against the in-memory snapshot: only the edited name may differ
+    after = arxml_app.current_document.snapshot()
+    after[0]['short_name'] = before[0]['short_name']
+    if after != before:
+        log.error("ERROR: The edit changed more than the element's short_name")
         return False
     
-    saved_element = arxml_app2.current_document.ecuc_elements[0]
-    saved_name = saved_element.get('short_name', '')
-    print(f"Saved element short_name: '{saved_name}'")
-    
-    if saved_name == new_name:
-        print("SUCCESS: UI property changes persisted correctly!")
-        return True
-    else:
-        print(f"ERROR: UI property changes did not persist. Expected '{new_name}', got '{saved_name}'")
-        return False
+    # Save into a private directory so parallel runs never share the output file
+    with tempfile.TemporaryDirectory() as tmp:
+        output_file = os.path.join(tmp, "test_ui_output.arxml")
+        # Save the document
+        log.debug("Saving document...")
+        success = arxml_app.save_document(output_file)
+        if not success:
+            log.error("Failed to save document")
+            return False
+        
+        log.debug("Document saved successfully")
+        
+        # Read back only the first ECUC module name rather than loading the saved document
+        log.debug("Reading saved document to verify changes...")
+        arxml_app2 = ARXMLEditorApp()
+        saved_name = arxml_app2.read_short_name(output_file)
+        if saved_name is None:
+            log.error("No ECUC elements found in saved document")
+            return False
+        
+        log.debug("Saved element short_name: '%s'", saved_name)
+        
+        if saved_name == new_name:
+            log.debug("SUCCESS: UI property changes persisted correctly!")
+            return True
+        else:
+            log.error("ERROR: UI property changes did not persist. Expected '%s', got '%s'", new_name, saved_name)
+            return False
 
 if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s")
+    log.setLevel(logging.DEBUG)
     success = test_ui_property_persistence()
     sys.exit(0 if success else 1)
\ No newline at end of file